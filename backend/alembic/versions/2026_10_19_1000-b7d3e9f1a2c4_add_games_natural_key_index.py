@@ -0,0 +1,38 @@
+"""composite natural-key index on games
+
+Revision ID: b7d3e9f1a2c4
+Revises: a9f2c7e4b8d1
+Create Date: 2026-10-19 10:00:00.000000
+
+Reconciling two sources for the same game (NBA bulk CSV vs. ESPN sync, a
+user's attendance file vs. the schedule) looks a game up by league, both
+teams and a start-date window. The single-column indexes leave SQLite picking
+one of them and scanning every game that team has ever played; this index
+answers the lookup with one range probe. See services/natural_key.py.
+"""
+from alembic import op
+
+from sports_passport.db.migration_guards import has_index
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d3e9f1a2c4'
+down_revision = 'a9f2c7e4b8d1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Guarded: the model declares this index too, so create_all() will have
+    # built it on any database the app booted before this migration ran.
+    if has_index('games', 'ix_games_natural_key'):
+        return
+    op.create_index(
+        'ix_games_natural_key',
+        'games',
+        ['league_id', 'home_team_id', 'away_team_id', 'start_date'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_games_natural_key', table_name='games')
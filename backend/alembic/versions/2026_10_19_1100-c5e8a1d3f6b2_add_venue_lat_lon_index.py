@@ -0,0 +1,32 @@
+"""composite (latitude, longitude) index on venues
+
+Revision ID: c5e8a1d3f6b2
+Revises: b7d3e9f1a2c4
+Create Date: 2026-10-19 11:00:00.000000
+
+Backs the viewport queries behind /api/venues/clusters: a bounding box is a
+latitude range scanned in index order with longitude checked from the same
+index entry, so the map never reads a venue row it is not going to draw.
+"""
+from alembic import op
+
+from sports_passport.db.migration_guards import has_index
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5e8a1d3f6b2'
+down_revision = 'b7d3e9f1a2c4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Guarded: the model declares this index too, so create_all() will have
+    # built it on any database the app booted before this migration ran.
+    if has_index('venues', 'ix_venues_lat_lon'):
+        return
+    op.create_index('ix_venues_lat_lon', 'venues', ['latitude', 'longitude'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_venues_lat_lon', table_name='venues')
@@ -0,0 +1,52 @@
+"""add user_atlas_counts
+
+Revision ID: d4a7b2e9c1f5
+Revises: c5e8a1d3f6b2
+Create Date: 2026-10-19 12:00:00.000000
+
+Per-user (venue, league) attended-game counts behind /api/attendance/atlas.
+The table is filled from the existing attendance log here; from then on the
+attendance endpoints keep it current.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from sports_passport.db.migration_guards import has_table
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4a7b2e9c1f5'
+down_revision = 'c5e8a1d3f6b2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if not has_table('user_atlas_counts'):
+        op.create_table(
+            'user_atlas_counts',
+            sa.Column('user_id', sa.Integer(), nullable=False),
+            sa.Column('venue_id', sa.Integer(), nullable=False),
+            sa.Column('league_id', sa.Integer(), nullable=False),
+            sa.Column('count', sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(['league_id'], ['leagues.id']),
+            sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+            sa.ForeignKeyConstraint(['venue_id'], ['venues.id']),
+            sa.PrimaryKeyConstraint('user_id', 'venue_id', 'league_id'),
+        )
+
+    # Backfill whenever the table is empty, not only when this migration
+    # created it: a table some other path created empty would otherwise show
+    # every user a blank atlas until their next attendance write.
+    op.execute(
+        "INSERT INTO user_atlas_counts (user_id, venue_id, league_id, count) "
+        "SELECT a.user_id, g.venue_id, g.league_id, COUNT(*) "
+        "FROM user_game_attendance a JOIN games g ON g.id = a.game_id "
+        "WHERE g.venue_id IS NOT NULL "
+        "AND NOT EXISTS (SELECT 1 FROM user_atlas_counts) "
+        "GROUP BY a.user_id, g.venue_id, g.league_id"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('user_atlas_counts')
@@ -0,0 +1,45 @@
+"""add perf_samples
+
+Revision ID: e6b3f8a2d9c4
+Revises: d4a7b2e9c1f5
+Create Date: 2026-10-19 13:00:00.000000
+
+Fixed-size ring buffer of route, upstream and sync timings behind
+/api/admin/perf.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from sports_passport.db.migration_guards import has_table
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6b3f8a2d9c4'
+down_revision = 'd4a7b2e9c1f5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if has_table('perf_samples'):
+        return
+    op.create_table(
+        'perf_samples',
+        sa.Column('slot', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('seq', sa.Integer(), nullable=False),
+        sa.Column('recorded_at', sa.DateTime(), nullable=False),
+        sa.Column('kind', sa.String(), nullable=False),
+        sa.Column('key', sa.String(), nullable=False),
+        sa.Column('duration_ms', sa.Float(), nullable=False),
+        sa.Column('status', sa.String(), nullable=True),
+        sa.Column('rows', sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint('slot'),
+    )
+    op.create_index(
+        'ix_perf_samples_kind_recorded_at', 'perf_samples', ['kind', 'recorded_at']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_perf_samples_kind_recorded_at', table_name='perf_samples')
+    op.drop_table('perf_samples')
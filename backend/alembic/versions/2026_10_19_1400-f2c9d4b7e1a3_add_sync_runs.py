@@ -0,0 +1,57 @@
+"""add sync_runs
+
+Revision ID: f2c9d4b7e1a3
+Revises: e6b3f8a2d9c4
+Create Date: 2026-10-19 14:00:00.000000
+
+History of every import run with its per-phase timing breakdown.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from sports_passport.db.migration_guards import has_table
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2c9d4b7e1a3'
+down_revision = 'e6b3f8a2d9c4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if has_table('sync_runs'):
+        return
+    op.create_table(
+        'sync_runs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('league_id', sa.Integer(), nullable=False),
+        sa.Column('kind', sa.String(), nullable=False),
+        sa.Column('started_at', sa.DateTime(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('error', sa.String(), nullable=True),
+        sa.Column('duration_ms', sa.Integer(), nullable=False),
+        sa.Column('fetch_ms', sa.Integer(), nullable=False),
+        sa.Column('parse_ms', sa.Integer(), nullable=False),
+        sa.Column('resolve_ms', sa.Integer(), nullable=False),
+        sa.Column('write_ms', sa.Integer(), nullable=False),
+        sa.Column('commit_ms', sa.Integer(), nullable=False),
+        sa.Column('requests', sa.Integer(), nullable=False),
+        sa.Column('bytes_downloaded', sa.Integer(), nullable=False),
+        sa.Column('statements', sa.Integer(), nullable=False),
+        sa.Column('rows_inserted', sa.Integer(), nullable=False),
+        sa.Column('rows_updated', sa.Integer(), nullable=False),
+        sa.Column('rows_unchanged', sa.Integer(), nullable=False),
+        sa.Column('games_imported', sa.Integer(), nullable=False),
+        sa.Column('games_updated', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['league_id'], ['leagues.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_sync_runs_league_id_started_at', 'sync_runs', ['league_id', 'started_at']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_sync_runs_league_id_started_at', table_name='sync_runs')
+    op.drop_table('sync_runs')
@@ -0,0 +1,56 @@
+"""add league_stats
+
+Revision ID: a8e5c2f7d3b9
+Revises: f2c9d4b7e1a3
+Create Date: 2026-10-19 15:00:00.000000
+
+Per-league catalog counts behind /api/admin/status. Filled from the existing
+catalog here; from then on the import path keeps them current.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from sports_passport.db.migration_guards import has_table
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8e5c2f7d3b9'
+down_revision = 'f2c9d4b7e1a3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if not has_table('league_stats'):
+        op.create_table(
+            'league_stats',
+            sa.Column('league_id', sa.Integer(), nullable=False),
+            sa.Column('games', sa.Integer(), nullable=False),
+            sa.Column('teams', sa.Integer(), nullable=False),
+            sa.Column('venues', sa.Integer(), nullable=False),
+            sa.Column('first_season', sa.Integer(), nullable=True),
+            sa.Column('last_season', sa.Integer(), nullable=True),
+            sa.Column('last_game_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['league_id'], ['leagues.id']),
+            sa.PrimaryKeyConstraint('league_id'),
+        )
+
+    # Same reasoning as the user_atlas_counts backfill: fill whenever empty.
+    op.execute(
+        "INSERT INTO league_stats "
+        "(league_id, games, teams, venues, first_season, last_season, last_game_at) "
+        "SELECT l.id, COALESCE(g.games, 0), COALESCE(t.teams, 0), COALESCE(g.venues, 0), "
+        "g.first_season, g.last_season, g.last_game_at "
+        "FROM leagues l "
+        "LEFT JOIN (SELECT league_id, COUNT(*) AS games, COUNT(DISTINCT venue_id) AS venues, "
+        "MIN(season) AS first_season, MAX(season) AS last_season, "
+        "MAX(start_date) AS last_game_at FROM games GROUP BY league_id) g "
+        "ON g.league_id = l.id "
+        "LEFT JOIN (SELECT league_id, COUNT(*) AS teams FROM teams GROUP BY league_id) t "
+        "ON t.league_id = l.id "
+        "WHERE NOT EXISTS (SELECT 1 FROM league_stats)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('league_stats')
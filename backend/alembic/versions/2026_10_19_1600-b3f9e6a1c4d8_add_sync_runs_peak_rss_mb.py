@@ -0,0 +1,28 @@
+"""add sync_runs.peak_rss_mb
+
+Revision ID: b3f9e6a1c4d8
+Revises: a8e5c2f7d3b9
+Create Date: 2026-10-19 16:00:00.000000
+
+Peak process memory per import run; NULL for runs recorded before it.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from sports_passport.db.migration_guards import has_column
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3f9e6a1c4d8'
+down_revision = 'a8e5c2f7d3b9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if not has_column('sync_runs', 'peak_rss_mb'):
+        op.add_column('sync_runs', sa.Column('peak_rss_mb', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('sync_runs', 'peak_rss_mb')
@@ -0,0 +1,62 @@
+"""add games.local_game_date
+
+Revision ID: c7a2e5f9b1d4
+Revises: b3f9e6a1c4d8
+Create Date: 2026-10-19 17:00:00.000000
+
+The calendar day each game was played, stored so the stats page and the
+natural-key lookups read it instead of converting every row from UTC. The
+app keeps it in step from here on (models/game); this fills the
+rows already imported.
+
+Filled in Python, in batches: the day is the US Eastern date of the stored
+UTC instant, and SQLite has no timezone rules to compute that with.
+Nullable because SQLite cannot add a NOT NULL column to a populated table.
+"""
+from datetime import UTC, datetime
+from zoneinfo import ZoneInfo
+
+from alembic import op
+import sqlalchemy as sa
+
+from sports_passport.db.migration_guards import has_column, has_index
+
+# Literal rather than an import of local_time, for the reasons given in
+# a9f2c7e4b8d1: a migration records what was done, and must not pull in the
+# adapters package to do it.
+EASTERN = ZoneInfo("America/New_York")
+BATCH_SIZE = 10_000
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7a2e5f9b1d4'
+down_revision = 'b3f9e6a1c4d8'
+branch_labels = None
+depends_on = None
+
+
+def _local_day(stored: str) -> str:
+    instant = datetime.fromisoformat(stored).replace(tzinfo=UTC)
+    return instant.astimezone(EASTERN).date().isoformat()
+
+
+def upgrade() -> None:
+    if not has_column('games', 'local_game_date'):
+        op.add_column('games', sa.Column('local_game_date', sa.Date(), nullable=True))
+    if not has_index('games', 'ix_games_local_game_date'):
+        op.create_index('ix_games_local_game_date', 'games', ['local_game_date'])
+
+    conn = op.get_bind()
+    rows = conn.execute(sa.text(
+        "SELECT id, start_date FROM games WHERE local_game_date IS NULL"
+    )).all()
+    for i in range(0, len(rows), BATCH_SIZE):
+        conn.execute(
+            sa.text("UPDATE games SET local_game_date = :day WHERE id = :id"),
+            [{"id": game_id, "day": _local_day(start)} for game_id, start in rows[i:i + BATCH_SIZE]],
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_games_local_game_date', table_name='games')
+    op.drop_column('games', 'local_game_date')
@@ -0,0 +1,34 @@
+"""composite (league_id, season, local_game_date) index on games
+
+Revision ID: d4b8f1c6e2a7
+Revises: c7a2e5f9b1d4
+Create Date: 2026-10-19 18:00:00.000000
+
+Backs the calendar heatmap behind /api/games/calendar: a league-season's
+per-day game counts are one range of this index, read in day order, with
+nothing to fetch from the games table.
+"""
+from alembic import op
+
+from sports_passport.db.migration_guards import has_index
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4b8f1c6e2a7'
+down_revision = 'c7a2e5f9b1d4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Guarded: the model declares this index too, so create_all() will have
+    # built it on any database the app booted before this migration ran.
+    if has_index('games', 'ix_games_league_season_day'):
+        return
+    op.create_index(
+        'ix_games_league_season_day', 'games', ['league_id', 'season', 'local_game_date']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_games_league_season_day', table_name='games')
@@ -29,6 +29,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from sports_passport.db.database import SessionLocal  # noqa: E402
 from sports_passport.models import Game, League, Team, Venue  # noqa: E402
+from sports_passport.services import atlas  # noqa: E402, F401  (recounts the atlas as venues fill in)
 from sports_passport.services.adapters import venue_seed  # noqa: E402
 from sports_passport.services.importer import upsert_venue  # noqa: E402
 
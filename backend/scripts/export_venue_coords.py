@@ -35,7 +35,8 @@ def main():
     parser.add_argument("--dry-run", action="store_true", help="report without writing")
     args = parser.parse_args()
 
-    centroids = city_centroids(load_cache())
+    with load_cache() as cache:
+        centroids = city_centroids(cache)
 
     with SessionLocal() as db:
         rows = []
@@ -28,8 +28,6 @@ Usage (from backend/):
 """
 
 import argparse
-import json
-import math
 import re
 import sys
 import time
@@ -41,10 +39,14 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from sports_passport.db.database import SessionLocal  # noqa: E402
 from sports_passport.models import Game, UserGameAttendance, Venue  # noqa: E402
+from sports_passport.services.geo import haversine_km  # noqa: E402
+from sports_passport.services.geocode_cache import GeocodeCache  # noqa: E402
 
 NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
 HEADERS = {"User-Agent": "SportsPassport/0.2 (personal game-attendance tracker; venue geocoding)"}
-CACHE_PATH = Path(__file__).resolve().parent.parent / "data" / "geocode_cache.json"
+CACHE_PATH = Path(__file__).resolve().parent.parent / "data" / "geocode_cache.jsonl"
+# The pre-log cache: one JSON object, imported into CACHE_PATH on first open.
+LEGACY_CACHE_PATH = CACHE_PATH.with_suffix(".json")
 THROTTLE_SECONDS = 1.1  # Nominatim usage policy: max 1 request/second
 COMMIT_EVERY = 25  # flush progress during a long --all run
 
@@ -76,30 +78,15 @@ NAME_ALIASES = {
 # venues table depending on source; Nominatim handles either in a q= search.
 
 
-def load_cache() -> dict:
-    if CACHE_PATH.exists():
-        return json.loads(CACHE_PATH.read_text(encoding="utf-8"))
-    return {}
+def load_cache() -> GeocodeCache:
+    return GeocodeCache(CACHE_PATH, legacy_path=LEGACY_CACHE_PATH)
 
 
-def save_cache(cache: dict) -> None:
-    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    CACHE_PATH.write_text(json.dumps(cache, indent=1, sort_keys=True), encoding="utf-8")
-
-
-def haversine_km(a: tuple, b: tuple) -> float:
-    lat1, lon1, lat2, lon2 = map(math.radians, (a[0], a[1], b[0], b[1]))
-    h = (
-        math.sin((lat2 - lat1) / 2) ** 2
-        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
-    )
-    return 2 * 6371.0 * math.asin(math.sqrt(h))
-
-
-def lookup(client: httpx.Client, cache: dict, key: str, query: str) -> tuple | None:
+def lookup(client: httpx.Client, cache: GeocodeCache, key: str, query: str) -> tuple | None:
     """One cached, throttled Nominatim search. A cached null is a real answer."""
     if key in cache:
-        return tuple(cache[key]) if cache[key] else None
+        cached = cache[key]
+        return tuple(cached) if cached else None
 
     resp = client.get(
         NOMINATIM_URL,
@@ -110,20 +97,19 @@ def lookup(client: httpx.Client, cache: dict, key: str, query: str) -> tuple | N
     resp.raise_for_status()
     hits = resp.json()
     coords = (float(hits[0]["lat"]), float(hits[0]["lon"])) if hits else None
-    cache[key] = list(coords) if coords else None
-    save_cache(cache)
+    cache[key] = list(coords) if coords else None  # one appended line
     time.sleep(THROTTLE_SECONDS)
     return coords
 
 
-def geocode_city(client: httpx.Client, cache: dict, city: str, state: str, country: str):
+def geocode_city(client: httpx.Client, cache: GeocodeCache, city: str, state: str, country: str):
     return lookup(
         client, cache, f"{city}|{state}|{country}".lower(), f"{city}, {state}, {country}"
     )
 
 
 def geocode_venue(
-    client: httpx.Client, cache: dict, name: str, city: str, state: str, country: str
+    client: httpx.Client, cache: GeocodeCache, name: str, city: str, state: str, country: str
 ) -> tuple:
     """Best coordinates for one venue, plus how they were found.
 
@@ -169,7 +155,7 @@ def geocode_venue(
     return centroid, "city" if centroid else "unresolved"
 
 
-def city_centroids(cache: dict) -> set:
+def city_centroids(cache: GeocodeCache) -> set:
     """Rounded coordinates of every city we have ever geocoded."""
     return {
         (round(v[0], 5), round(v[1], 5))
@@ -186,10 +172,8 @@ def main():
     parser.add_argument("--dry-run", action="store_true", help="report what would be geocoded")
     args = parser.parse_args()
 
-    cache = load_cache()
-    centroids = city_centroids(cache)
-
-    with SessionLocal() as db:
+    with load_cache() as cache, SessionLocal() as db:
+        centroids = city_centroids(cache)
         query = db.query(Venue).filter(Venue.city.isnot(None))
         if not args.all:
             attended_venue_ids = (
@@ -0,0 +1,76 @@
+"""Report what importing the app costs, module by module.
+
+Container restarts and test collection both start by importing
+`sports_passport.main`, so every heavy module it pulls in eagerly is paid on
+each. This runs that import in a fresh interpreter under `python -X
+importtime` and summarises the trace: total wall time, the slowest
+third-party packages, and the slowest of our own modules — cumulative time,
+i.e. including everything the module imported first.
+
+Timings are per process and noisy; compare medians across a few runs
+(`--runs`). A module's cumulative time includes shared dependencies it
+happened to import first, so read the report as "what would loading this
+lazily save", not as an exact budget.
+
+Usage (from backend/):
+    uv run python scripts/import_time_report.py
+    uv run python scripts/import_time_report.py --module sports_passport.routers.admin --top 25
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def _trace(module: str) -> dict[str, tuple[int, int]]:
+    """(self µs, cumulative µs) per module imported by `import module`."""
+    env = {**os.environ, "SECRET_KEY": os.environ.get("SECRET_KEY", "import-time-report")}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    timings = {}
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, _, name = match.groups()
+            timings[name] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarise -X importtime for the app")
+    parser.add_argument("--module", default="sports_passport.main")
+    parser.add_argument("--runs", type=int, default=3, help="median over this many imports")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    cumulative: dict[str, list[int]] = defaultdict(list)
+    for _ in range(args.runs):
+        for name, (_, total) in _trace(args.module).items():
+            cumulative[name].append(total)
+    median = {name: statistics.median(times) / 1000 for name, times in cumulative.items()}
+
+    print(f"import {args.module}: {median[args.module]:.0f} ms (median of {args.runs})")
+    ours = [name for name in median if name.startswith("sports_passport.")]
+    # Third-party cost is reported per top-level package.
+    packages = {
+        name: ms for name, ms in median.items()
+        if "." not in name and not name.startswith("_") and name != "sports_passport"
+    }
+    for title, names in (
+        ("Third-party packages", packages),
+        ("sports_passport modules", ours),
+    ):
+        print(f"\n{title} (cumulative ms):")
+        for name in sorted(names, key=lambda n: -median[n])[:args.top]:
+            print(f"  {median[name]:8.1f}  {name}")
+
+
+if __name__ == "__main__":
+    main()
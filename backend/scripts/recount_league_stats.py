@@ -0,0 +1,58 @@
+"""Recount the per-league catalog counts behind /api/admin/status.
+
+The import path keeps `league_stats` current (services/league_stats.py); run
+this after writing games or teams some other way — raw SQL, a restored
+backup — or whenever the status table looks off. Prints each league's row
+before and after, so a drift is visible.
+
+Safe to re-run: it replaces rows with what the catalog says.
+
+Usage (from backend/, or in the container as `python scripts/...`):
+    uv run python scripts/recount_league_stats.py
+    uv run python scripts/recount_league_stats.py --league NHL
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sports_passport.db.database import SessionLocal  # noqa: E402
+from sports_passport.models import League, LeagueStats  # noqa: E402
+from sports_passport.services import league_stats  # noqa: E402
+
+
+def _describe(stats: LeagueStats | None) -> str:
+    if stats is None:
+        return "(no row)"
+    return (
+        f"{stats.games} games, {stats.teams} teams, {stats.venues} venues, "
+        f"seasons {stats.first_season}-{stats.last_season}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recount per-league catalog counts")
+    parser.add_argument("--league", help="single league code")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        query = db.query(League).order_by(League.code)
+        if args.league:
+            query = query.filter(League.code == args.league.upper())
+        leagues = query.all()
+        if not leagues:
+            sys.exit(f"Unknown league: {args.league}")
+
+        before = {league.id: _describe(db.get(LeagueStats, league.id)) for league in leagues}
+        league_stats.recount(db, [league.id for league in leagues])
+        db.commit()
+        db.expire_all()
+        for league in leagues:
+            after = _describe(db.get(LeagueStats, league.id))
+            note = "" if after == before[league.id] else f"  (was {before[league.id]})"
+            print(f"{league.code}: {after}{note}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Re-run a league import from the payload archive instead of the network.
+
+With PAYLOAD_ARCHIVE_ENABLED (the default), every upstream response adapters
+receive is kept under data/archive (services/adapters/payload_archive.py).
+After fixing a parser, run the affected import again through this script:
+each request is answered from disk with the response archived for it, so a
+multi-decade backfill replays in minutes, without the APIs' rate limits and
+without any of them seeing a request. Upserts are idempotent, so replaying
+over existing rows corrects them in place.
+
+`--as-of` replays what had been fetched by then (UTC), not the latest copy.
+A request that was never archived fails as a fetch error; a replayed sync
+asks for the same dates it would today, so prefer --historical for old data.
+
+Usage (from backend/, or in the container as `python scripts/...`):
+    uv run python scripts/replay_import.py NHL --teams
+    uv run python scripts/replay_import.py NHL --historical 1993 2005
+    uv run python scripts/replay_import.py CFB --since 2025-09-01 --as-of 2025-12-01T00:00
+"""
+import argparse
+import asyncio
+import sys
+from datetime import date, datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sports_passport.db.database import SessionLocal  # noqa: E402
+from sports_passport.services.adapters import ADAPTERS, get_adapter  # noqa: E402
+from sports_passport.services.adapters.base import ImportResult  # noqa: E402
+
+
+async def _replay(args) -> ImportResult:
+    with SessionLocal() as db:
+        adapter = get_adapter(args.league, db)
+        adapter.replay_from_archive(args.as_of)
+        try:
+            if args.teams:
+                return await adapter.import_teams()
+            if args.historical:
+                return await adapter.import_historical(*args.historical)
+            return await adapter.sync_recent(since=args.since)
+        finally:
+            await adapter.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-import a league from archived payloads")
+    parser.add_argument("league", type=str.upper, choices=sorted(ADAPTERS))
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--teams", action="store_true", help="replay the team import")
+    mode.add_argument("--historical", nargs=2, type=int, metavar=("START", "END"),
+                      help="replay the historical import for these seasons")
+    mode.add_argument("--since", type=date.fromisoformat, help="replay a sync from this date")
+    parser.add_argument("--as-of", type=datetime.fromisoformat,
+                        help="use responses fetched by this UTC time, not the latest")
+    args = parser.parse_args()
+
+    result = asyncio.run(_replay(args))
+    print(
+        f"{args.league}: {result.teams_imported} teams, {result.venues_imported} venues, "
+        f"{result.games_imported} games imported, {result.games_updated} updated"
+    )
+    for error in result.errors[:20]:
+        print(f"  error: {error}")
+    if len(result.errors) > 20:
+        print(f"  ... and {len(result.errors) - 20} more")
+
+
+if __name__ == "__main__":
+    main()
@@ -33,14 +33,29 @@ class Settings(BaseSettings):
     # the originally-planned scoreboardv2 sync could never run anywhere.
     # SP3_data_sources.md already lists ESPN as NBA's backup update source.
     espn_api_url: str = "https://site.api.espn.com/apis/site/v2/sports"
+    # Finished ESPN scoreboard days are cached under data_dir/cache/espn, so
+    # re-syncing a window only refetches days that can still change.
+    espn_cache_enabled: bool = True
 
     # Directory holding bulk historical files (Retrosheet, Kaggle CSVs)
     data_dir: str = "data"
+    # Every upstream response is archived under data_dir/archive, so imports
+    # can be re-run from disk (scripts/replay_import.py).
+    payload_archive_enabled: bool = True
+    # Abort an import once the process's RSS passes this many MB; 0 = no limit.
+    # Checked at the importer's checkpoints (services/importer.py).
+    import_memory_limit_mb: int = 0
 
     # Application
     app_name: str = "SportsPassport2"
     debug: bool = False
 
+    # SQL profiling (see core/query_profiler). Off by default: it adds a
+    # middleware and per-statement bookkeeping. SLOW_QUERY_MS applies only
+    # while profiling is on.
+    query_profiling_enabled: bool = False
+    slow_query_ms: int = 200
+
     # CORS. The SPA is served by this same app, so no cross-origin access is
     # needed in production; the default covers the Vite dev server only. Set
     # CORS_ORIGINS to a comma-separated list to allow other origins.
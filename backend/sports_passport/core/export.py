@@ -0,0 +1,184 @@
+"""Streaming export of a user's attendance history as CSV, JSON Lines or iCalendar.
+
+A power user's history is thousands of games, and `GET /api/attendance/`
+builds all of it — rows, nested dicts, then one JSON document — before the
+first byte goes out. An export streams instead: one flat SELECT read through
+`yield_per`, each batch of EXPORT_BATCH_SIZE rows rendered and handed to the
+`StreamingResponse` as one chunk, so memory stays flat however long the
+history is. (pysqlite has no server-side cursors as such; it steps the
+statement as rows are fetched, which comes to the same thing.)
+
+Every format carries the same fields, EXPORT_FIELDS. Among them are the
+columns the attendance import reads — league, date, home, away, notes — so a
+CSV or JSON Lines export uploads back through `POST /api/attendance/import`
+as is; a game stored without its local date exports its start's local day,
+the same one the import derives. The iCalendar feed has one event per game: timed games at their UTC
+kickoff, date-only games as all-day events on the local date.
+"""
+import csv
+import io
+import json
+from collections.abc import Callable, Iterator, Sequence
+from datetime import UTC, date, datetime
+from typing import Any
+
+from sqlalchemy import Row, select
+from sqlalchemy.orm import Session
+
+from sports_passport.core.projection import AwayTeam, HomeTeam
+from sports_passport.core.serializers import naive_utc_isoformat
+from sports_passport.models.attendance import UserGameAttendance
+from sports_passport.models.game import Game
+from sports_passport.models.league import League
+from sports_passport.models.venue import Venue
+from sports_passport.services.adapters.local_time import local_game_date
+
+EXPORT_BATCH_SIZE = 500
+
+EXPORT_FIELDS: tuple[str, ...] = (
+    "league", "date", "home", "away", "notes",
+    "game_id", "start", "has_time", "season", "season_type", "week",
+    "home_score", "away_score",
+    "venue", "city", "state", "country", "latitude", "longitude",
+    "attended_at",
+)
+
+
+def _rows(db: Session, user_id: int) -> Iterator[Sequence[Row]]:
+    """The user's attended games, oldest first, in batches off one cursor."""
+    stmt = (
+        select(
+            League.code.label("league"),
+            Game.local_game_date.label("date"),
+            HomeTeam.name.label("home"),
+            AwayTeam.name.label("away"),
+            UserGameAttendance.notes,
+            Game.id.label("game_id"),
+            Game.start_date.label("start"),
+            Game.has_time,
+            Game.season,
+            Game.season_type,
+            Game.week,
+            Game.home_score,
+            Game.away_score,
+            Venue.name.label("venue"),
+            Venue.city,
+            Venue.state,
+            Venue.country,
+            Venue.latitude,
+            Venue.longitude,
+            UserGameAttendance.created_at.label("attended_at"),
+        )
+        .join(Game, Game.id == UserGameAttendance.game_id)
+        .join(League, League.id == Game.league_id)
+        .join(HomeTeam, HomeTeam.id == Game.home_team_id)
+        .join(AwayTeam, AwayTeam.id == Game.away_team_id)
+        .outerjoin(Venue, Venue.id == Game.venue_id)
+        .where(UserGameAttendance.user_id == user_id)
+        .order_by(Game.start_date, Game.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    yield from db.execute(stmt).partitions()
+
+
+def _day(row: Row) -> date:
+    """The game's stored local day, or its start's for a row written without one."""
+    return row.date or local_game_date(row.start)
+
+
+def _record(row: Row) -> dict[str, Any]:
+    record = row._asdict()
+    record["date"] = _day(row).isoformat()
+    record["start"] = naive_utc_isoformat(record["start"])
+    record["attended_at"] = naive_utc_isoformat(record["attended_at"])
+    return record
+
+
+def _csv(batches: Iterator[Sequence[Row]]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+    writer.writeheader()
+    for batch in batches:
+        writer.writerows(_record(row) for row in batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()  # the header alone, for an empty history
+
+
+def _jsonl(batches: Iterator[Sequence[Row]]) -> Iterator[str]:
+    for batch in batches:
+        yield "".join(json.dumps(_record(row)) + "\n" for row in batch)
+
+
+def _ics_text(value: str) -> str:
+    """RFC 5545 TEXT escaping."""
+    return (
+        value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+        .replace("\r\n", "\\n").replace("\n", "\\n")
+    )
+
+
+def _ics_line(line: str) -> str:
+    """Fold a content line at 75 octets, as RFC 5545 requires."""
+    data = line.encode()
+    parts = []
+    while len(data) > 75:
+        cut = 75 if not parts else 74  # continuation lines start with a space
+        while data[cut] & 0xC0 == 0x80:  # never split a UTF-8 sequence
+            cut -= 1
+        parts.append(data[:cut].decode())
+        data = data[cut:]
+    parts.append(data.decode())
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _ics_event(row: Row, stamp: str) -> str:
+    summary = f"{row.away} @ {row.home}"
+    if row.home_score is not None and row.away_score is not None:
+        summary += f" ({row.away_score}-{row.home_score})"
+    if row.has_time:
+        start = "DTSTART:" + row.start.replace(tzinfo=UTC).strftime("%Y%m%dT%H%M%SZ")
+    else:
+        start = "DTSTART;VALUE=DATE:" + _day(row).strftime("%Y%m%d")
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:game-{row.game_id}@sports-passport",
+        f"DTSTAMP:{stamp}",
+        start,
+        f"SUMMARY:{_ics_text(summary)}",
+        f"CATEGORIES:{_ics_text(row.league)}",
+    ]
+    if row.venue:
+        place = ", ".join(part for part in (row.venue, row.city, row.state) if part)
+        lines.append(f"LOCATION:{_ics_text(place)}")
+    if row.latitude is not None and row.longitude is not None:
+        lines.append(f"GEO:{row.latitude};{row.longitude}")
+    if row.notes:
+        lines.append(f"DESCRIPTION:{_ics_text(row.notes)}")
+    lines.append("END:VEVENT")
+    return "".join(_ics_line(line) for line in lines)
+
+
+def _ics(batches: Iterator[Sequence[Row]]) -> Iterator[str]:
+    stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+    yield "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Sports Passport//Attendance//EN\r\n"
+    for batch in batches:
+        yield "".join(_ics_event(row, stamp) for row in batch)
+    yield "END:VCALENDAR\r\n"
+
+
+# format -> (media type, file extension, renderer)
+FORMATS: dict[str, tuple[str, str, Callable[[Iterator[Sequence[Row]]], Iterator[str]]]] = {
+    "csv": ("text/csv; charset=utf-8", "csv", _csv),
+    "jsonl": ("application/x-ndjson", "jsonl", _jsonl),
+    "ics": ("text/calendar; charset=utf-8", "ics", _ics),
+}
+
+
+def stream_export(db: Session, user_id: int, fmt: str) -> Iterator[bytes]:
+    """The user's history rendered as `fmt`, a chunk per batch of rows."""
+    render = FORMATS[fmt][2]
+    for chunk in render(_rows(db, user_id)):
+        if chunk:
+            yield chunk.encode()
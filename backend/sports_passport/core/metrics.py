@@ -0,0 +1,370 @@
+"""Prometheus metrics for imports and the nightly sync, and the per-run
+phase breakdown behind the sync_runs history.
+
+The HTTP layer is covered by prometheus_fastapi_instrumentator; this module
+covers the work that happens behind it. Everything registers on
+prometheus_client's default registry, which is what `/metrics` already
+exposes, so no second endpoint is needed.
+
+An import is tracked with `tracking_import(league, kind)`. While one is
+running, a context variable holds its `ImportRun`, and low-level hooks
+attribute their observations to it:
+
+* a `before_flush` session hook classifies each Game, Team and Venue row the
+  flush writes as inserted, updated or unchanged — an upsert that rewrote a
+  row with the values it already had is the common case in a nightly sync,
+  and the one ImportResult cannot see;
+* cursor hooks count and time statements: SELECTs are the "resolve" phase
+  (team, venue and existing-game lookups), everything else is "write";
+* commit hooks time each commit, less the flush it triggers;
+* `InstrumentedTransport` counts requests and body bytes, and times them as
+  the "fetch" phase;
+* `sample_memory` — called at the start and end of a run and at the
+  importer's checkpoints — keeps the run's peak RSS. RSS is the process's,
+  so two imports running at once both see their combined footprint.
+
+Whatever wall time is left is "parse": the adapter's own CPU work turning
+payloads into rows. Fetch time is summed per request, so an adapter that
+fetches concurrently (NBA) can have more fetch time than wall time; parse is
+clamped at zero there.
+
+The context variable is copied into tasks an import spawns (the NBA
+adapter's concurrent fetches) and into the import thread an import runs on
+(services/import_runner), so the attribution follows it there. Work
+outside any tracked import — API requests, the scripts — is not counted.
+
+Upstream calls are labelled by host rather than league because hosts are what
+rate-limit and fail. They also feed the admin perf page's ring buffer
+(core/perf_log).
+
+`monitor_event_loop_lag` measures how late the API's event loop wakes up
+from a timer — anything blocking the loop shows up there, whatever caused it.
+"""
+import asyncio
+import logging
+import os
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+import httpx
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from sports_passport.core import perf_log
+from sports_passport.models.game import Game
+from sports_passport.models.team import Team
+from sports_passport.models.venue import Venue
+
+logger = logging.getLogger(__name__)
+
+# Syncs run from seconds (a quiet day) to the 600s per-league timeout.
+IMPORT_DURATION = Histogram(
+    "sports_passport_import_duration_seconds",
+    "Wall time of one league import or sync.",
+    ["league", "kind", "outcome"],
+    buckets=(1, 5, 15, 30, 60, 120, 300, 600, 1800, 3600),
+)
+IMPORTS_IN_PROGRESS = Gauge(
+    "sports_passport_imports_in_progress",
+    "League imports or syncs currently running.",
+    ["league", "kind"],
+)
+IMPORT_ROWS = Counter(
+    "sports_passport_import_rows_total",
+    "Catalog rows written by imports, by table and whether the write changed anything.",
+    ["league", "table", "outcome"],
+)
+IMPORT_DB_STATEMENTS = Counter(
+    "sports_passport_import_db_statements_total",
+    "SQL statements executed on behalf of imports.",
+    ["league"],
+)
+IMPORT_COMMIT_SECONDS = Histogram(
+    "sports_passport_import_commit_seconds",
+    "Latency of each commit made by an import.",
+    ["league"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5),
+)
+UPSTREAM_REQUEST_SECONDS = Histogram(
+    "sports_passport_upstream_request_seconds",
+    "Time from sending an upstream request to its response headers.",
+    ["host"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+UPSTREAM_REQUESTS = Counter(
+    "sports_passport_upstream_requests_total",
+    "Upstream requests by host and HTTP status ('error' when none arrived).",
+    ["host", "status"],
+)
+UPSTREAM_RETRIES = Counter(
+    "sports_passport_upstream_retries_total",
+    "Upstream requests retried, by host and what failed (a status or an exception).",
+    ["host", "reason"],
+)
+UPSTREAM_SHORT_CIRCUITS = Counter(
+    "sports_passport_upstream_short_circuits_total",
+    "Upstream requests refused without being sent because the host's circuit was open.",
+    ["host"],
+)
+UPSTREAM_CIRCUIT_OPEN = Gauge(
+    "sports_passport_upstream_circuit_open",
+    "1 while a host's circuit breaker is open (see core/resilient_http).",
+    ["host"],
+)
+IMPORT_PEAK_RSS = Gauge(
+    "sports_passport_import_peak_rss_bytes",
+    "Peak resident memory of the process during the last import of a league and kind.",
+    ["league", "kind"],
+)
+EVENT_LOOP_LAG = Histogram(
+    "sports_passport_event_loop_lag_seconds",
+    "How late the API's event loop ran a timer; time it spent blocked.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5),
+)
+
+# Lag beyond this is logged: every request in flight waited at least as long.
+EVENT_LOOP_LAG_WARNING_SECONDS = 0.5
+
+TRACKED_TABLES = {Game: "games", Team: "teams", Venue: "venues"}
+
+ROW_OUTCOMES = ("inserted", "updated", "unchanged")
+
+
+@dataclass
+class ImportRun:
+    """One tracked import, filled in by the hooks while it runs.
+
+    The body of `tracking_import` sets `failed` to label the run; everything
+    else is measured. Times are in seconds.
+    """
+    league: str
+    kind: str
+    started_at: datetime = field(default_factory=lambda: datetime.now(UTC).replace(tzinfo=None))
+    failed: bool = False
+    seconds: float = 0.0
+    requests: int = 0
+    bytes_downloaded: int = 0
+    statements: int = 0
+    fetch_seconds: float = 0.0
+    resolve_seconds: float = 0.0
+    write_seconds: float = 0.0
+    commit_seconds: float = 0.0
+    peak_rss_bytes: int = 0
+    rows: dict[str, int] = field(default_factory=lambda: dict.fromkeys(ROW_OUTCOMES, 0))
+
+    def phases(self) -> dict[str, float]:
+        """Seconds per phase; parse is the wall time nothing else accounts for."""
+        measured = (
+            self.fetch_seconds + self.resolve_seconds + self.write_seconds + self.commit_seconds
+        )
+        return {
+            "fetch": self.fetch_seconds,
+            "parse": max(self.seconds - measured, 0.0),
+            "resolve": self.resolve_seconds,
+            "write": self.write_seconds,
+            "commit": self.commit_seconds,
+        }
+
+
+_current_run: ContextVar[ImportRun | None] = ContextVar("import_run", default=None)
+
+
+def rss_bytes() -> int | None:
+    """The process's resident memory now; None where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def sample_memory() -> int | None:
+    """Read RSS, raising the tracked import's peak if this is a new high."""
+    rss = rss_bytes()
+    run = _current_run.get()
+    if run is not None and rss is not None:
+        run.peak_rss_bytes = max(run.peak_rss_bytes, rss)
+    return rss
+
+
+@contextmanager
+def tracking_import(league: str, kind: str) -> Iterator[ImportRun]:
+    """Time an import and attribute the rows, statements and commits inside it.
+
+    `kind` is "sync", "teams" or "historical". The run is labelled "error" if
+    the body raises or sets `run.failed`.
+    """
+    run = ImportRun(league, kind)
+    token = _current_run.set(run)
+    in_progress = IMPORTS_IN_PROGRESS.labels(league, kind)
+    in_progress.inc()
+    sample_memory()
+    started = time.perf_counter()
+    try:
+        yield run
+    except BaseException:
+        run.failed = True
+        raise
+    finally:
+        run.seconds = time.perf_counter() - started
+        sample_memory()
+        IMPORT_PEAK_RSS.labels(league, kind).set(run.peak_rss_bytes)
+        outcome = "error" if run.failed else "success"
+        IMPORT_DURATION.labels(league, kind, outcome).observe(run.seconds)
+        in_progress.dec()
+        _current_run.reset(token)
+
+
+def count_rows(table: str, outcome: str, count: int = 1) -> None:
+    """Count rows written toward the import being tracked, if any."""
+    run = _current_run.get()
+    if run is None or not count:
+        return
+    IMPORT_ROWS.labels(run.league, table, outcome).inc(count)
+    run.rows[outcome] += count
+
+
+@event.listens_for(Session, "before_flush")
+def _count_rows(session: Session, flush_context, instances) -> None:
+    if _current_run.get() is None:
+        return
+    for obj in session.new:
+        table = TRACKED_TABLES.get(type(obj))
+        if table is not None:
+            count_rows(table, "inserted")
+    for obj in session.dirty:
+        table = TRACKED_TABLES.get(type(obj))
+        if table is not None:
+            count_rows(table, "updated" if session.is_modified(obj) else "unchanged")
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+    run = _current_run.get()
+    if run is not None:
+        IMPORT_DB_STATEMENTS.labels(run.league).inc()
+        run.statements += 1
+        conn.info.setdefault("import_statement_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "handle_error")
+def _drop_statement_timer(context) -> None:
+    if context.connection is not None and _current_run.get() is not None:
+        started = context.connection.info.get("import_statement_started")
+        if started:
+            started.pop()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _time_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+    run = _current_run.get()
+    started = conn.info.get("import_statement_started")
+    if run is None or not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+        run.resolve_seconds += elapsed
+    else:
+        run.write_seconds += elapsed
+
+
+@event.listens_for(Session, "before_commit")
+def _start_commit_timer(session: Session) -> None:
+    run = _current_run.get()
+    if run is not None:
+        # The statements a commit's flush runs are timed as they execute;
+        # remember how far those totals were so the commit phase can exclude them.
+        session.info["commit_started"] = (
+            time.perf_counter(), run.resolve_seconds + run.write_seconds
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def _observe_commit(session: Session) -> None:
+    started = session.info.pop("commit_started", None)
+    run = _current_run.get()
+    if started is None or run is None:
+        return
+    at, statement_seconds = started
+    elapsed = time.perf_counter() - at
+    IMPORT_COMMIT_SECONDS.labels(run.league).observe(elapsed)
+    flushed = run.resolve_seconds + run.write_seconds - statement_seconds
+    run.commit_seconds += max(elapsed - flushed, 0.0)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_commit_timer(session: Session) -> None:
+    session.info.pop("commit_started", None)
+
+
+class _CountingStream(httpx.AsyncByteStream):
+    """A response body that adds its size and read time to an import run."""
+
+    def __init__(self, inner: httpx.AsyncByteStream, run: ImportRun):
+        self._inner = inner
+        self._run = run
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        started = time.perf_counter()
+        try:
+            async for chunk in self._inner:
+                self._run.bytes_downloaded += len(chunk)
+                yield chunk
+        finally:
+            self._run.fetch_seconds += time.perf_counter() - started
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """Wraps a transport to record latency and status per upstream host.
+
+    Inside a tracked import it also counts the request, and its body bytes
+    and download time, toward the run.
+    """
+
+    def __init__(self, inner: httpx.AsyncBaseTransport):
+        self._inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        run = _current_run.get()
+        started = time.perf_counter()
+        status = "error"
+        try:
+            response = await self._inner.handle_async_request(request)
+            status = str(response.status_code)
+            if run is not None and isinstance(response.stream, httpx.AsyncByteStream):
+                response.stream = _CountingStream(response.stream, run)
+            return response
+        finally:
+            elapsed = time.perf_counter() - started
+            UPSTREAM_REQUEST_SECONDS.labels(host).observe(elapsed)
+            UPSTREAM_REQUESTS.labels(host, status).inc()
+            perf_log.record("upstream", host, elapsed * 1000, status=status)
+            if run is not None:
+                run.requests += 1
+                run.fetch_seconds += elapsed
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+async def monitor_event_loop_lag(interval: float = 0.5) -> None:
+    """Sleep `interval` in a loop, observing how much later than asked each
+    wake-up comes. Runs until cancelled; started by the app's lifespan.
+    """
+    while True:
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lag = max(0.0, time.perf_counter() - started - interval)
+        EVENT_LOOP_LAG.observe(lag)
+        if lag > EVENT_LOOP_LAG_WARNING_SECONDS:
+            logger.warning("Event loop blocked for %.0f ms", lag * 1000)
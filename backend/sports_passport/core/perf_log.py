@@ -0,0 +1,143 @@
+"""Recent route and upstream timings, kept for the admin perf page.
+
+Prometheus (core/metrics) is the long-term record, but it lives outside the
+app; the admin page wants "what has been slow lately" without a Grafana
+login. So timings are also kept here, in `perf_samples`, as fixed-size
+rings: one per kind of sample, each its own range of slots, with a kind's
+sample n going to slot n % its RING_SIZES entry past the range's start and
+overwriting whatever was there. The table never grows, and "the last N
+hours" is whatever a ring still holds.
+
+Separate rings because the kinds arrive at very different rates: every API
+request is a route sample, while upstream calls come in bursts during the
+nightly syncs. Sharing one ring, a day of ordinary traffic would overwrite
+the night's upstream timings before anyone looked at them. Import runs are
+few and worth keeping whole; they go to `sync_runs`, not here.
+
+Samples are recorded from hot paths — every API request — so `record` only
+appends to an in-memory queue per kind. `flush` writes the queues out in one
+statement; the scheduler does that every FLUSH_INTERVAL_SECONDS, and the
+perf endpoint does it before reading. Each queue is bounded by its ring's
+size, so with the scheduler off it drops its oldest samples, as the table
+would.
+"""
+import threading
+import time
+from collections import deque
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from sports_passport.models.perf_sample import PerfSample
+
+# Slots per kind, in slot order: route samples fill 0..19,999, upstream
+# samples the 10,000 after. A night's syncs make a few thousand upstream calls.
+RING_SIZES = {"route": 20_000, "upstream": 10_000}
+FLUSH_INTERVAL_SECONDS = 60
+
+SAMPLE_COLUMNS = ("seq", "recorded_at", "kind", "key", "duration_ms", "status", "rows")
+
+_pending: dict[str, deque[dict[str, Any]]] = {
+    kind: deque(maxlen=size) for kind, size in RING_SIZES.items()
+}
+_lock = threading.Lock()
+# Next sequence number per kind; read back from the table after a restart.
+_next_seq: dict[str, int] = {}
+
+
+def _first_slot(kind: str) -> int:
+    slot = 0
+    for other, size in RING_SIZES.items():
+        if other == kind:
+            return slot
+        slot += size
+    raise KeyError(kind)
+
+
+def record(
+    kind: str, key: str, duration_ms: float, *, status: str | None = None, rows: int | None = None
+) -> None:
+    """Queue one sample of a RING_SIZES kind. Cheap and thread-safe; nothing
+    touches the database."""
+    _pending[kind].append({
+        "recorded_at": datetime.now(UTC).replace(tzinfo=None),
+        "kind": kind,
+        "key": key,
+        "duration_ms": duration_ms,
+        "status": status,
+        "rows": rows,
+    })
+
+
+def flush(db: Session) -> int:
+    """Write queued samples into their rings and commit. Returns how many."""
+    with _lock:
+        batch = []
+        for kind, queue in _pending.items():
+            if not queue:
+                continue
+            seq = _next_seq.get(kind)
+            if seq is None:
+                last = db.query(func.max(PerfSample.seq)).filter(PerfSample.kind == kind).scalar()
+                seq = (last or 0) + 1
+            first_slot, size = _first_slot(kind), RING_SIZES[kind]
+            while queue:
+                sample = queue.popleft()
+                sample["seq"] = seq
+                sample["slot"] = first_slot + seq % size
+                batch.append(sample)
+                seq += 1
+            _next_seq[kind] = seq
+        if not batch:
+            return 0
+
+        stmt = sqlite_insert(PerfSample)
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["slot"],
+                set_={name: stmt.excluded[name] for name in SAMPLE_COLUMNS},
+            ),
+            batch,
+        )
+        db.commit()
+    return len(batch)
+
+
+class RouteTimingMiddleware:
+    """ASGI middleware recording each /api/ request's time to response start.
+
+    Keyed by route template ("GET /api/games/{game_id}"), not the URL, so a
+    route's samples pool across ids. Plain ASGI rather than BaseHTTPMiddleware,
+    so streamed responses pass through untouched.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = "500"
+        elapsed_ms: float | None = None
+
+        async def timed_send(message):
+            nonlocal status, elapsed_ms
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+                elapsed_ms = (time.perf_counter() - started) * 1000
+            await send(message)
+
+        try:
+            await self.app(scope, receive, timed_send)
+        finally:
+            path = getattr(scope.get("route"), "path", None)
+            if path is not None and path.startswith("/api/"):
+                if elapsed_ms is None:
+                    elapsed_ms = (time.perf_counter() - started) * 1000
+                record("route", f"{scope['method']} {path}", elapsed_ms, status=status)
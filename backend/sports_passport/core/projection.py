@@ -0,0 +1,173 @@
+"""Column-projected rows for the large list responses.
+
+`GET /api/attendance/` returns every game a user has attended (limit 10000 by
+default) and the game lists page through hundreds. Through the ORM each row
+was a joined-loaded UserGameAttendance + Game + League + two Teams + Venue
+object graph, then a `from_attributes` validation per object, then
+FastAPI's jsonable_encoder walk over the result — three full passes over data
+that is only ever read.
+
+A `RowShape` instead selects exactly the columns a response schema declares,
+in one flat SELECT, and folds each result tuple straight into the nested dict
+the schema would have produced. The endpoint returns that through a plain
+`JSONResponse`, whose renderer is a single C-accelerated `json.dumps`.
+
+Field lists come from the response schemas themselves, so a field added to
+`TeamResponse` appears here without a second edit; tests/test_projection.py
+holds the two paths to byte-identical output. The one thing a schema cannot
+tell us is its field serializers, so fields rendered with
+`naive_utc_isoformat` are listed in `UTC_FIELDS`.
+
+`GAME_LIST_ITEM` adds the caller's `attended` flag to the game lists: an
+EXISTS against the attendance table per listed row — a semi-join on the
+(user_id, game_id) unique index, bound to the caller with
+`.params(attended_by=…)` — so the SPA need not fetch the whole attendance
+history to decorate a page of results.
+"""
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from typing import Any, cast
+
+from pydantic import BaseModel
+from sqlalchemy import bindparam, exists
+from sqlalchemy.orm import Query, aliased
+
+from sports_passport.core.serializers import naive_utc_isoformat
+from sports_passport.models.attendance import UserGameAttendance
+from sports_passport.models.game import Game
+from sports_passport.models.league import League
+from sports_passport.models.team import Team
+from sports_passport.models.venue import Venue
+from sports_passport.schemas.attendance import AttendanceResponse
+from sports_passport.schemas.game import GameListItemResponse, GameListResponse
+from sports_passport.schemas.league import LeagueResponse
+from sports_passport.schemas.team import TeamResponse
+from sports_passport.schemas.venue import VenueResponse
+
+# (schema, field) pairs whose field_serializer is naive_utc_isoformat;
+# subclasses of the schema inherit the serializer.
+UTC_FIELDS = {(GameListResponse, "start_date")}
+
+HomeTeam = aliased(Team, name="home_team")
+AwayTeam = aliased(Team, name="away_team")
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    """Pydantic's own JSON rendering of a naive datetime: no offset added."""
+    return value.isoformat() if value is not None else None
+
+
+class RowShape:
+    """How one response schema maps onto a run of selected columns.
+
+    `nested` maps a relationship field to the shape of its target. A nested
+    shape marked optional (an outer join) collapses to None when its primary
+    key column comes back NULL, as the ORM relationship would have.
+    `computed` maps a field with no column on `entity` to the SQL
+    expression that selects it.
+    """
+
+    def __init__(
+        self,
+        schema: type[BaseModel],
+        entity: Any,
+        nested: dict[str, "RowShape"] | None = None,
+        optional: bool = False,
+        computed: dict[str, Any] | None = None,
+    ):
+        self.optional = optional
+        self.fields: list[tuple[str, RowShape | Callable | None]] = []
+        self.columns: list[Any] = []
+        nested = nested or {}
+        computed = computed or {}
+        for name, field in schema.model_fields.items():
+            if name in nested:
+                self.fields.append((name, nested[name]))
+                self.columns.extend(nested[name].columns)
+                continue
+            if name in computed:
+                self.fields.append((name, None))
+                self.columns.append(computed[name])
+                continue
+            if any(issubclass(schema, base) and name == utc for base, utc in UTC_FIELDS):
+                convert = naive_utc_isoformat
+            elif field.annotation in (datetime, datetime | None):
+                convert = _isoformat
+            else:
+                convert = None
+            self.fields.append((name, convert))
+            self.columns.append(getattr(entity, name))
+
+    def build(self, row: Sequence, start: int = 0) -> tuple[dict | None, int]:
+        """The dict for `row[start:]`, and the index just past its columns."""
+        out: dict[str, Any] = {}
+        i = start
+        for name, how in self.fields:
+            if isinstance(how, RowShape):
+                out[name], i = how.build(row, i)
+            else:
+                value = row[i]
+                out[name] = how(value) if how is not None and value is not None else value
+                i += 1
+        if self.optional and out["id"] is None:
+            return None, i
+        return out, i
+
+    def rows(self, query: Query) -> list[dict]:
+        # Only nested shapes are optional, so a top-level row is always a dict.
+        return [cast(dict, self.build(row)[0]) for row in query]
+
+
+_GAME_RELATIONS = {
+    "league": RowShape(LeagueResponse, League),
+    "home_team": RowShape(TeamResponse, HomeTeam),
+    "away_team": RowShape(TeamResponse, AwayTeam),
+    "venue": RowShape(VenueResponse, Venue, optional=True),
+}
+
+GAME_LIST = RowShape(GameListResponse, Game, nested=_GAME_RELATIONS)
+
+GAME_LIST_ITEM = RowShape(
+    GameListItemResponse,
+    Game,
+    nested=_GAME_RELATIONS,
+    computed={
+        "attended": exists().where(
+            UserGameAttendance.game_id == Game.id,
+            UserGameAttendance.user_id == bindparam("attended_by"),
+        # Never to an attendance join in the outer query (attended_only).
+        ).correlate_except(UserGameAttendance).label("attended"),
+    },
+)
+
+ATTENDANCE_LIST = RowShape(AttendanceResponse, UserGameAttendance, nested={"game": GAME_LIST})
+
+
+def _join_game_relations(query: Query) -> Query:
+    return (
+        query.join(League, League.id == Game.league_id)
+        .join(HomeTeam, HomeTeam.id == Game.home_team_id)
+        .join(AwayTeam, AwayTeam.id == Game.away_team_id)
+        .outerjoin(Venue, Venue.id == Game.venue_id)
+    )
+
+
+def select_game_list(query: Query) -> Query:
+    """Re-select a filtered `db.query(Game)` as GAME_LIST columns."""
+    return _join_game_relations(query.with_entities(*GAME_LIST.columns))
+
+
+def select_game_list_items(query: Query, user_id: int) -> Query:
+    """Re-select a filtered `db.query(Game)` as GAME_LIST_ITEM columns,
+    flagging the games `user_id` attended."""
+    return _join_game_relations(
+        query.with_entities(*GAME_LIST_ITEM.columns)
+    ).params(attended_by=user_id)
+
+
+def select_attendance_list(query: Query) -> Query:
+    """Re-select a filtered `db.query(UserGameAttendance)` as ATTENDANCE_LIST columns."""
+    return _join_game_relations(
+        query.join(Game, Game.id == UserGameAttendance.game_id)
+        .with_entities(*ATTENDANCE_LIST.columns)
+    )
@@ -0,0 +1,224 @@
+"""Opt-in SQL profiling: per-request statement counts, duplicate detection,
+slow-query plans, and query budgets for tests.
+
+N+1 regressions are silent. `_with_game_relations` and the column-projected
+list paths exist because of lazy-load storms that were only noticed as slow
+pages; nothing would have caught the next one. With QUERY_PROFILING_ENABLED
+set, every request (and every scheduled sync) runs under a `QueryProfile`
+that counts its statements, sums their time, and fingerprints them — the
+statement text with IN-lists collapsed — so a query issued once per row
+shows up as one fingerprint with a large count. A request that repeats a
+fingerprint `N_PLUS_ONE_THRESHOLD` times or more is logged with its worst
+offenders. With DEBUG also set, the totals go out as X-DB-* response
+headers, which makes them visible in the browser's network tab.
+
+Any statement slower than SLOW_QUERY_MS is logged with SQLite's EXPLAIN
+QUERY PLAN, so "slow" arrives with "SCAN games" attached.
+
+Tests use `query_budget` instead, which watches an engine directly and
+needs no setting: TestClient runs the app on another thread, out of reach
+of the test's context variables. A block that runs more statements than its
+budget fails with `QueryBudgetExceeded`.
+
+The engine hooks that do the timing are attached on first use — the first
+profiled request or sync with profiling enabled, or the first `watching`
+block — and stay attached for the life of the process. A deployment with
+profiling off, which never watches, runs no hooks at all; once they are
+attached, every statement pays a timer push and pop and a check for a
+profile or watcher to report to.
+"""
+import logging
+import re
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from fastapi import Request, Response
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from sports_passport.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Repeats of one fingerprint within a request before it is logged as a
+# likely N+1. Two or three is normal (a count query and its page, say).
+N_PLUS_ONE_THRESHOLD = 5
+
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """The statement with IN-lists collapsed, so one query's runs compare equal."""
+    return _WHITESPACE.sub(" ", _IN_LIST.sub("(?...)", statement)).strip()
+
+
+@dataclass
+class QueryProfile:
+    label: str
+    statements: int = 0
+    seconds: float = 0.0
+    fingerprints: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.statements += 1
+        self.seconds += seconds
+        self.fingerprints[fingerprint(statement)] += 1
+
+    def duplicates(self) -> list[tuple[str, int]]:
+        """Fingerprints run more than once, most repeated first."""
+        return [(fp, n) for fp, n in self.fingerprints.most_common() if n > 1]
+
+    def summary(self) -> str:
+        lines = [
+            f"{self.label}: {self.statements} statements, "
+            f"{self.seconds * 1000:.1f} ms in the database"
+        ]
+        lines += [f"  {n}x {fp[:200]}" for fp, n in self.duplicates()[:5]]
+        return "\n".join(lines)
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+_current: ContextVar[QueryProfile | None] = ContextVar("query_profile", default=None)
+_watchers: list[tuple[Engine, QueryProfile]] = []
+
+
+@contextmanager
+def profiling(label: str) -> Iterator[QueryProfile | None]:
+    """Profile the statements run inside the block, when profiling is enabled.
+
+    Yields None when it is not, so callers can skip their reporting.
+    """
+    if not settings.query_profiling_enabled:
+        yield None
+        return
+    _listen()
+    profile = QueryProfile(label)
+    token = _current.set(profile)
+    try:
+        yield profile
+    finally:
+        _current.reset(token)
+        duplicates = profile.duplicates()
+        if duplicates and duplicates[0][1] >= N_PLUS_ONE_THRESHOLD:
+            logger.warning("Repeated queries, likely N+1 — %s", profile.summary())
+        else:
+            logger.debug("%s", profile.summary())
+
+
+@contextmanager
+def watching(engine: Engine, label: str = "watch") -> Iterator[QueryProfile]:
+    """Profile every statement `engine` runs during the block, on any thread."""
+    _listen()
+    entry = (engine, QueryProfile(label))
+    _watchers.append(entry)
+    try:
+        yield entry[1]
+    finally:
+        _watchers.remove(entry)
+
+
+@contextmanager
+def query_budget(
+    engine: Engine, max_statements: int, *, max_repeats: int | None = None
+) -> Iterator[QueryProfile]:
+    """Fail if the block runs more than `max_statements` on `engine`.
+
+    `max_repeats`, when given, also caps how often any one fingerprint may
+    run — the sharper test for an N+1, since it does not move when an
+    unrelated query is added.
+    """
+    with watching(engine, "budget") as profile:
+        yield profile
+    if profile.statements > max_statements:
+        raise QueryBudgetExceeded(
+            f"ran {profile.statements} statements, budget {max_statements}\n{profile.summary()}"
+        )
+    duplicates = profile.duplicates()
+    if max_repeats is not None and duplicates and duplicates[0][1] > max_repeats:
+        raise QueryBudgetExceeded(
+            f"a statement ran {duplicates[0][1]} times, limit {max_repeats}\n{profile.summary()}"
+        )
+
+
+def _explain(conn, statement: str, parameters) -> str:
+    # On the raw DBAPI connection, so the plan query itself is not profiled.
+    try:
+        rows = conn.connection.driver_connection.execute(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        ).fetchall()
+    except Exception as e:  # noqa: BLE001 — a missing plan must not fail the query
+        return f"(no plan: {e})"
+    return "\n".join(f"  {row[-1]}" for row in rows)
+
+
+def _start_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _drop_timer(context) -> None:
+    # A failed statement never reaches after_cursor_execute.
+    if context.connection is not None:
+        started = context.connection.info.get("query_started")
+        if started:
+            started.pop()
+
+
+def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = conn.info.get("query_started")
+    if not started:
+        return  # began before the hooks were attached
+    elapsed = time.perf_counter() - started.pop()
+    profile = _current.get()
+    if profile is not None:
+        profile.record(statement, elapsed)
+    for engine, watcher in _watchers:
+        if conn.engine is engine:
+            watcher.record(statement, elapsed)
+
+    if (
+        settings.query_profiling_enabled
+        and elapsed * 1000 >= settings.slow_query_ms
+        and not executemany
+        and statement.lstrip().upper().startswith(("SELECT", "WITH"))
+    ):
+        logger.warning(
+            "Slow query (%.0f ms): %s\n%s",
+            elapsed * 1000, statement, _explain(conn, statement, parameters),
+        )
+
+
+_HOOKS = (
+    ("before_cursor_execute", _start_timer),
+    ("handle_error", _drop_timer),
+    ("after_cursor_execute", _record),
+)
+
+
+def _listen() -> None:
+    """Attach the timing hooks to every engine, once."""
+    for name, hook in _HOOKS:
+        if not event.contains(Engine, name, hook):
+            event.listen(Engine, name, hook)
+
+
+if settings.query_profiling_enabled:
+    _listen()  # before the first request, so startup queries are timed too
+
+
+async def profile_request(request: Request, call_next) -> Response:
+    """HTTP middleware: profile each request; in debug, report totals as headers."""
+    with profiling(f"{request.method} {request.url.path}") as profile:
+        response = await call_next(request)
+    if profile is not None and settings.debug:
+        response.headers["X-DB-Statements"] = str(profile.statements)
+        response.headers["X-DB-Time-Ms"] = f"{profile.seconds * 1000:.1f}"
+        response.headers["X-DB-Max-Repeats"] = str(max(profile.fingerprints.values(), default=0))
+    return response
@@ -0,0 +1,204 @@
+"""Retries, per-host circuit breakers and concurrency caps for upstream HTTP.
+
+Every adapter talks to its upstream through `LeagueAdapter.http`, whose
+transport stack `upstream_transport` builds. Without this layer a transient
+502 from CFBD, ASA or ESPN failed the whole run, and a host that had stopped
+answering cost a full connect or read timeout on every request until the
+sync's 600s budget ran out.
+
+`ResilientTransport` adds, per host:
+
+* retries of idempotent requests on connection errors, timeouts and
+  429/5xx answers — up to MAX_ATTEMPTS, with full-jitter exponential
+  backoff, or after the host's `Retry-After` when it sends one;
+* a circuit breaker: BREAKER_FAILURE_THRESHOLD failed attempts in a row
+  open it, and for BREAKER_COOLDOWN_SECONDS requests to that host fail at
+  once with `HostUnavailable`; then one probe is let through, and its
+  outcome closes the circuit or opens it again;
+* at most MAX_CONCURRENCY_PER_HOST requests in flight from one client.
+
+Breaker state is process-wide — two imports hitting the same dead host
+should both stop — and guarded by a lock, since imports run on their own
+threads (services/import_runner). The concurrency cap is per client, as
+asyncio semaphores belong to one event loop.
+
+Each attempt passes through `InstrumentedTransport`, so /metrics and the
+perf page see every attempt; retries and short circuits are counted per host
+too (core/metrics). Failures surface as httpx errors, which adapters already
+handle. Connections are kept alive between requests, over HTTP/2 when the
+`h2` package is installed.
+"""
+import asyncio
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from importlib.util import find_spec
+
+import httpx
+
+from sports_passport.core.metrics import (
+    UPSTREAM_CIRCUIT_OPEN,
+    UPSTREAM_RETRIES,
+    UPSTREAM_SHORT_CIRCUITS,
+    InstrumentedTransport,
+)
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 4
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 20.0
+# A host asking to be left alone for longer than this is not retried.
+RETRY_AFTER_MAX_SECONDS = 60.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RETRY_EXCEPTIONS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_COOLDOWN_SECONDS = 60.0
+
+MAX_CONCURRENCY_PER_HOST = 4
+KEEPALIVE_EXPIRY_SECONDS = 30.0
+
+
+class HostUnavailable(httpx.TransportError):
+    """Refused without sending: the host's circuit breaker is open."""
+
+
+@dataclass
+class _Breaker:
+    failures: int = 0
+    opened_at: float | None = None
+    probing: bool = False
+
+
+_breakers: dict[str, _Breaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def _allow(host: str) -> bool:
+    with _breakers_lock:
+        breaker = _breakers.setdefault(host, _Breaker())
+        if breaker.opened_at is None:
+            return True
+        if breaker.probing or time.monotonic() - breaker.opened_at < BREAKER_COOLDOWN_SECONDS:
+            return False
+        breaker.probing = True  # half-open: this request is the probe
+        return True
+
+
+def _record(host: str, ok: bool) -> None:
+    with _breakers_lock:
+        breaker = _breakers.setdefault(host, _Breaker())
+        breaker.probing = False
+        if ok:
+            if breaker.opened_at is not None:
+                logger.info("Upstream %s is answering again; circuit closed", host)
+                UPSTREAM_CIRCUIT_OPEN.labels(host).set(0)
+            breaker.failures = 0
+            breaker.opened_at = None
+            return
+        breaker.failures += 1
+        if breaker.opened_at is not None or breaker.failures >= BREAKER_FAILURE_THRESHOLD:
+            if breaker.opened_at is None:
+                logger.warning("Upstream %s failed %d times in a row; circuit open",
+                               host, breaker.failures)
+            breaker.opened_at = time.monotonic()
+            UPSTREAM_CIRCUIT_OPEN.labels(host).set(1)
+
+
+def _release_probe(host: str) -> None:
+    """Give up the half-open probe slot without counting an outcome."""
+    with _breakers_lock:
+        _breakers.setdefault(host, _Breaker()).probing = False
+
+
+def _backoff(attempt: int) -> float:
+    return random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt))
+
+
+def _retry_delay(attempt: int, response: httpx.Response) -> float | None:
+    """Seconds to wait before retrying `response`, or None not to retry."""
+    retry_after = response.headers.get("retry-after")
+    if retry_after is None:
+        return _backoff(attempt)
+    try:
+        delay = float(retry_after)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return _backoff(attempt)
+        delay = (when - datetime.now(UTC)).total_seconds()
+    return max(0.0, delay) if delay <= RETRY_AFTER_MAX_SECONDS else None
+
+
+class ResilientTransport(httpx.AsyncBaseTransport):
+    def __init__(self, inner: httpx.AsyncBaseTransport,
+                 max_concurrency: int = MAX_CONCURRENCY_PER_HOST):
+        self._inner = inner
+        self._max_concurrency = max_concurrency
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        semaphore = self._semaphores.setdefault(host, asyncio.Semaphore(self._max_concurrency))
+        retryable = request.method in IDEMPOTENT_METHODS
+        async with semaphore:
+            for attempt in range(1, MAX_ATTEMPTS + 1):
+                if not _allow(host):
+                    UPSTREAM_SHORT_CIRCUITS.labels(host).inc()
+                    raise HostUnavailable(
+                        f"{host} is failing; not retrying for {BREAKER_COOLDOWN_SECONDS:.0f}s",
+                        request=request,
+                    )
+                last = attempt == MAX_ATTEMPTS
+                try:
+                    response = await self._inner.handle_async_request(request)
+                except RETRY_EXCEPTIONS as e:
+                    _record(host, ok=False)
+                    if last or not retryable:
+                        raise
+                    reason, delay = type(e).__name__, _backoff(attempt)
+                except Exception:
+                    # Failed in a way not worth retrying.
+                    _record(host, ok=False)
+                    raise
+                except BaseException:
+                    # Cancelled — a timeout around the sync, or a sibling in a
+                    # fan-out failing. That says nothing about the host, so it
+                    # is not a failure; but a cancelled probe must still hand
+                    # back its slot, or the breaker stays half-open for good.
+                    _release_probe(host)
+                    raise
+                else:
+                    _record(host, ok=response.status_code < 500)
+                    if last or not retryable or response.status_code not in RETRY_STATUSES:
+                        return response
+                    delay = _retry_delay(attempt, response)
+                    if delay is None:
+                        return response
+                    reason = str(response.status_code)
+                    await response.aclose()
+                UPSTREAM_RETRIES.labels(host, reason).inc()
+                await asyncio.sleep(delay)
+        raise AssertionError("unreachable: the last attempt returns or raises")
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+def upstream_transport() -> httpx.AsyncBaseTransport:
+    """The transport stack adapters' clients use: retries and breakers over
+    per-attempt instrumentation over a keep-alive connection pool."""
+    return ResilientTransport(InstrumentedTransport(httpx.AsyncHTTPTransport(
+        http2=find_spec("h2") is not None,
+        limits=httpx.Limits(
+            max_keepalive_connections=MAX_CONCURRENCY_PER_HOST,
+            keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )))
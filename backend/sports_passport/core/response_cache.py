@@ -0,0 +1,194 @@
+"""Response cache for read-only catalog endpoints, with ETag/304 revalidation.
+
+Leagues, teams, season lists, game counts and single games only change when
+an import or sync commits, yet every SPA navigation recomputed them — the
+full teams list alone is ~4k rows serialized per page load. Each cached body
+is stored against the *data generation* it was built from: a process-wide
+counter bumped whenever a commit touches League, Team, Venue or Game rows
+(see `_note_catalog_writes`), and explicitly by the scheduler after every
+sync. A bump makes every stored body stale at once, so nothing has to know
+which endpoints a given write affects.
+
+Clients revalidate with If-None-Match and get a bodiless 304 when nothing
+changed. The ETag is a digest of the body rather than the generation, so a
+sync that changed nothing relevant to a response still yields 304s after the
+rebuild.
+
+The generation lives in this process, which hosts the API, the nightly
+scheduler and the admin import endpoints. The maintenance scripts under
+scripts/ write from a process of their own; `CACHE_TTL_SECONDS` bounds how
+long a response can trail them.
+
+Only endpoints whose response is the same for every caller belong here. The
+auth dependency still runs on a hit; what a hit skips is the endpoint's own
+queries and its serialization.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+from fastapi import Request, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from sports_passport.models.game import Game
+from sports_passport.models.league import League
+from sports_passport.models.team import Team
+from sports_passport.models.venue import Venue
+
+# Bound on staleness from writers outside this process (see module docstring).
+CACHE_TTL_SECONDS = 300
+# Distinct (route, query) keys kept. The SPA asks for a few dozen; the bound
+# only matters against a client walking arbitrary filter combinations.
+CACHE_MAX_ENTRIES = 512
+
+# `private`: every cached route sits behind a bearer token, so shared caches
+# must not store it. `no-cache`: the browser may keep the body but must
+# revalidate each use, which costs it a 304 and keeps a finished sync visible
+# on the very next navigation.
+CACHE_CONTROL = "private, no-cache"
+
+CATALOG_MODELS = (League, Team, Venue, Game)
+
+_lock = threading.Lock()
+_generation = 0
+
+
+@dataclass(frozen=True)
+class _Entry:
+    generation: int
+    stored_at: float
+    etag: str
+    body: bytes
+
+
+_entries: OrderedDict[str, _Entry] = OrderedDict()
+
+
+def data_generation() -> int:
+    return _generation
+
+
+def bump_data_generation() -> None:
+    """Invalidate every cached response. Safe to call redundantly."""
+    global _generation
+    with _lock:
+        _generation += 1
+        _entries.clear()
+
+
+def mark_catalog_changed(session: Session) -> None:
+    """Invalidate cached responses when `session` commits.
+
+    For catalog writes made with Core statements, which the flush hook below
+    cannot see.
+    """
+    session.info["catalog_changed"] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _note_catalog_writes(session: Session, flush_context) -> None:
+    if any(
+        isinstance(obj, CATALOG_MODELS)
+        for obj in (*session.new, *session.dirty, *session.deleted)
+    ):
+        mark_catalog_changed(session)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_on_catalog_commit(session: Session) -> None:
+    if session.info.pop("catalog_changed", False):
+        bump_data_generation()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_catalog_writes(session: Session) -> None:
+    session.info.pop("catalog_changed", None)
+
+
+@cache
+def _adapter(model: Any) -> TypeAdapter:
+    return TypeAdapter(model)
+
+
+def _cache_key(request: Request) -> str:
+    return f"{request.url.path}?{sorted(request.query_params.multi_items())}"
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return header.strip() == "*" or etag in (t.strip() for t in header.split(","))
+
+
+def _etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+
+
+def _respond(request: Request, etag: str, body: bytes) -> Response:
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def revalidated_response(request: Request, body: bytes) -> Response:
+    """`body` with its ETag, or a bodiless 304 when the client already has it.
+
+    For per-caller responses: not stored here, since they differ by user,
+    but cheap to build and worth not re-sending.
+    """
+    return _respond(request, _etag(body), body)
+
+
+def cached_response(
+    request: Request, model: Any, build: Callable[[], Any], key: str | None = None
+) -> Response:
+    """Serve `build()`, serialized as `model`, from the cache when current.
+
+    `model` is the endpoint's response type (e.g. `list[TeamResponse]`) and is
+    applied exactly as FastAPI's response_model would be, including field
+    serializers such as naive_utc_isoformat. Exceptions from `build` — the
+    404s — propagate uncached.
+
+    `key` replaces the request's path and query as the cache key, for an
+    endpoint that normalizes free-form parameters before building: without
+    it, every distinct float in a query string is an entry of its own.
+    """
+    key = key or _cache_key(request)
+    generation = _generation
+    entry = _entries.get(key)
+    if (
+        entry is not None
+        and entry.generation == generation
+        and time.monotonic() - entry.stored_at < CACHE_TTL_SECONDS
+    ):
+        with _lock:
+            if key in _entries:
+                _entries.move_to_end(key)
+        return _respond(request, entry.etag, entry.body)
+
+    adapter = _adapter(model)
+    body = adapter.dump_json(adapter.validate_python(build(), from_attributes=True))
+    entry = _Entry(
+        generation=generation,
+        stored_at=time.monotonic(),
+        etag=_etag(body),
+        body=body,
+    )
+    with _lock:
+        # A bump while this response was being built means it may predate the
+        # write; serve it (this request began before the commit) but do not keep it.
+        if generation == _generation:
+            _entries[key] = entry
+            _entries.move_to_end(key)
+            while len(_entries) > CACHE_MAX_ENTRIES:
+                _entries.popitem(last=False)
+    return _respond(request, entry.etag, entry.body)
@@ -1,4 +1,5 @@
 """Static seed data — leagues are fixed reference rows, inserted at startup."""
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from sports_passport.models.league import League
@@ -15,11 +16,17 @@ LEAGUES = [
 
 
 def seed_leagues(db: Session) -> int:
-    """Insert any missing leagues. Returns number created."""
-    created = 0
-    for row in LEAGUES:
-        if not db.query(League).filter(League.code == row["code"]).first():
-            db.add(League(**row, active=True))
-            created += 1
+    """Insert any missing leagues. Returns number created.
+
+    One INSERT ... ON CONFLICT DO NOTHING, keyed on the unique league code, so
+    a restart with every league present costs a single statement, and two
+    processes starting at once cannot both insert a league.
+    """
+    created = db.scalars(
+        sqlite_insert(League)
+        .values([{**row, "active": True} for row in LEAGUES])
+        .on_conflict_do_nothing(index_elements=["code"])
+        .returning(League.id)
+    ).all()
     db.commit()
-    return created
+    return len(created)
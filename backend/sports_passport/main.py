@@ -1,8 +1,9 @@
+import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-import sentry_sdk
 from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
@@ -15,16 +16,32 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from sports_passport.core.config import settings
 from sports_passport.core.limiter import limiter
+from sports_passport.core.metrics import monitor_event_loop_lag
+from sports_passport.core.perf_log import RouteTimingMiddleware
+from sports_passport.core.query_profiler import profile_request
 from sports_passport.db.database import SessionLocal
 from sports_passport.db.seed import seed_leagues
-from sports_passport.routers import admin, attendance, auth, games, leagues, password_reset, teams
+from sports_passport.routers import (
+    admin,
+    attendance,
+    auth,
+    games,
+    leagues,
+    password_reset,
+    teams,
+    venues,
+)
 from sports_passport.services.scheduler import shutdown_scheduler, start_scheduler
 
 logger = logging.getLogger(__name__)
 
 # Initialize Sentry as early as possible. Disabled (with a warning) when no DSN
 # is configured so the app still runs locally / in environments without Sentry.
+# The SDK is imported only when it will be used: it is one of the heaviest
+# imports in the app (see scripts/import_time_report.py).
 if settings.sentry_dsn:
+    import sentry_sdk
+
     sentry_sdk.init(
         dsn=settings.sentry_dsn,
         environment=settings.sentry_environment,
@@ -49,13 +66,23 @@ async def lifespan(app: FastAPI):
     models regardless of which migrations had run, so later migrations met
     tables they had not created. Locally, run `uv run alembic upgrade head`
     once before the first `uvicorn`.
+
+    It also starts the event-loop lag monitor (see core/metrics), which is
+    how a blocking call on the loop shows up on /metrics.
     """
+    started = time.perf_counter()
     with SessionLocal() as db:
-        seed_leagues(db)
+        created = seed_leagues(db)
     start_scheduler()
+    logger.info(
+        "Startup: %d league(s) seeded, scheduler started in %.0f ms",
+        created, (time.perf_counter() - started) * 1000,
+    )
+    lag_monitor = asyncio.create_task(monitor_event_loop_lag())
     try:
         yield
     finally:
+        lag_monitor.cancel()
         shutdown_scheduler()
 
 
@@ -89,12 +116,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Route timings for the admin perf page (see core/perf_log).
+app.add_middleware(RouteTimingMiddleware)
+
+# Per-request SQL profiling, opt-in (QUERY_PROFILING_ENABLED). Registered only
+# when enabled so a normal deployment does not pay for the extra middleware.
+if settings.query_profiling_enabled:
+    app.middleware("http")(profile_request)
+
 # Include routers
 app.include_router(auth.router)
 app.include_router(password_reset.router)
 app.include_router(leagues.router)
 app.include_router(games.router)
 app.include_router(teams.router)
+app.include_router(venues.router)
 app.include_router(attendance.router)
 app.include_router(admin.router)
 
@@ -1,7 +1,11 @@
+from sports_passport.models.atlas import UserAtlasCount
 from sports_passport.models.attendance import UserGameAttendance
 from sports_passport.models.game import Game
 from sports_passport.models.league import League
+from sports_passport.models.league_stats import LeagueStats
 from sports_passport.models.password_reset_token import PasswordResetToken
+from sports_passport.models.perf_sample import PerfSample
+from sports_passport.models.sync_run import SyncRun
 from sports_passport.models.sync_state import SyncState
 from sports_passport.models.team import Team
 from sports_passport.models.user import User
@@ -10,10 +14,14 @@ from sports_passport.models.venue import Venue
 __all__ = [
     "Game",
     "League",
+    "LeagueStats",
     "PasswordResetToken",
+    "PerfSample",
+    "SyncRun",
     "SyncState",
     "Team",
     "User",
+    "UserAtlasCount",
     "UserGameAttendance",
     "Venue",
 ]
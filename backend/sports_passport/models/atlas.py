@@ -0,0 +1,22 @@
+from sqlalchemy import ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from sports_passport.db.database import Base
+
+
+class UserAtlasCount(Base):
+    """How many of a user's attended games were played at a venue, per league.
+
+    A running total maintained alongside attendance writes (see
+    services/atlas.py), so the atlas map reads one row per venue visited
+    rather than walking the user's whole attendance log. Games without a
+    venue have no row. Per-state totals are rolled up from these rows at read
+    time, joined through `venues.state`, so correcting a venue's state needs
+    no recount.
+    """
+    __tablename__ = "user_atlas_counts"
+
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), primary_key=True)
+    venue_id: Mapped[int] = mapped_column(Integer, ForeignKey("venues.id"), primary_key=True)
+    league_id: Mapped[int] = mapped_column(Integer, ForeignKey("leagues.id"), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -1,8 +1,17 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, UniqueConstraint
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    Boolean,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from sports_passport.db.database import Base
 
@@ -17,6 +26,15 @@ class Game(Base):
     __tablename__ = "games"
     __table_args__ = (
         UniqueConstraint("source", "source_game_id", name="uq_game_source"),
+        # Natural-key lookups: reconciling two sources for one game by
+        # matchup + start window (services/natural_key.py).
+        Index(
+            "ix_games_natural_key", "league_id", "home_team_id", "away_team_id", "start_date"
+        ),
+        # Per-day counts for the calendar heatmap (routers/games.py): one
+        # league-season is a single index range, already in day order, and
+        # covers the query without touching a games row.
+        Index("ix_games_league_season_day", "league_id", "season", "local_game_date"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
@@ -26,6 +44,11 @@ class Game(Base):
     home_score: Mapped[int | None] = mapped_column(Integer)
     away_score: Mapped[int | None] = mapped_column(Integer)
     start_date: Mapped[datetime] = mapped_column(DateTime, index=True)  # UTC
+    # The calendar day the game was played, as a person would name it (see
+    # local_time.local_game_date). Derived from start_date on every write, by
+    # _derive_local_game_date below; nullable only because SQLite cannot add
+    # a NOT NULL column to a populated table.
+    local_game_date: Mapped[date | None] = mapped_column(Date, nullable=True, index=True)
     # False = date-only (old bulk data)
     has_time: Mapped[bool] = mapped_column(Boolean, default=True)
     season: Mapped[int] = mapped_column(Integer, index=True)
@@ -52,3 +75,12 @@ class Game(Base):
     user_attendances: Mapped[list["UserGameAttendance"]] = relationship(
         "UserGameAttendance", back_populates="game", cascade="all, delete-orphan"
     )
+
+    @validates("start_date")
+    def _derive_local_game_date(self, key: str, value: datetime) -> datetime:
+        # Imported here: the adapters package imports the models, so a
+        # module-level import would be circular.
+        from sports_passport.services.adapters.local_time import local_game_date
+
+        self.local_game_date = local_game_date(value)
+        return value
@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from sports_passport.db.database import Base
+
+
+class LeagueStats(Base):
+    """Catalog counts per league, for the admin status table.
+
+    Kept current by the import path (see services/league_stats.py) so the
+    status poll reads one row per league instead of aggregating `games`.
+    `venues` counts distinct venues that have hosted one of the league's games.
+    """
+    __tablename__ = "league_stats"
+
+    league_id: Mapped[int] = mapped_column(Integer, ForeignKey("leagues.id"), primary_key=True)
+    games: Mapped[int] = mapped_column(Integer, nullable=False)
+    teams: Mapped[int] = mapped_column(Integer, nullable=False)
+    venues: Mapped[int] = mapped_column(Integer, nullable=False)
+    first_season: Mapped[int | None] = mapped_column(Integer)
+    last_season: Mapped[int | None] = mapped_column(Integer)
+    last_game_at: Mapped[datetime | None] = mapped_column(DateTime)  # latest start_date, UTC
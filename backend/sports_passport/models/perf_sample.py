@@ -0,0 +1,30 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from sports_passport.db.database import Base
+
+
+class PerfSample(Base):
+    """One timing in the admin performance ring buffer (see core/perf_log.py).
+
+    Each kind has a ring of its own, a range of slots. `slot` is the sample's
+    sequence number within its kind, modulo that ring's size, plus the start
+    of the range, so the table never holds more rows than the rings have
+    slots: a new sample overwrites the oldest of its kind.
+    """
+    __tablename__ = "perf_samples"
+    __table_args__ = (
+        Index("ix_perf_samples_kind_recorded_at", "kind", "recorded_at"),
+    )
+
+    slot: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    seq: Mapped[int] = mapped_column(Integer, nullable=False)
+    recorded_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)  # naive UTC
+    # 'route' (key "GET /api/games/") or 'upstream' (key = host)
+    kind: Mapped[str] = mapped_column(String, nullable=False)
+    key: Mapped[str] = mapped_column(String, nullable=False)
+    duration_ms: Mapped[float] = mapped_column(Float, nullable=False)
+    status: Mapped[str | None] = mapped_column(String)  # HTTP status, or 'success'/'error'
+    rows: Mapped[int | None] = mapped_column(Integer)   # row count, for samples that have one
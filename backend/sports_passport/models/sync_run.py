@@ -0,0 +1,48 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from sports_passport.db.database import Base
+
+
+class SyncRun(Base):
+    """One import run — nightly sync, team import or historical import.
+
+    SyncState keeps only the latest run per league; this is the full history,
+    with the run's time split into phases (see core/metrics.py for how each
+    is measured) so a slow league can be traced to fetching, parsing, lookups
+    or writes, and an upstream slowdown shows up as fetch time creeping
+    across weeks.
+    """
+    __tablename__ = "sync_runs"
+    __table_args__ = (
+        Index("ix_sync_runs_league_id_started_at", "league_id", "started_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    league_id: Mapped[int] = mapped_column(Integer, ForeignKey("leagues.id"), nullable=False)
+    kind: Mapped[str] = mapped_column(String, nullable=False)  # 'sync' | 'teams' | 'historical'
+    started_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)  # naive UTC
+    status: Mapped[str] = mapped_column(String, nullable=False)  # 'success' | 'error'
+    error: Mapped[str | None] = mapped_column(String)  # first error line, if any
+
+    duration_ms: Mapped[int] = mapped_column(Integer, nullable=False)
+    fetch_ms: Mapped[int] = mapped_column(Integer, nullable=False)
+    parse_ms: Mapped[int] = mapped_column(Integer, nullable=False)
+    resolve_ms: Mapped[int] = mapped_column(Integer, nullable=False)
+    write_ms: Mapped[int] = mapped_column(Integer, nullable=False)
+    commit_ms: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    requests: Mapped[int] = mapped_column(Integer, nullable=False)
+    bytes_downloaded: Mapped[int] = mapped_column(Integer, nullable=False)
+    statements: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Process RSS high-water mark during the run; NULL where it can't be read.
+    peak_rss_mb: Mapped[int | None] = mapped_column(Integer)
+    # Catalog rows (games, teams, venues) by what the write did to them.
+    rows_inserted: Mapped[int] = mapped_column(Integer, nullable=False)
+    rows_updated: Mapped[int] = mapped_column(Integer, nullable=False)
+    rows_unchanged: Mapped[int] = mapped_column(Integer, nullable=False)
+    # As reported by the adapter's ImportResult.
+    games_imported: Mapped[int] = mapped_column(Integer, nullable=False)
+    games_updated: Mapped[int] = mapped_column(Integer, nullable=False)
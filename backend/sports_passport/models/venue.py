@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Float, Integer, String, UniqueConstraint
+from sqlalchemy import Float, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from sports_passport.db.database import Base
@@ -13,6 +13,8 @@ class Venue(Base):
     __tablename__ = "venues"
     __table_args__ = (
         UniqueConstraint("source", "source_venue_id", name="uq_venue_source"),
+        # Viewport (bounding-box) scans for the venue map; see routers/venues.py.
+        Index("ix_venues_lat_lon", "latitude", "longitude"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
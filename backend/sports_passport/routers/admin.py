@@ -1,21 +1,29 @@
-from datetime import date, timedelta
+import math
+from collections import defaultdict
+from datetime import UTC, date, datetime, timedelta
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
 from pydantic import BaseModel
-from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from sports_passport.core import perf_log
 from sports_passport.core.dependencies import get_current_admin_user
+from sports_passport.core.metrics import ImportRun, tracking_import
 from sports_passport.db.database import get_db
-from sports_passport.models.game import Game
 from sports_passport.models.league import League
+from sports_passport.models.league_stats import LeagueStats
+from sports_passport.models.perf_sample import PerfSample
+from sports_passport.models.sync_run import SyncRun
 from sports_passport.models.sync_state import SyncState
-from sports_passport.models.team import Team
 from sports_passport.models.user import User
 from sports_passport.schemas.user import UserResponse
+from sports_passport.services import league_stats  # noqa: F401  (registers the count hooks)
 from sports_passport.services.adapters import ADAPTERS, get_adapter
+from sports_passport.services.adapters.base import ImportResult
+from sports_passport.services.import_runner import run_import
 from sports_passport.services.scheduler import (
     get_or_create_sync_state,
+    record_sync_run,
     run_sync_all_background,
     run_sync_for_league,
     start_sync_all,
@@ -30,6 +38,12 @@ router = APIRouter(prefix="/api/admin", tags=["admin"])
 # alone sleeps 250ms per request while doing it.
 EARLIEST_SEASON = 1850
 
+# Routes listed by /perf, slowest (p95) first.
+SLOWEST_ROUTES = 10
+# Import runs listed individually by /perf, newest first.
+RECENT_SYNC_RUNS = 50
+PHASES = ("fetch", "parse", "resolve", "write", "commit")
+
 
 def _adapter_or_404(league_code: str, db: Session):
     try:
@@ -42,6 +56,13 @@ def _adapter_or_404(league_code: str, db: Session):
         ) from e
 
 
+def _record_import(db: Session, run: ImportRun, result: ImportResult) -> None:
+    league = db.query(League).filter(League.code == run.league).first()
+    if league is not None:
+        record_sync_run(db, league.id, run, result)
+        db.commit()
+
+
 @router.post("/import/{league_code}/teams")
 async def import_league_teams(
     league_code: str,
@@ -50,16 +71,22 @@ async def import_league_teams(
 ):
     """Import/refresh teams for a league (Admin only)"""
     adapter = _adapter_or_404(league_code, db)
+    run = result = None
     try:
-        result = await adapter.import_teams()
+        with tracking_import(adapter.league_code, "teams") as run:
+            result = await run_import(adapter, adapter.import_teams)
+            run.failed = bool(result.errors)
         return result
     except Exception as e:
+        db.rollback()
+        result = ImportResult(league=adapter.league_code, errors=[str(e)])
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Team import failed: {str(e)}"
         ) from e
     finally:
-        await adapter.aclose()
+        if run is not None and result is not None:
+            _record_import(db, run, result)
 
 
 @router.post("/import/{league_code}/historical")
@@ -83,16 +110,24 @@ async def import_league_historical(
             detail=f"Seasons must fall between {EARLIEST_SEASON} and {latest_season}"
         )
     adapter = _adapter_or_404(league_code, db)
+    run = result = None
     try:
-        result = await adapter.import_historical(start_season, end_season)
+        with tracking_import(adapter.league_code, "historical") as run:
+            result = await run_import(
+                adapter, lambda: adapter.import_historical(start_season, end_season)
+            )
+            run.failed = bool(result.errors)
         return result
     except Exception as e:
+        db.rollback()
+        result = ImportResult(league=adapter.league_code, errors=[str(e)])
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Historical import failed: {str(e)}"
         ) from e
     finally:
-        await adapter.aclose()
+        if run is not None and result is not None:
+            _record_import(db, run, result)
 
 
 @router.post("/sync/{league_code}")
@@ -156,26 +191,30 @@ def data_status(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
 ):
-    """Per-league row counts, season coverage, and nightly-sync status (Admin only)"""
-    sync_by_league_id = {s.league_id: s for s in db.query(SyncState).all()}
+    """Per-league row counts, season coverage, and nightly-sync status (Admin only)
+
+    One query over small tables: the counts are kept current by the import
+    path in league_stats (see services/league_stats.py), and the sync fields
+    come from SyncState.
+    """
     rows = []
-    for league in db.query(League).order_by(League.code).all():
-        game_count = db.query(func.count(Game.id)).filter(Game.league_id == league.id).scalar()
-        team_count = db.query(func.count(Team.id)).filter(Team.league_id == league.id).scalar()
-        # Aggregates always yield exactly one row (both values NULL when the
-        # league has no games), so .one() is total here and keeps the result
-        # non-Optional for the subscripts below.
-        season_range = db.query(
-            func.min(Game.season), func.max(Game.season)
-        ).filter(Game.league_id == league.id).one()
-        state = sync_by_league_id.get(league.id)
+    for league, stats, state in (
+        db.query(League, LeagueStats, SyncState)
+        .outerjoin(LeagueStats, LeagueStats.league_id == League.id)
+        .outerjoin(SyncState, SyncState.league_id == League.id)
+        .order_by(League.code)
+    ):
         rows.append({
             "league": league.code,
             "adapter_available": league.code in ADAPTERS,
-            "teams": team_count,
-            "games": game_count,
-            "first_season": season_range[0],
-            "last_season": season_range[1],
+            "teams": stats.teams if stats else 0,
+            "games": stats.games if stats else 0,
+            "venues": stats.venues if stats else 0,
+            "first_season": stats.first_season if stats else None,
+            "last_season": stats.last_season if stats else None,
+            "last_game_at": (
+                stats.last_game_at.isoformat() if stats and stats.last_game_at else None
+            ),
             # Nightly-sync fields (enabled defaults true until a row is created)
             "sync_enabled": state.enabled if state else True,
             "last_sync_at": state.last_run_at.isoformat() if state and state.last_run_at else None,
@@ -187,6 +226,134 @@ def data_status(
     return rows
 
 
+def _percentile(ordered: list[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending, non-empty list."""
+    return ordered[max(math.ceil(q * len(ordered)) - 1, 0)]
+
+
+def _latency_summary(durations: list[float]) -> dict:
+    ordered = sorted(durations)
+    return {
+        "requests": len(ordered),
+        "p50_ms": round(_percentile(ordered, 0.50), 1),
+        "p95_ms": round(_percentile(ordered, 0.95), 1),
+        "p99_ms": round(_percentile(ordered, 0.99), 1),
+        "max_ms": round(ordered[-1], 1),
+    }
+
+
+def _run_summary(run: SyncRun, league_code: str) -> dict:
+    rows = run.games_imported + run.games_updated
+    return {
+        "league": league_code,
+        "kind": run.kind,
+        "at": run.started_at.isoformat(),
+        "status": run.status,
+        "error": run.error,
+        "duration_ms": run.duration_ms,
+        "phases_ms": {phase: getattr(run, f"{phase}_ms") for phase in PHASES},
+        "statements": run.statements,
+        "peak_rss_mb": run.peak_rss_mb,
+        "rows": rows,
+        "rows_unchanged": run.rows_unchanged,
+        "rows_per_sec": round(rows * 1000 / run.duration_ms, 1) if run.duration_ms else None,
+        **_fetch_rate([run]),
+    }
+
+
+def _fetch_rate(runs: list[SyncRun]) -> dict:
+    """Request volume and mean fetch time per request — the number that
+    drifts when an upstream slows down, independent of how much was fetched."""
+    requests = sum(r.requests for r in runs)
+    return {
+        "requests": requests,
+        "bytes_downloaded": sum(r.bytes_downloaded for r in runs),
+        "fetch_ms_per_request": round(sum(r.fetch_ms for r in runs) / requests, 1)
+        if requests else None,
+    }
+
+
+@router.get("/perf")
+def performance(
+    hours: int = Query(24, ge=1, le=24 * 30),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    """Recent import runs, per-league throughput and phase breakdown, upstream
+    latency and slowest routes (Admin only)
+
+    Runs come from the sync_runs history; latencies from the perf_samples ring
+    buffer (see core/perf_log), so for those "the last `hours`" is bounded by
+    what the ring still holds.
+    """
+    perf_log.flush(db)
+    cutoff = datetime.now(UTC).replace(tzinfo=None) - timedelta(hours=hours)
+    runs = (
+        db.query(SyncRun, League.code)
+        .join(League, League.id == SyncRun.league_id)
+        .filter(SyncRun.started_at >= cutoff)
+        .order_by(SyncRun.started_at.desc(), SyncRun.id.desc())
+        .all()
+    )
+    samples = db.query(
+        PerfSample.kind, PerfSample.key, PerfSample.duration_ms, PerfSample.status,
+    ).filter(
+        PerfSample.recorded_at >= cutoff, PerfSample.kind.in_(("upstream", "route"))
+    ).all()
+
+    by_league: dict[str, list[SyncRun]] = defaultdict(list)
+    for run, code in runs:
+        by_league[code].append(run)
+    leagues = []
+    for code, league_runs in sorted(by_league.items()):
+        rows = sum(r.games_imported + r.games_updated for r in league_runs)
+        seconds = sum(r.duration_ms for r in league_runs) / 1000
+        phases = {
+            phase: sum(getattr(r, f"{phase}_ms") for r in league_runs) for phase in PHASES
+        }
+        leagues.append({
+            "league": code,
+            "runs": len(league_runs),
+            "errors": sum(r.status == "error" for r in league_runs),
+            "rows": rows,
+            "seconds": round(seconds, 1),
+            "rows_per_sec": round(rows / seconds, 1) if seconds else None,
+            "phases_ms": phases,
+            "slowest_phase": max(phases, key=lambda p: phases[p]) if seconds else None,
+            "peak_rss_mb": max(
+                (r.peak_rss_mb for r in league_runs if r.peak_rss_mb is not None), default=None
+            ),
+            **_fetch_rate(league_runs),
+        })
+
+    upstream_ms: dict[str, list[float]] = defaultdict(list)
+    upstream_errors: dict[str, int] = defaultdict(int)
+    route_ms: dict[str, list[float]] = defaultdict(list)
+    for sample in samples:
+        if sample.kind == "upstream":
+            upstream_ms[sample.key].append(sample.duration_ms)
+            if sample.status == "error" or (sample.status or "").startswith("5"):
+                upstream_errors[sample.key] += 1
+        elif sample.kind == "route":
+            route_ms[sample.key].append(sample.duration_ms)
+
+    routes = sorted(
+        ({"route": route, **_latency_summary(ms)} for route, ms in route_ms.items()),
+        key=lambda r: -r["p95_ms"],
+    )[:SLOWEST_ROUTES]
+
+    return {
+        "hours": hours,
+        "sync_runs": [_run_summary(run, code) for run, code in runs[:RECENT_SYNC_RUNS]],
+        "leagues": leagues,
+        "upstream": [
+            {"host": host, "errors": upstream_errors[host], **_latency_summary(ms)}
+            for host, ms in sorted(upstream_ms.items())
+        ],
+        "routes": routes,
+    }
+
+
 @router.get("/users", response_model=list[UserResponse])
 def list_all_users(
     skip: int = 0,
@@ -1,28 +1,52 @@
+import csv
+import io
+import json
 from collections import defaultdict
-
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.exc import IntegrityError
+from datetime import date
+from typing import Literal
+
+from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile, status
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session, joinedload
 
 from sports_passport.core.dependencies import get_current_user
+from sports_passport.core.export import FORMATS, stream_export
+from sports_passport.core.id_sets import ENCODING, encode_id_set
+from sports_passport.core.projection import ATTENDANCE_LIST, select_attendance_list
+from sports_passport.core.response_cache import revalidated_response
 from sports_passport.db.database import get_db
+from sports_passport.models.atlas import UserAtlasCount
 from sports_passport.models.attendance import UserGameAttendance
 from sports_passport.models.game import Game
+from sports_passport.models.league import League
+from sports_passport.models.team import Team
 from sports_passport.models.user import User
+from sports_passport.models.venue import Venue
 from sports_passport.schemas.attendance import (
+    MAX_BULK_ATTENDANCE,
+    AtlasCounts,
+    AttendanceAtlasResponse,
     AttendanceCreate,
+    AttendanceImportRow,
     AttendanceResponse,
     AttendanceStats,
     AttendanceUpdate,
     AttendanceVenueCount,
     AttendanceVenuePoint,
     AttendanceVenuesResponse,
+    AttendedGameIdsResponse,
     BulkAttendanceRequest,
     BulkAttendanceResponse,
     SeasonBreakdown,
     TopTeamCount,
 )
-from sports_passport.services.adapters.local_time import utc_to_eastern
+from sports_passport.services.adapters.local_time import local_game_date
+from sports_passport.services.atlas import add_games, remove_games
+from sports_passport.services.natural_key import NaturalKeyIndex, day_span
 
 router = APIRouter(prefix="/api/attendance", tags=["attendance"])
 
@@ -31,6 +55,11 @@ router = APIRouter(prefix="/api/attendance", tags=["attendance"])
 # the view grows.
 TOP_TEAM_LIMIT = 12
 
+# Rows per INSERT in the bulk path. Three bound parameters a row keeps each
+# statement far below SQLite's parameter limit while still batching a
+# full-size payload into a couple of dozen statements.
+INSERT_CHUNK_SIZE = 250
+
 
 def _with_game_relations(query):
     """Eager-load everything the serializers and aggregation loops touch,
@@ -43,6 +72,11 @@ def _with_game_relations(query):
     )
 
 
+def _played_on(game: Game) -> date:
+    """The game's stored local day, or its start's for a row written without one."""
+    return game.local_game_date or local_game_date(game.start_date)
+
+
 def _existing_attendance(db: Session, user_id: int, game_id: int):
     """The caller's attendance row for this game, if any.
 
@@ -87,6 +121,7 @@ def mark_game_attended(
     )
 
     db.add(attendance)
+    add_games(db, current_user.id, [attendance.game_id])
     try:
         db.commit()
     except IntegrityError as e:
@@ -109,14 +144,59 @@ def list_attended_games(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """List all games attended by the current user"""
-    attendances = _with_game_relations(
-        db.query(UserGameAttendance).filter(
-            UserGameAttendance.user_id == current_user.id
-        )
-    ).order_by(UserGameAttendance.created_at.desc()).offset(skip).limit(limit).all()
+    """List all games attended by the current user.
+
+    Column-projected rather than ORM-loaded: this is the whole history in one
+    response, and a power user's is thousands of games (see core/projection).
+    """
+    query = select_attendance_list(
+        db.query(UserGameAttendance).filter(UserGameAttendance.user_id == current_user.id)
+    ).order_by(UserGameAttendance.created_at.desc())
+    return JSONResponse(ATTENDANCE_LIST.rows(query.offset(skip).limit(limit)))
+
 
-    return attendances
+@router.get("/game-ids", response_model=AttendedGameIdsResponse)
+def list_attended_game_ids(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """The ids of every game the caller attended, as a compact id set.
+
+    For marking attended games in a list, which needs membership and nothing
+    else: a byte or two per game, read off the (user_id, game_id) unique
+    index, where `GET /` is a nested row per game. Revalidates with
+    If-None-Match to a 304 until the caller's attendance changes.
+    """
+    game_ids = db.scalars(
+        select(UserGameAttendance.game_id).where(UserGameAttendance.user_id == current_user.id)
+    ).all()
+    response = AttendedGameIdsResponse(
+        count=len(game_ids), encoding=ENCODING, ids=encode_id_set(game_ids)
+    )
+    return revalidated_response(request, response.model_dump_json().encode())
+
+
+@router.get("/export")
+def export_attended_games(
+    format: Literal["csv", "jsonl", "ics"] = "csv",
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Download the caller's whole history as CSV, JSON Lines or iCalendar.
+
+    Streamed a batch of rows at a time, so memory stays flat however long the
+    history is (see core/export). A CSV or JSON Lines export can be uploaded
+    back through `POST /import`.
+    """
+    media_type, extension, _ = FORMATS[format]
+    return StreamingResponse(
+        stream_export(db, current_user.id, format),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="sports-passport.{extension}"'
+        },
+    )
 
 
 @router.get("/stats", response_model=AttendanceStats)
@@ -180,11 +260,11 @@ def get_attendance_stats(
         game = attendance.game
         games_by_season[game.season] += 1
         season_games[game.season] += 1
-        # Local wall clock, not the stored UTC instant: a 7:30pm ET kickoff
-        # is stored past midnight UTC and would be counted on the next day.
-        local = utc_to_eastern(game.start_date)
-        games_by_weekday[local.weekday()] += 1
-        games_by_month[local.month] += 1
+        # The stored local day, not the UTC instant: a 7:30pm ET kickoff is
+        # stored past midnight UTC and would be counted on the next day.
+        day = _played_on(game)
+        games_by_weekday[day.weekday()] += 1
+        games_by_month[day.month] += 1
         if game.league:
             games_by_league[game.league.code] += 1
             season_leagues[game.season][game.league.code] += 1
@@ -252,12 +332,12 @@ def get_attendance_stats(
     # they are serialized with a trailing Z, so handing back an Eastern wall
     # clock would have the client shift them a second time.
     longest_gap_days = longest_gap_start = longest_gap_end = None
-    stored_dates = sorted(a.game.start_date for a in attendances)
+    played = sorted((a.game.start_date, _played_on(a.game)) for a in attendances)
     # strict=False on purpose: the offset slice is always one shorter.
-    for earlier, later in zip(stored_dates, stored_dates[1:], strict=False):
+    for (earlier, earlier_day), (later, later_day) in zip(played, played[1:], strict=False):
         # Calendar days, not elapsed time: two games 83h apart are "4 days
         # apart" to a reader, and raw timedelta.days would floor that to 3.
-        gap = (utc_to_eastern(later).date() - utc_to_eastern(earlier).date()).days
+        gap = (later_day - earlier_day).days
         if longest_gap_days is None or gap > longest_gap_days:
             longest_gap_days = gap
             longest_gap_start = earlier
@@ -365,6 +445,38 @@ def get_attendance_venues(
     return AttendanceVenuesResponse(venues=points, games_without_venue=without_venue)
 
 
+@router.get("/atlas", response_model=AttendanceAtlasResponse)
+def get_attendance_atlas(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Per-state and per-venue attended-game counts, split by league.
+
+    Read from the running counts in user_atlas_counts — one row per (venue,
+    league) visited — so the cost follows the venues a user has been to, not
+    the games (see services/atlas.py).
+    """
+    rows = db.query(
+        UserAtlasCount.venue_id, Venue.state, League.code, UserAtlasCount.count
+    ).join(
+        Venue, Venue.id == UserAtlasCount.venue_id
+    ).join(
+        League, League.id == UserAtlasCount.league_id
+    ).filter(UserAtlasCount.user_id == current_user.id)
+
+    states: dict[str, AtlasCounts] = {}
+    venues: dict[int, AtlasCounts] = {}
+    for venue_id, state, league_code, count in rows:
+        targets = [venues.setdefault(venue_id, AtlasCounts(total=0, leagues={}))]
+        if state:
+            targets.append(states.setdefault(state, AtlasCounts(total=0, leagues={})))
+        for target in targets:
+            target.total += count
+            target.leagues[league_code] = target.leagues.get(league_code, 0) + count
+
+    return AttendanceAtlasResponse(states=states, venues=venues)
+
+
 @router.patch("/{attendance_id}", response_model=AttendanceResponse)
 def update_attendance(
     attendance_id: int,
@@ -415,11 +527,110 @@ def delete_attendance(
         )
 
     db.delete(attendance)
+    remove_games(db, current_user.id, [attendance.game_id])
     db.commit()
 
     return None
 
 
+def _known_game_ids(db: Session, game_ids: set[int]) -> set[int]:
+    """Which of these ids name a real game. One query, however many ids.
+
+    A single IN list rather than chunks: the bulk payload is capped at
+    MAX_BULK_ATTENDANCE ids, far under SQLite's 32,766 bound-parameter limit.
+    """
+    if not game_ids:
+        return set()
+    return {gid for (gid,) in db.query(Game.id).filter(Game.id.in_(game_ids))}
+
+
+def _existing_attended_ids(db: Session, user_id: int, game_ids: set[int]) -> set[int]:
+    """Which of these games the caller already has attendance rows for.
+
+    The set-at-a-time counterpart of `_existing_attendance`, and advisory in
+    the same way: a concurrent request's uncommitted rows are invisible here,
+    so the insert below still defers to the unique index.
+    """
+    if not game_ids:
+        return set()
+    return {
+        gid for (gid,) in db.query(UserGameAttendance.game_id).filter(
+            UserGameAttendance.user_id == user_id,
+            UserGameAttendance.game_id.in_(game_ids),
+        )
+    }
+
+
+def _insert_attendance(
+    db: Session, user_id: int, rows: list[tuple[int, str | None]]
+) -> list[int]:
+    """Insert (game_id, notes) rows, skipping any the unique index rejects.
+
+    Returns the game ids actually inserted. ON CONFLICT DO NOTHING is what
+    lets a row that lost the race against a concurrent request cost only
+    itself, without a savepoint per row — and RETURNING reports only the rows
+    that made it, which is what the atlas counts need.
+    """
+    inserted: list[int] = []
+    for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+        chunk = rows[start:start + INSERT_CHUNK_SIZE]
+        stmt = sqlite_insert(UserGameAttendance).values([
+            {"user_id": user_id, "game_id": game_id, "notes": notes}
+            for game_id, notes in chunk
+        ]).on_conflict_do_nothing(
+            index_elements=["user_id", "game_id"]
+        ).returning(UserGameAttendance.game_id)
+        inserted.extend(db.scalars(stmt))
+    return inserted
+
+
+def _mark_attended(
+    db: Session, user_id: int, items: list[tuple[int, str | None]]
+) -> BulkAttendanceResponse:
+    """Shared body of the bulk and import endpoints: validate, dedupe, insert, commit.
+
+    A fixed handful of statements regardless of payload size — one to validate
+    every id, one to find existing attendance, one insert per chunk, one for
+    the atlas counts — where the row-at-a-time version spent three round trips
+    and a savepoint per game.
+    """
+    known = _known_game_ids(db, {game_id for game_id, _ in items})
+    existing = _existing_attended_ids(db, user_id, known)
+
+    errors = []
+    skipped = 0
+    to_insert: list[tuple[int, str | None]] = []
+    # Games staged by this request, so one listed twice in a payload is
+    # skipped rather than counted as a conflict at insert time.
+    pending: set[int] = set()
+    for game_id, notes in items:
+        if game_id not in known:
+            errors.append(f"Game {game_id} not found")
+            continue
+        if game_id in existing or game_id in pending:
+            skipped += 1
+            continue
+        pending.add(game_id)
+        to_insert.append((game_id, notes))
+
+    try:
+        inserted = _insert_attendance(db, user_id, to_insert)
+        add_games(db, user_id, inserted)
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to save attendance records: {str(e)}"
+        ) from e
+
+    # Rows the index turned away were committed by someone else in the
+    # meantime — the same outcome as already being on the log.
+    created = len(inserted)
+    skipped += len(to_insert) - created
+    return BulkAttendanceResponse(created=created, skipped=skipped, errors=errors)
+
+
 @router.post("/bulk", response_model=BulkAttendanceResponse, status_code=status.HTTP_201_CREATED)
 def mark_games_bulk_attended(
     bulk_request: BulkAttendanceRequest,
@@ -427,70 +638,205 @@ def mark_games_bulk_attended(
     current_user: User = Depends(get_current_user)
 ):
     """Mark multiple games as attended in a single request"""
-    created = 0
-    skipped = 0
-    errors = []
-    # Games staged by this request. The session doesn't autoflush, so a game
-    # listed twice in one payload isn't visible to the existing-row query below
-    # and would otherwise violate the unique index at commit time.
-    pending: set[int] = set()
+    return _mark_attended(
+        db, current_user.id, [(item.game_id, item.notes) for item in bulk_request.games]
+    )
 
-    for item in bulk_request.games:
-        try:
-            # Check if game exists
-            game = db.query(Game).filter(Game.id == item.game_id).first()
-            if not game:
-                errors.append(f"Game {item.game_id} not found")
-                continue
 
-            # Check if already marked as attended
-            existing = _existing_attendance(db, current_user.id, item.game_id)
+def _parse_import_file(upload: UploadFile) -> list[dict]:
+    """The raw rows of an uploaded CSV, JSON or JSON Lines history. 400s on anything else.
 
-            if existing or item.game_id in pending:
-                skipped += 1
-                continue
+    Format comes from the file extension, falling back to the content type,
+    because spreadsheet exports are routinely uploaded as
+    application/octet-stream.
+    """
+    name = (upload.filename or "").lower()
+    content_type = upload.content_type or ""
+    try:
+        text = upload.file.read().decode("utf-8-sig")
+    except UnicodeDecodeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="File must be UTF-8 text"
+        ) from e
 
-            pending.add(item.game_id)
+    if name.endswith(".json") or content_type == "application/json":
+        try:
+            payload = json.loads(text)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid JSON: {e}"
+            ) from e
+        # Accept the same {"games": [...]} envelope the bulk endpoint takes, or
+        # a bare list — which is what most hand-rolled exports produce.
+        rows = payload.get("games") if isinstance(payload, dict) else payload
+        if not isinstance(rows, list) or not all(isinstance(r, dict) for r in rows):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="JSON must be a list of objects, or {\"games\": [...]}",
+            )
+        return rows
 
-            # Create attendance record inside a savepoint, so a row that loses
-            # the race against a *concurrent* bulk request costs only itself.
-            # The lookup above can't see uncommitted work in another session,
-            # so without this the unique index would abort the whole
-            # transaction at commit and drop every good row with it.
-            try:
-                with db.begin_nested():
-                    db.add(
-                        UserGameAttendance(
-                            user_id=current_user.id,
-                            game_id=item.game_id,
-                            notes=item.notes
-                        )
-                    )
-            except IntegrityError:
-                # Someone else committed this pair first. It stays in `pending`
-                # so a later copy in this same payload is skipped too, rather
-                # than burning another savepoint to rediscover the conflict.
-                skipped += 1
+    if name.endswith(".jsonl") or content_type == "application/x-ndjson":
+        # One object per line — the shape `GET /export?format=jsonl` writes.
+        rows = []
+        for line_no, line in enumerate(text.splitlines(), start=1):
+            if not line.strip():
                 continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Invalid JSON on line {line_no}: {e}",
+                ) from e
+            if not isinstance(row, dict):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Line {line_no} must be a JSON object",
+                )
+            rows.append(row)
+        return rows
+
+    if name.endswith(".csv") or content_type in ("text/csv", "application/vnd.ms-excel"):
+        reader = csv.DictReader(io.StringIO(text))
+        # Headers are matched case-insensitively: "League,Date,Home,Away" is
+        # how a spreadsheet is most likely to spell them.
+        return [
+            {(k or "").strip().lower(): (v or "").strip() for k, v in row.items()}
+            for row in reader
+        ]
+
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Upload a .csv, .json or .jsonl file",
+    )
+
+
+def _resolve_import_rows(
+    db: Session, rows: list[tuple[int, AttendanceImportRow]]
+) -> tuple[list[tuple[int, str | None]], list[str]]:
+    """Map each numbered (league, date, home, away) row to a game id, in bulk.
 
-            created += 1
+    Two queries in all — every referenced league's teams, then every
+    candidate game across all rows — rather than a lookup per row. Returns the
+    (game_id, notes) pairs that resolved, plus a reason for each that didn't,
+    quoting the row's line number in the uploaded file.
 
-        except Exception as e:
-            errors.append(f"Game {item.game_id}: {str(e)}")
+    Teams match on full name or abbreviation, case-insensitively. A name can
+    belong to several team rows (one per franchise era), so each resolves to
+    a set of ids and any of them may match. The date is the local calendar
+    day of the game, compared the same way the stats page buckets games.
+    """
+    league_ids = {
+        code: league_id
+        for league_id, code in db.query(League.id, League.code).filter(
+            League.code.in_({row.league.upper() for _, row in rows})
+        )
+    }
+    teams_by_key: dict[tuple[int, str], set[int]] = defaultdict(set)
+    for team_id, league_id, name, abbreviation in db.query(
+        Team.id, Team.league_id, Team.name, Team.abbreviation
+    ).filter(Team.league_id.in_(league_ids.values())):
+        for key in (name, abbreviation):
+            if key:
+                teams_by_key[(league_id, key.lower())].add(team_id)
+
+    resolved: list[tuple[int, str | None]] = []
+    errors: list[str] = []
+    wanted = []  # (line, row, league_id, home ids, away ids)
+    for line, row in rows:
+        league_id = league_ids.get(row.league.upper())
+        if league_id is None:
+            errors.append(f"Row {line}: unknown league {row.league!r}")
             continue
+        home_ids = teams_by_key.get((league_id, row.home.lower()))
+        away_ids = teams_by_key.get((league_id, row.away.lower()))
+        if not home_ids or not away_ids:
+            missing = row.home if not home_ids else row.away
+            errors.append(f"Row {line}: unknown {row.league.upper()} team {missing!r}")
+            continue
+        wanted.append((line, row, league_id, home_ids, away_ids))
 
-    # Commit all at once
-    try:
-        db.commit()
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to save attendance records: {str(e)}"
-        ) from e
+    if not wanted:
+        return resolved, errors
 
-    return BulkAttendanceResponse(
-        created=created,
-        skipped=skipped,
-        errors=errors
+    # One range scan covering every row, columns only — nothing here is
+    # written back, so there is no reason to build Game objects.
+    start, end = day_span(
+        min(w[1].game_date for w in wanted), max(w[1].game_date for w in wanted)
     )
+    index = NaturalKeyIndex(
+        db.query(
+            Game.id, Game.league_id, Game.home_team_id, Game.away_team_id,
+            Game.start_date, Game.local_game_date,
+        ).filter(
+            Game.league_id.in_({w[2] for w in wanted}),
+            Game.home_team_id.in_(set().union(*(w[3] for w in wanted))),
+            Game.away_team_id.in_(set().union(*(w[4] for w in wanted))),
+        ),
+        start=start,
+        end=end,
+    )
+
+    for line, row, league_id, home_ids, away_ids in wanted:
+        day = row.game_date
+        matches = [
+            game.id
+            for home_id in home_ids
+            for away_id in away_ids
+            for game in index.on(league_id, home_id, away_id, day)
+        ]
+        if not matches:
+            errors.append(
+                f"Row {line}: no {row.league.upper()} game {row.away} @ {row.home} "
+                f"on {day.isoformat()}"
+            )
+        elif len(matches) > 1:
+            # A doubleheader. Guessing would log the wrong game half the time.
+            errors.append(
+                f"Row {line}: {len(matches)} games {row.away} @ {row.home} on "
+                f"{day.isoformat()}; mark this one by game id instead"
+            )
+        else:
+            resolved.append((matches[0], row.notes))
+    return resolved, errors
+
+
+@router.post(
+    "/import", response_model=BulkAttendanceResponse, status_code=status.HTTP_201_CREATED
+)
+def import_attendance_file(
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Import an attendance history from a CSV, JSON or JSON Lines file.
+
+    Each row names a game the way a person remembers it — league, local date,
+    home team, away team, optional notes — so a history kept in a spreadsheet
+    can be migrated in one request. Rows that don't resolve to exactly one
+    game are reported in `errors`; everything else is marked attended.
+    """
+    raw_rows = _parse_import_file(file)
+    if len(raw_rows) > MAX_BULK_ATTENDANCE:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"At most {MAX_BULK_ATTENDANCE} rows per import; split the file",
+        )
+
+    rows: list[tuple[int, AttendanceImportRow]] = []
+    errors: list[str] = []
+    for line, raw in enumerate(raw_rows, 1):
+        try:
+            # Blank cells mean "not given", so an empty notes column stays null.
+            rows.append((line, AttendanceImportRow.model_validate(
+                {k: v for k, v in raw.items() if v not in ("", None)}
+            )))
+        except ValidationError as e:
+            fields = ", ".join(str(err["loc"][0]) for err in e.errors() if err["loc"])
+            errors.append(f"Row {line}: invalid or missing {fields or 'fields'}")
+
+    resolved, resolve_errors = _resolve_import_rows(db, rows) if rows else ([], [])
+    result = _mark_attended(db, current_user.id, resolved)
+    result.errors = errors + resolve_errors + result.errors
+    return result
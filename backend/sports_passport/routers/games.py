@@ -1,29 +1,36 @@
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import JSONResponse
 from sqlalchemy import and_, func, or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
 
 from sports_passport.core.dependencies import get_current_user
+from sports_passport.core.projection import GAME_LIST_ITEM, select_game_list_items
 from sports_passport.core.queries import LIKE_ESCAPE, contains_pattern
+from sports_passport.core.response_cache import cached_response
 from sports_passport.db.database import get_db
 from sports_passport.models.attendance import UserGameAttendance
 from sports_passport.models.game import Game
 from sports_passport.models.league import League
 from sports_passport.models.team import Team
 from sports_passport.models.user import User
-from sports_passport.schemas.game import GameListResponse, GameResponse, SeasonInfo
+from sports_passport.models.venue import Venue
+from sports_passport.schemas.game import (
+    GameDayCount,
+    GameListItemResponse,
+    GameResponse,
+    SeasonInfo,
+)
+from sports_passport.services.geo import MAX_RADIUS_KM, within
 
 router = APIRouter(prefix="/api/games", tags=["games"])
 
-
-def _with_relations(query):
-    """Eager-load what GameListResponse serializes, avoiding per-row lazy loads."""
-    return query.options(
-        joinedload(Game.league),
-        joinedload(Game.home_team),
-        joinedload(Game.away_team),
-        joinedload(Game.venue),
-    )
+# Widest span /range serves. Its rows come off the local-date index in day
+# order and only each day's games are sorted by kickoff, but a page deep into
+# a decade would still walk every game before it.
+MAX_RANGE_DAYS = 366
 
 
 def _apply_league_filter(query, db: Session, league: str | None):
@@ -48,17 +55,34 @@ def _team_ids_by_name(db: Session, name: str, exact: bool = True) -> list[int]:
     return [t[0] for t in query.all()]
 
 
-@router.get("/", response_model=list[GameListResponse])
+def _venue_ids_near(db: Session, near: str, radius_km: float) -> list[int]:
+    """Ids of venues within `radius_km` of a "lat,lon" point. 400s on a bad point."""
+    try:
+        lat, lon = (float(part) for part in near.split(","))
+    except ValueError:
+        lat = lon = float("nan")
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="near must be 'lat,lon' in degrees"
+        )
+    query = db.query(Venue.id, Venue.latitude, Venue.longitude)
+    return [row.id for row, _ in within(query, lat, lon, radius_km)]
+
+
+@router.get("/", response_model=list[GameListItemResponse])
 def list_games(
     league: str | None = None,
     season: int | None = None,
     team: str | None = None,
+    near: str | None = Query(None, description="'lat,lon': only games at venues within radius_km"),
+    radius_km: float = Query(80, gt=0, le=MAX_RADIUS_KM),
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """List games with optional filters"""
+    """List games with optional filters, each flagged if the caller attended it"""
     query = db.query(Game)
     query = _apply_league_filter(query, db, league)
 
@@ -74,13 +98,14 @@ def list_games(
             )
         )
 
-    query = _with_relations(query).order_by(Game.start_date.desc())
-    games = query.offset(skip).limit(limit).all()
+    if near:
+        query = query.filter(Game.venue_id.in_(_venue_ids_near(db, near, radius_km)))
 
-    return games
+    query = select_game_list_items(query, current_user.id).order_by(Game.start_date.desc())
+    return JSONResponse(GAME_LIST_ITEM.rows(query.offset(skip).limit(limit)))
 
 
-@router.get("/search/", response_model=list[GameListResponse])
+@router.get("/search/", response_model=list[GameListItemResponse])
 def search_games(
     q: str = Query(..., min_length=2),
     league: str | None = None,
@@ -100,32 +125,37 @@ def search_games(
     )
     query = _apply_league_filter(query, db, league)
 
-    games = _with_relations(query).order_by(Game.start_date.desc()).offset(skip).limit(limit).all()
-    return games
+    query = select_game_list_items(query, current_user.id).order_by(Game.start_date.desc())
+    return JSONResponse(GAME_LIST_ITEM.rows(query.offset(skip).limit(limit)))
 
 
 @router.get("/seasons", response_model=list[SeasonInfo])
 def list_seasons(
+    request: Request,
     league: str | None = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get list of all available seasons with game counts"""
-    query = db.query(
-        Game.season,
-        func.count(Game.id).label('game_count')
-    )
-    query = _apply_league_filter(query, db, league)
-    seasons = query.group_by(Game.season).order_by(Game.season.desc()).all()
+    def build():
+        query = db.query(
+            Game.season,
+            func.count(Game.id).label('game_count')
+        )
+        query = _apply_league_filter(query, db, league)
+        seasons = query.group_by(Game.season).order_by(Game.season.desc()).all()
+
+        return [
+            {"season": season, "game_count": count}
+            for season, count in seasons
+        ]
 
-    return [
-        {"season": season, "game_count": count}
-        for season, count in seasons
-    ]
+    return cached_response(request, list[SeasonInfo], build)
 
 
 @router.get("/count")
 def count_games(
+    request: Request,
     league: str | None = None,
     season: int | None = None,
     team: str | None = None,
@@ -133,26 +163,96 @@ def count_games(
     current_user: User = Depends(get_current_user)
 ):
     """Count games matching filters"""
-    query = db.query(func.count(Game.id))
+    def build():
+        query = db.query(func.count(Game.id))
+        query = _apply_league_filter(query, db, league)
+
+        if season:
+            query = query.filter(Game.season == season)
+
+        if team:
+            team_ids = _team_ids_by_name(db, team)
+            query = query.filter(
+                or_(
+                    Game.home_team_id.in_(team_ids),
+                    Game.away_team_id.in_(team_ids)
+                )
+            )
+
+        count = query.scalar()
+        return {"count": count}
+
+    return cached_response(request, dict[str, int], build)
+
+
+@router.get("/on/{day}", response_model=list[GameListItemResponse])
+def list_games_on(
+    day: date,
+    league: str | None = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Every game played on a local calendar day, in kickoff order.
+
+    `day` is the date a person would name — the game's local date, not its
+    UTC instant — read off the games.local_game_date index.
+    """
+    query = db.query(Game).filter(Game.local_game_date == day)
     query = _apply_league_filter(query, db, league)
+    query = select_game_list_items(query, current_user.id).order_by(Game.start_date, Game.id)
+    return JSONResponse(GAME_LIST_ITEM.rows(query))
 
-    if season:
-        query = query.filter(Game.season == season)
 
-    if team:
-        team_ids = _team_ids_by_name(db, team)
-        query = query.filter(
-            or_(
-                Game.home_team_id.in_(team_ids),
-                Game.away_team_id.in_(team_ids)
-            )
+@router.get("/range", response_model=list[GameListItemResponse])
+def list_games_between(
+    start: date,
+    end: date,
+    league: str | None = None,
+    skip: int = 0,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Games played from `start` to `end` inclusive, by local date, oldest first"""
+    if end < start or (end - start).days >= MAX_RANGE_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"end must be on or after start, and at most {MAX_RANGE_DAYS} days on"
         )
+    query = db.query(Game).filter(Game.local_game_date.between(start, end))
+    query = _apply_league_filter(query, db, league)
+    query = select_game_list_items(query, current_user.id).order_by(
+        Game.local_game_date, Game.start_date, Game.id
+    )
+    return JSONResponse(GAME_LIST_ITEM.rows(query.offset(skip).limit(limit)))
 
-    count = query.scalar()
-    return {"count": count}
 
+@router.get("/calendar", response_model=list[GameDayCount])
+def game_calendar(
+    request: Request,
+    season: int,
+    league: str | None = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Games per local day across a season, for the calendar heatmap.
+
+    With a league, one range of ix_games_league_season_day; either way the
+    counts are built once per catalog change and served from the response
+    cache after that.
+    """
+    def build():
+        query = db.query(Game.local_game_date, func.count()).filter(
+            Game.season == season, Game.local_game_date.is_not(None)
+        )
+        query = _apply_league_filter(query, db, league)
+        days = query.group_by(Game.local_game_date).order_by(Game.local_game_date).all()
+        return [{"day": day, "game_count": count} for day, count in days]
+
+    return cached_response(request, list[GameDayCount], build)
 
-@router.get("/team/{team_id}", response_model=list[GameListResponse])
+
+@router.get("/team/{team_id}", response_model=list[GameListItemResponse])
 def list_team_games(
     team_id: int,
     season: int | None = None,
@@ -190,23 +290,27 @@ def list_team_games(
     if season:
         query = query.filter(Game.season == season)
 
-    games = _with_relations(query).order_by(Game.start_date.desc()).offset(skip).limit(limit).all()
-    return games
+    query = select_game_list_items(query, current_user.id).order_by(Game.start_date.desc())
+    return JSONResponse(GAME_LIST_ITEM.rows(query.offset(skip).limit(limit)))
 
 
 @router.get("/{game_id}", response_model=GameResponse)
 def get_game(
     game_id: int,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get game details by ID"""
-    game = db.query(Game).filter(Game.id == game_id).first()
+    def build():
+        game = db.query(Game).filter(Game.id == game_id).first()
 
-    if not game:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Game not found"
-        )
+        if not game:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Game not found"
+            )
+
+        return game
 
-    return game
+    return cached_response(request, GameResponse, build)
@@ -3,8 +3,6 @@ import logging
 import secrets
 from datetime import UTC, datetime, timedelta
 
-import mailtrap as mt
-import sentry_sdk
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
@@ -21,6 +19,10 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/auth", tags=["authentication"])
 
 
+class _EmailNotSent(Exception):
+    """Mailtrap rejected or failed the send; the cause is chained."""
+
+
 def _hash_token(token: str) -> str:
     return hashlib.sha256(token.encode()).hexdigest()
 
@@ -43,6 +45,10 @@ def _send_reset_email(to_email: str, to_name: str, reset_url: str) -> None:
             )
         return
 
+    # Imported here rather than at module load: the Mailtrap SDK costs about
+    # a third of a second to import, and only a configured server sends mail.
+    import mailtrap as mt
+
     client = mt.MailtrapClient(token=settings.mailtrap_api_key)
     mail = mt.Mail(
         sender=mt.Address(email=settings.from_email, name=settings.from_name),
@@ -67,7 +73,10 @@ def _send_reset_email(to_email: str, to_name: str, reset_url: str) -> None:
         ),
         category="Password Reset",
     )
-    client.send(mail)
+    try:
+        client.send(mail)
+    except (mt.AuthorizationError, mt.APIError) as e:
+        raise _EmailNotSent(str(e)) from e
     logger.info("Password reset email sent to %s", to_email)
 
 
@@ -100,12 +109,14 @@ def forgot_password(
             _send_reset_email(to_email=user.email, to_name=user.full_name, reset_url=reset_url)
             db.commit()
             logger.info("Password reset requested for user_id=%s", user.id)
-        except (mt.AuthorizationError, mt.APIError) as e:
+        except _EmailNotSent as e:
             # The response stays generic (non-enumerating), so the user only
             # learns the mail never arrived. Report to Sentry so the failure
             # reaches an admin instead of dying in the container logs.
+            import sentry_sdk
+
             logger.error("Password reset email failed for user_id=%s: %s", user.id, e)
-            sentry_sdk.capture_exception(e)
+            sentry_sdk.capture_exception(e.__cause__)
             db.rollback()
 
     return {"message": "If that email is registered, a reset link has been sent."}
@@ -1,11 +1,12 @@
 from collections import Counter
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session
 
 from sports_passport.core.dependencies import get_current_user
 from sports_passport.core.queries import LIKE_ESCAPE, contains_pattern
+from sports_passport.core.response_cache import cached_response
 from sports_passport.db.database import get_db
 from sports_passport.models.attendance import UserGameAttendance
 from sports_passport.models.game import Game
@@ -42,6 +43,7 @@ def _attended_counts(db: Session, user_id: int, team_ids: list[int]) -> Counter:
 
 @router.get("/", response_model=list[TeamResponse])
 def list_teams(
+    request: Request,
     league: str | None = None,
     conference: str | None = None,
     search: str | None = None,
@@ -54,39 +56,41 @@ def list_teams(
     current_user: User = Depends(get_current_user)
 ):
     """List all teams with optional filters"""
-    query = db.query(Team)
-
-    if league:
-        league_row = db.query(League).filter(League.code == league.upper()).first()
-        if not league_row:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Unknown league: {league}"
+    def build():
+        query = db.query(Team)
+
+        if league:
+            league_row = db.query(League).filter(League.code == league.upper()).first()
+            if not league_row:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Unknown league: {league}"
+                )
+            query = query.filter(Team.league_id == league_row.id)
+
+        # CFB-specific fbs/fcs filter; pass 'all' or omit for everything
+        if classification and classification.lower() != "all":
+            query = query.filter(
+                Team.classification.ilike(contains_pattern(classification), escape=LIKE_ESCAPE)
             )
-        query = query.filter(Team.league_id == league_row.id)
 
-    # CFB-specific fbs/fcs filter; pass 'all' or omit for everything
-    if classification and classification.lower() != "all":
-        query = query.filter(
-            Team.classification.ilike(contains_pattern(classification), escape=LIKE_ESCAPE)
-        )
+        if conference:
+            query = query.filter(
+                Team.conference.ilike(contains_pattern(conference), escape=LIKE_ESCAPE)
+            )
 
-    if conference:
-        query = query.filter(
-            Team.conference.ilike(contains_pattern(conference), escape=LIKE_ESCAPE)
-        )
+        if search:
+            query = query.filter(Team.name.ilike(contains_pattern(search), escape=LIKE_ESCAPE))
 
-    if search:
-        query = query.filter(Team.name.ilike(contains_pattern(search), escape=LIKE_ESCAPE))
+        if franchise_id is not None:
+            query = query.filter(Team.franchise_id == franchise_id)
 
-    if franchise_id is not None:
-        query = query.filter(Team.franchise_id == franchise_id)
+        if active_only:
+            query = query.filter(Team.last_season.is_(None))
 
-    if active_only:
-        query = query.filter(Team.last_season.is_(None))
+        return query.order_by(Team.name).offset(skip).limit(limit).all()
 
-    teams = query.order_by(Team.name).offset(skip).limit(limit).all()
-    return teams
+    return cached_response(request, list[TeamResponse], build)
 
 
 @router.get("/search", response_model=list[TeamSearchResult])
@@ -230,14 +234,18 @@ def team_attendance_stats(
 @router.get("/{team_id}", response_model=TeamResponse)
 def get_team(
     team_id: int,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get a single team by ID"""
-    team = db.query(Team).filter(Team.id == team_id).first()
-    if not team:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Team not found"
-        )
-    return team
+    def build():
+        team = db.query(Team).filter(Team.id == team_id).first()
+        if not team:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Team not found"
+            )
+        return team
+
+    return cached_response(request, TeamResponse, build)
@@ -0,0 +1,160 @@
+import math
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy import Integer, cast, func
+from sqlalchemy.orm import Session
+
+from sports_passport.core.dependencies import get_current_user
+from sports_passport.core.response_cache import cached_response
+from sports_passport.db.database import get_db
+from sports_passport.models.game import Game
+from sports_passport.models.league import League
+from sports_passport.models.user import User
+from sports_passport.models.venue import Venue
+from sports_passport.schemas.venue import (
+    VenueClustersResponse,
+    VenueNearResponse,
+    VenueResponse,
+)
+from sports_passport.services.geo import MAX_RADIUS_KM, BoundingBox, within
+
+router = APIRouter(prefix="/api/venues", tags=["venues"])
+
+# Grid cells per map tile edge. A tile is 256px, so 4 gives ~64px cells: about
+# a marker's width, which is the distance below which two markers would overlap
+# anyway.
+CELLS_PER_TILE = 4
+MAX_ZOOM = 20
+
+
+def _snap_to_tiles(west: float, south: float, east: float, north: float, zoom: int):
+    """The box grown outward to whole tiles of the zoom's degree grid.
+
+    Every pan inside the same tiles then asks the same question, so it can be
+    answered from the response cache; and as tile edges are cell edges, no
+    cluster is cut in two by the edge of the box.
+
+    A box crossing the antimeridian (west > east) grows toward it from both
+    sides; once its edges meet or pass, it covers every longitude.
+    """
+    tile = 360.0 / (2 ** zoom)
+    snapped_west = max(-180.0, math.floor((west + 180.0) / tile) * tile - 180.0)
+    snapped_east = min(180.0, math.ceil((east + 180.0) / tile) * tile - 180.0)
+    if west > east and snapped_west <= snapped_east:
+        snapped_west, snapped_east = -180.0, 180.0
+    return (
+        snapped_west,
+        max(-90.0, math.floor((south + 90.0) / tile) * tile - 90.0),
+        snapped_east,
+        min(90.0, math.ceil((north + 90.0) / tile) * tile - 90.0),
+    )
+
+
+def _league_venue_ids(db: Session, league: str):
+    """Subquery of venues that have hosted a game in `league`. 404s on unknown code."""
+    league_row = db.query(League).filter(League.code == league.upper()).first()
+    if not league_row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown league: {league}"
+        )
+    return db.query(Game.venue_id).filter(Game.league_id == league_row.id)
+
+
+@router.get("/clusters", response_model=VenueClustersResponse)
+def venue_clusters(
+    request: Request,
+    west: float = Query(..., ge=-180, le=180),
+    south: float = Query(..., ge=-90, le=90),
+    east: float = Query(..., ge=-180, le=180),
+    north: float = Query(..., ge=-90, le=90),
+    zoom: int = Query(..., ge=0, le=MAX_ZOOM),
+    league: str | None = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Every placed venue in a viewport, pre-clustered for the given zoom.
+
+    The whole atlas (all leagues, all eras) is thousands of venues; shipping
+    them all for the client to cluster made every pan and zoom pay for the
+    continent. Here the bounding box is a range scan on ix_venues_lat_lon and
+    the clustering is a GROUP BY over a zoom-sized grid, so the response is
+    bounded by what fits on screen rather than by the catalog.
+
+    The grid is in degrees, not Web Mercator: cells get taller on screen
+    toward the poles, which at US latitudes costs nothing visible and keeps
+    the cell arithmetic inside plain SQLite.
+
+    The box is widened to whole tiles before anything else (see
+    `_snap_to_tiles`), so a response may carry clusters just off screen, and
+    the cache holds one entry per tile range rather than one per pan.
+    """
+    if south > north:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="south must be <= north"
+        )
+
+    west, south, east, north = _snap_to_tiles(west, south, east, north, zoom)
+
+    def build():
+        cell = 360.0 / (2 ** zoom) / CELLS_PER_TILE
+        # Offsetting into positive range makes CAST's truncation a floor.
+        cell_x = cast((Venue.longitude + 180.0) / cell, Integer).label("cell_x")
+        cell_y = cast((Venue.latitude + 90.0) / cell, Integer).label("cell_y")
+
+        query = db.query(
+            func.count(Venue.id),
+            func.avg(Venue.latitude),
+            func.avg(Venue.longitude),
+            func.min(Venue.id),
+            func.min(Venue.name),
+        ).filter(BoundingBox(west, south, east, north).clause())
+
+        if league:
+            query = query.filter(Venue.id.in_(_league_venue_ids(db, league)))
+
+        clusters = []
+        total = 0
+        for count, lat, lon, venue_id, name in query.group_by(cell_x, cell_y):
+            total += count
+            single = count == 1
+            clusters.append({
+                "latitude": lat,
+                "longitude": lon,
+                "venue_count": count,
+                "venue_id": venue_id if single else None,
+                "name": name if single else None,
+            })
+        clusters.sort(key=lambda c: -c["venue_count"])
+        return {"zoom": zoom, "venue_count": total, "clusters": clusters}
+
+    key = f"{request.url.path}?{(west, south, east, north, zoom, (league or '').upper())}"
+    return cached_response(request, VenueClustersResponse, build, key=key)
+
+
+@router.get("/near", response_model=list[VenueNearResponse])
+def venues_near(
+    request: Request,
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    radius_km: float = Query(100, gt=0, le=MAX_RADIUS_KM),
+    league: str | None = None,
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Placed venues within `radius_km` of a point, nearest first.
+
+    See services/geo.py for how the radius is answered from the lat/lon index.
+    """
+    def build():
+        query = db.query(Venue)
+        if league:
+            query = query.filter(Venue.id.in_(_league_venue_ids(db, league)))
+        return [
+            {**VenueResponse.model_validate(venue).model_dump(), "distance_km": distance}
+            for venue, distance in within(query, lat, lon, radius_km)[:limit]
+        ]
+
+    return cached_response(request, list[VenueNearResponse], build)
@@ -1,10 +1,14 @@
-from datetime import datetime
+from datetime import date, datetime
 
 from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 from sports_passport.core.serializers import naive_utc_isoformat
 from sports_passport.schemas.game import GameListResponse
 
+# Upper bound on games marked per bulk request or import file. A lifetime of
+# attendance is a few thousand games; larger histories can be split.
+MAX_BULK_ATTENDANCE = 5000
+
 
 class AttendanceBase(BaseModel):
     game_id: int
@@ -30,6 +34,13 @@ class AttendanceResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class AttendedGameIdsResponse(BaseModel):
+    """The caller's attended game ids, packed (see core/id_sets)."""
+    count: int
+    encoding: str
+    ids: str
+
+
 class AttendanceVenueCount(BaseModel):
     """Attended-game count for one venue, for maps and most-visited lists."""
     # Distinct venues can share a name and city (three separate "Madison Square
@@ -128,6 +139,22 @@ class AttendanceVenuesResponse(BaseModel):
     games_without_venue: int  # attended games whose game row has no venue yet
 
 
+class AtlasCounts(BaseModel):
+    total: int
+    leagues: dict[str, int]  # league code -> games
+
+
+class AttendanceAtlasResponse(BaseModel):
+    """Attended-game counts for the atlas choropleth and its league filter.
+
+    Keyed maps rather than lists so the map can look a region up directly.
+    Games without a venue, and venues without a state, are not counted in
+    `states`; the venue map covers the former.
+    """
+    states: dict[str, AtlasCounts]  # venue state, as stored
+    venues: dict[int, AtlasCounts]  # venue id
+
+
 class BulkAttendanceItem(BaseModel):
     """Single game attendance item for bulk operations"""
     game_id: int
@@ -138,10 +165,24 @@ class BulkAttendanceRequest(BaseModel):
     """Request to mark multiple games as attended.
 
     Capped so an oversized payload is rejected during parsing rather than
-    turning into an unbounded row-by-row loop; a lifetime of attendance is a
-    few thousand games, and imports can be split across requests.
+    turning into an unbounded request; a lifetime of attendance is a few
+    thousand games, and imports can be split across requests.
     """
-    games: list[BulkAttendanceItem] = Field(..., max_length=5000)
+    games: list[BulkAttendanceItem] = Field(..., max_length=MAX_BULK_ATTENDANCE)
+
+
+class AttendanceImportRow(BaseModel):
+    """One row of an uploaded history, naming a game by what a person remembers.
+
+    `date` is the local calendar day the game was played, not the stored UTC
+    instant — a 7:30pm kickoff is logged on the day it happened.
+    """
+    league: str
+    # Aliased because a field literally named `date` shadows the type.
+    game_date: date = Field(validation_alias="date")
+    home: str
+    away: str
+    notes: str | None = None
 
 
 class BulkAttendanceResponse(BaseModel):
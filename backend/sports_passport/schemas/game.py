@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 
 from pydantic import BaseModel, ConfigDict, field_serializer
 
@@ -68,7 +68,18 @@ class GameListResponse(BaseModel):
         return naive_utc_isoformat(value)
 
 
+class GameListItemResponse(GameListResponse):
+    """A game list row, flagged with whether the caller attended it."""
+    attended: bool = False
+
+
 class SeasonInfo(BaseModel):
     """Season metadata with game count"""
     season: int
     game_count: int
+
+
+class GameDayCount(BaseModel):
+    """Games played on one local calendar day, for the calendar heatmap"""
+    day: date
+    game_count: int
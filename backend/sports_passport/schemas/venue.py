@@ -21,3 +21,26 @@ class VenueResponse(VenueBase):
     longitude: float | None = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class VenueNearResponse(VenueResponse):
+    distance_km: float  # great-circle, from the query point
+
+
+class VenueCluster(BaseModel):
+    """Venues sharing one grid cell at the requested zoom, drawn as one marker.
+
+    A cluster of one carries that venue's identity so the map can label and
+    link it; larger clusters carry only the count, at the venues' mean position.
+    """
+    latitude: float
+    longitude: float
+    venue_count: int
+    venue_id: int | None = None
+    name: str | None = None
+
+
+class VenueClustersResponse(BaseModel):
+    zoom: int
+    venue_count: int  # venues inside the bounding box, across all clusters
+    clusters: list[VenueCluster]
@@ -2,29 +2,60 @@
 
 Adding a league = writing one adapter module and registering it here
 (plus a row in the leagues seed).
+
+Adapter modules are imported on first use, not with this package. Several
+carry large literal tables (team aliases, arena histories) and pull in the
+importer, and most processes — the API serving a page, a test that never
+imports anything — only need to know which codes *have* an adapter. So the
+registry maps codes to import paths; `code in ADAPTERS` and `ADAPTERS.keys()`
+import nothing, and `ADAPTERS[code]` loads that one module.
 """
+from collections.abc import Iterator, Mapping
+from importlib import import_module
+
 from sqlalchemy.orm import Session
 
 from sports_passport.services.adapters.base import ImportResult, LeagueAdapter
-from sports_passport.services.adapters.cbb import CbbAdapter
-from sports_passport.services.adapters.cfb import CfbAdapter
-from sports_passport.services.adapters.mlb import MlbAdapter
-from sports_passport.services.adapters.mls import MlsAdapter
-from sports_passport.services.adapters.nba import NbaAdapter
-from sports_passport.services.adapters.nfl import NflAdapter
-from sports_passport.services.adapters.nhl import NhlAdapter
-
-ADAPTERS: dict[str, type[LeagueAdapter]] = {
-    CfbAdapter.league_code: CfbAdapter,
-    NhlAdapter.league_code: NhlAdapter,
-    NflAdapter.league_code: NflAdapter,
-    MlbAdapter.league_code: MlbAdapter,
-    NbaAdapter.league_code: NbaAdapter,
-    CbbAdapter.league_code: CbbAdapter,
-    MlsAdapter.league_code: MlsAdapter,
+
+_ADAPTER_PATHS = {
+    "CFB": "sports_passport.services.adapters.cfb:CfbAdapter",
+    "NHL": "sports_passport.services.adapters.nhl:NhlAdapter",
+    "NFL": "sports_passport.services.adapters.nfl:NflAdapter",
+    "MLB": "sports_passport.services.adapters.mlb:MlbAdapter",
+    "NBA": "sports_passport.services.adapters.nba:NbaAdapter",
+    "CBB": "sports_passport.services.adapters.cbb:CbbAdapter",
+    "MLS": "sports_passport.services.adapters.mls:MlsAdapter",
 }
 
 
+class _LazyAdapters(Mapping[str, type[LeagueAdapter]]):
+    """League code -> adapter class, importing each adapter module on first lookup."""
+
+    def __init__(self, paths: dict[str, str]):
+        self._paths = paths
+        self._loaded: dict[str, type[LeagueAdapter]] = {}
+
+    def __getitem__(self, code: str) -> type[LeagueAdapter]:
+        adapter = self._loaded.get(code)
+        if adapter is None:
+            module, _, name = self._paths[code].partition(":")
+            adapter = getattr(import_module(module), name)
+            self._loaded[code] = adapter
+        return adapter
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._paths
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+
+ADAPTERS: Mapping[str, type[LeagueAdapter]] = _LazyAdapters(_ADAPTER_PATHS)
+
+
 def get_adapter(league_code: str, db: Session) -> LeagueAdapter:
     """Instantiate the adapter for a league code. Raises KeyError if unknown."""
     return ADAPTERS[league_code.upper()](db)
@@ -8,13 +8,21 @@ Contract (see docs/SP3_plan.md §4):
 
 All methods are idempotent upserts keyed on (source, source_*_id).
 """
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from datetime import date
+from datetime import date, datetime
 
 import httpx
 from sqlalchemy.orm import Session
 
+from sports_passport.core.resilient_http import upstream_transport
+from sports_passport.services.adapters.payload_archive import (
+    PayloadArchive,
+    RecordingTransport,
+    ReplayTransport,
+)
+
 
 @dataclass
 class ImportResult:
@@ -46,6 +54,7 @@ class LeagueAdapter(ABC):
     def __init__(self, db: Session):
         self.db = db
         self._http: httpx.AsyncClient | None = None
+        self._replay: ReplayTransport | None = None
 
     @property
     def http(self) -> httpx.AsyncClient:
@@ -55,14 +64,45 @@ class LeagueAdapter(ABC):
         per request would pay a fresh TCP+TLS handshake for each. Created
         lazily so adapters that never touch the network (NBA reads a local
         CSV) don't open one, and so tests can patch `_get` without a client
-        ever existing. Callers own the lifecycle via `aclose`.
+        ever existing. Callers own the lifecycle via `aclose`. Requests are
+        retried, rate-capped and circuit-broken per host (core/resilient_http),
+        timed per host on /metrics (core/metrics), and kept in the payload
+        archive when it is enabled.
         """
         if self._http is None:
+            transport: httpx.AsyncBaseTransport
+            if self._replay is not None:
+                transport = self._replay
+            else:
+                # Recording reads the body through the instrumented stream, so
+                # download bytes and time are still counted; it keeps only the
+                # response a retry finally got.
+                transport = upstream_transport()
+                archive = PayloadArchive(self.league_code)
+                if archive.enabled:
+                    transport = RecordingTransport(transport, archive)
             self._http = httpx.AsyncClient(
-                timeout=self.http_timeout_seconds, **self.http_client_kwargs
+                timeout=self.http_timeout_seconds,
+                transport=transport,
+                **self.http_client_kwargs,
             )
         return self._http
 
+    def replay_from_archive(self, as_of: datetime | None = None) -> None:
+        """Answer every request from the payload archive instead of the network.
+
+        Each request gets the latest archived response for it, or the latest
+        fetched by `as_of` (naive UTC). Call before the first request.
+        """
+        if self._http is not None:
+            raise RuntimeError("replay must be chosen before the first request")
+        self._replay = ReplayTransport(PayloadArchive(self.league_code), as_of)
+
+    async def _throttle(self, seconds: float) -> None:
+        """Pause between requests to a rate-limited API; not when replaying."""
+        if self._replay is None:
+            await asyncio.sleep(seconds)
+
     async def aclose(self) -> None:
         """Release pooled connections. Safe to call when none were opened."""
         if self._http is not None:
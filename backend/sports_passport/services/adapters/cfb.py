@@ -11,7 +11,13 @@ from typing import Any
 from sports_passport.core.config import settings
 from sports_passport.models.team import Team
 from sports_passport.services.adapters.base import ImportResult, LeagueAdapter
-from sports_passport.services.importer import get_league, upsert_game, upsert_team, upsert_venue
+from sports_passport.services.importer import (
+    ImportMemoryExceeded,
+    get_league,
+    upsert_game,
+    upsert_team,
+    upsert_venue,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +81,8 @@ class CfbAdapter(LeagueAdapter):
                 seen.add(team_data.get("id"))
                 if self._upsert_team_row(league.id, team_data, "fcs"):
                     result.teams_imported += 1
+        except ImportMemoryExceeded:
+            raise  # the run's memory ceiling, not an FCS problem
         except Exception as e:
             result.errors.append(f"FCS team import skipped: {e}")
 
@@ -17,7 +17,7 @@ spot-check of Pistons @ Warriors 2026-01-30 against ESPN confirmed the
 stored 22:00 is 10:00pm ET, not 10:00pm Pacific. See
 docs/SP3_open_issues.md #7.
 """
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
 from zoneinfo import ZoneInfo
 
 EASTERN = ZoneInfo("America/New_York")
@@ -68,6 +68,16 @@ def utc_to_eastern(stored: datetime) -> datetime:
     return stored.replace(tzinfo=UTC).astimezone(EASTERN).replace(tzinfo=None)
 
 
+def local_game_date(stored: datetime) -> date:
+    """The calendar day a stored game was played on, as a person would say it.
+
+    Eastern, for the reasons `utc_to_eastern` gives. Date-only rows are parked
+    at noon UTC, which is the same day in every US timezone, so this holds for
+    has_time=False rows too. Stored on every game as `games.local_game_date`.
+    """
+    return utc_to_eastern(stored).date()
+
+
 def date_only(day: datetime) -> datetime:
     """The stored instant for a game we know the date of but not the time.
 
@@ -38,6 +38,7 @@ from sports_passport.core.config import settings
 from sports_passport.models.team import Team
 from sports_passport.services.adapters import local_time
 from sports_passport.services.adapters.base import ImportResult, LeagueAdapter
+from sports_passport.services.bulk_merge import GameBatch
 from sports_passport.services.importer import get_league, upsert_game, upsert_team, upsert_venue
 
 # MLB Stats API gameType -> our season_type; spring training/exhibition/all-star skipped
@@ -166,8 +167,8 @@ class MlbAdapter(LeagueAdapter):
         teams = self.db.query(Team).filter(Team.league_id == league_id).all()
         return {t.source_team_id: t.id for t in teams if t.source_team_id}
 
-    def _upsert_row(
-        self, league_id: int, row: list[str], season: int,
+    def _stage_row(
+        self, batch: GameBatch, league_id: int, row: list[str], season: int,
         by_code: dict, parks: dict, venue_cache: dict, result: ImportResult,
         season_type: str = "regular",
     ) -> None:
@@ -219,10 +220,8 @@ class MlbAdapter(LeagueAdapter):
         game_number = row[F_GAME_NUM]  # "0"=single, "1"/"2"/"3"/"A"/"B"=doubleheader games
         source_game_id = f"{row[F_DATE]}_{vis_code}_{home_code}_{game_number}"
 
-        _, created = upsert_game(
-            self.db,
-            source=self.source,
-            source_game_id=source_game_id,
+        batch.add(
+            source_game_id,
             league_id=league_id,
             home_team_id=home_id,
             away_team_id=away_id,
@@ -237,10 +236,6 @@ class MlbAdapter(LeagueAdapter):
             attendance=attendance,
             overtime_flag=overtime_flag,
         )
-        if created:
-            result.games_imported += 1
-        else:
-            result.games_updated += 1
 
     async def import_season(self, season: int) -> ImportResult:
         result = ImportResult(league=self.league_code)
@@ -250,10 +245,10 @@ class MlbAdapter(LeagueAdapter):
         venue_cache: dict[str, int] = {}
 
         rows = await self._get_gamelog_rows(season)
+        batch = GameBatch(self.db, self.source)
         for row in rows:
-            self._upsert_row(league.id, row, season, by_code, parks, venue_cache, result)
-
-        self.db.commit()
+            self._stage_row(batch, league.id, row, season, by_code, parks, venue_cache, result)
+        batch.merge_into(result)
         logger.info("MLB season %s: %s games imported, %s updated",
                     season, result.games_imported, result.games_updated)
         return result
@@ -271,6 +266,7 @@ class MlbAdapter(LeagueAdapter):
         by_code = self._team_lookup(league.id)
         parks = await self._park_lookup()
         venue_cache: dict[str, int] = {}
+        batch = GameBatch(self.db, self.source)
 
         for code in POSTSEASON_FILE_CODES:
             for row in await self._get_postseason_rows(code):
@@ -279,10 +275,10 @@ class MlbAdapter(LeagueAdapter):
                 season = int(row[F_DATE][:4])
                 if not start_season <= season <= end_season:
                     continue
-                self._upsert_row(league.id, row, season, by_code, parks, venue_cache,
-                                 result, season_type="postseason")
+                self._stage_row(batch, league.id, row, season, by_code, parks, venue_cache,
+                                result, season_type="postseason")
 
-        self.db.commit()
+        batch.merge_into(result)
         logger.info("MLB postseason %s-%s: %s games imported, %s updated",
                     start_season, end_season, result.games_imported, result.games_updated)
         return result
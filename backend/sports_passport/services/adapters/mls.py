@@ -70,6 +70,7 @@ from sports_passport.core.config import settings
 from sports_passport.models.team import Team
 from sports_passport.services.adapters import local_time, venue_seed
 from sports_passport.services.adapters.base import ImportResult, LeagueAdapter
+from sports_passport.services.bulk_merge import GameBatch
 from sports_passport.services.importer import get_league, upsert_game, upsert_team, upsert_venue
 
 logger = logging.getLogger(__name__)
@@ -534,6 +535,7 @@ class MlsAdapter(LeagueAdapter):
         by_name = self._teams_by_name(league.id)
         by_source_id = self._teams_by_source_id(league.id)
         venue_cache: dict[str, int | None] = {}
+        batch = GameBatch(self.db, self.source)
 
         # Both ends are clamped to the era this source owns, rather than
         # trusting the caller's range: `admin.py` accepts start_season down to
@@ -590,10 +592,8 @@ class MlsAdapter(LeagueAdapter):
             # unique across the era.
             source_game_id = f"kaggle-{game_day:%Y-%m-%d}-{_slug(home_raw)}-{_slug(away_raw)}"
 
-            _, created = upsert_game(
-                self.db,
-                source=self.source,
-                source_game_id=source_game_id,
+            batch.add(
+                source_game_id,
                 league_id=league.id,
                 home_team_id=home_id,
                 away_team_id=away_id,
@@ -610,11 +610,7 @@ class MlsAdapter(LeagueAdapter):
                 attendance=_int_or_none(row.get("attendance")),
                 overtime_flag="SO" if (row.get("shootout") or "").strip() else None,
             )
-            if created:
-                result.games_imported += 1
-            else:
-                result.games_updated += 1
-        self.db.commit()
+        batch.merge_into(result)
 
     # ------------------------------------------------------------- Contract
 
@@ -23,7 +23,9 @@ two on (league, home, away, start +/- NATURAL_KEY_WINDOW) so that
 re-downloading Games.csv later updates the synced row instead of duplicating
 it. That window is deliberately narrow and the match must be unique — the
 same two teams meet on consecutive nights often enough that a wider one
-would overwrite one real game with another.
+would overwrite one real game with another. Both directions look the key up
+in a `NaturalKeyIndex` built once per run (services/natural_key.py) rather
+than querying once per row.
 
 Team identity: NBA's numeric team id is stable across every relocation/
 rename in league history (id 1610612760 is both the Seattle SuperSonics
@@ -43,7 +45,7 @@ Venue caveat: Games.csv only carries arena/city/state/attendance for the
 dataset's most recent season as of this writing (the dataset's own
 description says older entries are being backfilled by its maintainer
 over time) — historical rows arrive with no arena data at all. For those,
-`_upsert_row` falls back to the hand-built `sports_passport/data/seed/nba_arenas.csv`
+`_stage_row` falls back to the hand-built `sports_passport/data/seed/nba_arenas.csv`
 (team → arena → season range, 1990-present); older-still games remain
 venue_id = NULL.
 """
@@ -61,7 +63,10 @@ from sports_passport.models.game import Game
 from sports_passport.models.team import Team
 from sports_passport.services.adapters import local_time, venue_seed
 from sports_passport.services.adapters.base import ImportResult, LeagueAdapter
+from sports_passport.services.adapters.scoreboard_cache import ScoreboardCache
+from sports_passport.services.bulk_merge import GameBatch
 from sports_passport.services.importer import get_league, upsert_game, upsert_team, upsert_venue
+from sports_passport.services.natural_key import NaturalKeyIndex, day_span
 
 logger = logging.getLogger(__name__)
 
@@ -101,12 +106,25 @@ ESPN_HEADERS = {
 # All-Star) is not a countable game and is skipped.
 ESPN_SEASON_TYPES = {1: "preseason", 2: "regular", 3: "postseason"}
 
-# Polite spacing between ESPN scoreboard calls; a sync window is a handful of days.
-ESPN_THROTTLE_SECONDS = 0.5
+# A sync window of this many uncached days or more is fetched with the
+# scoreboard's range form (dates=YYYYMMDD-YYYYMMDD): one call instead of one
+# per day. Shorter runs go day by day, which is as cheap and is also the path
+# every range falls back to, so the nightly sync keeps it exercised.
+ESPN_RANGE_MIN_DAYS = 3
+# Longest single range request. A full NBA slate is 15 games, so 14 days stays
+# far below ESPN_RANGE_LIMIT; a response that reaches the limit may have been
+# cut short, and is refetched day by day rather than trusted.
+ESPN_RANGE_MAX_DAYS = 14
+ESPN_RANGE_LIMIT = 500
+
+# Polite ceiling on simultaneous per-day scoreboard calls. Replaces a fixed
+# 0.5s sleep between strictly sequential days, which made a recovery sync
+# after a two-week outage take dozens of serialized round trips.
+ESPN_MAX_CONCURRENT_FETCHES = 4
 
 # How far apart the same game may look between the two sources. Both now
 # store UTC (the Kaggle rows are converted from Eastern on import, see
-# _upsert_row), so the two should agree to the minute; the window absorbs a
+# _stage_row), so the two should agree to the minute; the window absorbs a
 # source disagreeing about a rescheduled tip-off, and any row still carrying
 # a pre-conversion Eastern time — at most 5h off.
 #
@@ -124,6 +142,46 @@ def _season_from_game_id(game_id: str) -> int:
     return 2000 + d if d <= 45 else 1900 + d
 
 
+def _espn_start(event: dict) -> datetime | None:
+    """An ESPN event's tip-off as naive UTC, or None when it is missing/garbled."""
+    try:
+        return datetime.strptime(event["date"], "%Y-%m-%dT%H:%MZ")
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _espn_status(event: dict) -> dict:
+    """The event's status.type block ({} when absent): state, name, completed."""
+    competition = (event.get("competitions") or [{}])[0]
+    return (competition.get("status") or {}).get("type") or {}
+
+
+def _is_final_scoreboard(payload: dict) -> bool:
+    """True when every game on a day's scoreboard is over, so it cannot change.
+
+    An empty day is not final: an off night and a transient empty response
+    look the same, and caching the latter would hide that day's games for good.
+    A postponed game is not `completed` either, so its day stays uncached
+    until it is made up.
+    """
+    events = payload.get("events") or []
+    return bool(events) and all(
+        _espn_start(event) is not None and _espn_status(event).get("completed") is True
+        for event in events
+    )
+
+
+def _consecutive_runs(days: list[date], max_len: int) -> list[list[date]]:
+    """Split sorted `days` into runs of consecutive dates, none longer than max_len."""
+    runs: list[list[date]] = []
+    for day in days:
+        if runs and day - runs[-1][-1] == ONE_DAY and len(runs[-1]) < max_len:
+            runs[-1].append(day)
+        else:
+            runs.append([day])
+    return runs
+
+
 def _team_key(team_id: str, city: str, name: str) -> str:
     return f"{team_id}:{city}:{name}"
 
@@ -198,8 +256,9 @@ class NbaAdapter(LeagueAdapter):
         teams = self.db.query(Team).filter(Team.league_id == league_id).all()
         return {t.source_team_id: t.id for t in teams if t.source_team_id}
 
-    def _upsert_row(self, league_id: int, row: dict, by_key: dict, venue_cache: dict,
-                    result: ImportResult, synced_index: dict | None = None) -> None:
+    def _stage_row(self, batch: GameBatch, league_id: int, row: dict, by_key: dict,
+                   venue_cache: dict, result: ImportResult,
+                   synced_index: NaturalKeyIndex | None = None) -> None:
         game_type = row["gameType"]
         season_type = GAME_TYPES.get(game_type)
         if season_type is None:
@@ -304,10 +363,8 @@ class NbaAdapter(LeagueAdapter):
                 synced_index, league_id, home_id, away_id, start_date, row["gameId"]
             )
 
-        _, created = upsert_game(
-            self.db,
-            source=self.source,
-            source_game_id=row["gameId"],
+        batch.add(
+            row["gameId"],
             league_id=league_id,
             home_team_id=home_id,
             away_team_id=away_id,
@@ -321,10 +378,6 @@ class NbaAdapter(LeagueAdapter):
             neutral_site=False,
             attendance=attendance,
         )
-        if created:
-            result.games_imported += 1
-        else:
-            result.games_updated += 1
 
     async def import_historical(self, start_season: int, end_season: int) -> ImportResult:
         result = ImportResult(league=self.league_code)
@@ -336,15 +389,16 @@ class NbaAdapter(LeagueAdapter):
         synced_index = self._synced_row_index(league.id)
 
         rows = self._read_games_csv()
+        batch = GameBatch(self.db, self.source)
         for row in rows:
             if row["gameType"] not in GAME_TYPES:
                 continue
             season = _season_from_game_id(row["gameId"])
             if season < start_season or season > end_season:
                 continue
-            self._upsert_row(league.id, row, by_key, venue_cache, result, synced_index)
+            self._stage_row(batch, league.id, row, by_key, venue_cache, result, synced_index)
 
-        self.db.commit()
+        batch.merge_into(result)
         logger.info(
             "NBA import: %s games imported, %s updated",
             result.games_imported,
@@ -364,6 +418,101 @@ class NbaAdapter(LeagueAdapter):
         response.raise_for_status()
         return response.json()
 
+    async def _fetch_scoreboard_range(self, first: date, last: date) -> dict:
+        response = await self.http.get(
+            f"{settings.espn_api_url}/basketball/nba/scoreboard",
+            params={
+                "dates": f"{first:%Y%m%d}-{last:%Y%m%d}",
+                "limit": ESPN_RANGE_LIMIT,
+            },
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def _range_scoreboards(self, days: list[date]) -> dict[date, dict] | None:
+        """One range call for consecutive `days`, split back into per-day payloads.
+
+        Events are assigned to the US Eastern day they tip off on, which is
+        the day ESPN's `dates` parameter means. Returns None — and the caller
+        fetches those days one by one — when the range call fails, looks
+        truncated, or carries an event outside the requested days: each is a
+        sign the range form cannot be trusted for this window.
+        """
+        first, last = days[0], days[-1]
+        try:
+            payload = await self._fetch_scoreboard_range(first, last)
+        except (httpx.HTTPError, ValueError) as e:
+            logger.info("NBA sync: range %s..%s failed (%r); fetching per day", first, last, e)
+            return None
+        events = payload.get("events")
+        if not isinstance(events, list) or len(events) >= ESPN_RANGE_LIMIT:
+            logger.info("NBA sync: range %s..%s unusable; fetching per day", first, last)
+            return None
+
+        boards: dict[date, dict] = {day: {"events": []} for day in days}
+        for event in events:
+            start = _espn_start(event)
+            day = local_time.utc_to_eastern(start).date() if start else first
+            if day not in boards:
+                logger.info("NBA sync: range %s..%s strayed to %s; fetching per day",
+                            first, last, day)
+                return None
+            boards[day]["events"].append(event)
+        return boards
+
+    async def _scoreboards(
+        self, since: date, today: date, cache: ScoreboardCache, result: ImportResult,
+    ) -> list[tuple[date, dict]]:
+        """Every scoreboard from `since` through `today`, in day order.
+
+        Cached days cost nothing; runs of at least ESPN_RANGE_MIN_DAYS
+        uncached days go out as range calls; whatever is left is fetched per
+        day, ESPN_MAX_CONCURRENT_FETCHES at a time. A day that fails is
+        reported and skipped, exactly as before.
+        """
+        boards: dict[date, dict] = {}
+        missing: list[date] = []
+        day = since
+        while day <= today:
+            cached = cache.get(day)
+            if cached is not None:
+                boards[day] = cached
+            else:
+                missing.append(day)
+            day += ONE_DAY
+
+        per_day: list[date] = []
+        for run in _consecutive_runs(missing, ESPN_RANGE_MAX_DAYS):
+            split = (
+                await self._range_scoreboards(run) if len(run) >= ESPN_RANGE_MIN_DAYS else None
+            )
+            if split is None:
+                per_day.extend(run)
+            else:
+                boards.update(split)
+
+        limit = asyncio.Semaphore(ESPN_MAX_CONCURRENT_FETCHES)
+
+        async def fetch(day: date) -> tuple[date, dict | str]:
+            async with limit:
+                try:
+                    return day, await self._fetch_scoreboard(day)
+                except (httpx.HTTPError, ValueError) as e:
+                    return day, f"{day.isoformat()}: fetch failed ({e!r})"
+
+        # gather keeps request order, so errors read in day order however the
+        # calls happened to finish.
+        for day, outcome in await asyncio.gather(*(fetch(d) for d in per_day)):
+            if isinstance(outcome, str):
+                result.errors.append(outcome)
+            else:
+                boards[day] = outcome
+
+        for day in missing:
+            if day in boards and day < today and _is_final_scoreboard(boards[day]):
+                cache.put(day, boards[day])
+        return sorted(boards.items())
+
     def _active_team_by_name(self, league_id: int) -> dict[str, int]:
         """ESPN displayName -> db team id, active era only.
 
@@ -379,8 +528,8 @@ class NbaAdapter(LeagueAdapter):
         ).all()
         return {t.name: t.id for t in teams}
 
-    def _synced_row_index(self, league_id: int) -> dict[tuple, list[Game]]:
-        """Every ESPN-synced row for this league, grouped by matchup.
+    def _synced_row_index(self, league_id: int) -> NaturalKeyIndex:
+        """Every ESPN-synced row for this league, indexed by natural key.
 
         Built once per import: a full backfill calls the adoption check 73k+
         times, and a per-row query against a column with no selective index
@@ -388,18 +537,16 @@ class NbaAdapter(LeagueAdapter):
         ever a handful of espn- rows (one sync window's worth), so holding them
         in memory costs nothing.
         """
-        synced = self.db.query(Game).filter(
-            Game.league_id == league_id,
-            Game.source == self.source,
-            Game.source_game_id.like("espn-%"),
-        ).all()
-        index: dict[tuple, list[Game]] = {}
-        for game in synced:
-            index.setdefault((game.home_team_id, game.away_team_id), []).append(game)
-        return index
+        return NaturalKeyIndex(
+            self.db.query(Game).filter(
+                Game.league_id == league_id,
+                Game.source == self.source,
+                Game.source_game_id.like("espn-%"),
+            )
+        )
 
     def _adopt_synced_row(
-        self, index: dict, league_id: int, home_id: int, away_id: int,
+        self, index: NaturalKeyIndex, league_id: int, home_id: int, away_id: int,
         start: datetime, game_id: str,
     ) -> None:
         """Re-key an ESPN-synced row onto its real NBA gameId, if one exists.
@@ -410,13 +557,7 @@ class NbaAdapter(LeagueAdapter):
         distinct games. Consecutive-night repeat matchups make that last guard
         load-bearing, not theoretical.
         """
-        bucket = index.get((home_id, away_id))
-        if not bucket:
-            return
-        candidates = [
-            g for g in bucket
-            if abs(g.start_date - start) <= NATURAL_KEY_WINDOW
-        ]
+        candidates = index.near(league_id, home_id, away_id, start, NATURAL_KEY_WINDOW)
         if len(candidates) != 1:
             return
 
@@ -429,23 +570,29 @@ class NbaAdapter(LeagueAdapter):
 
         adopted = candidates[0]
         adopted.source_game_id = game_id
-        bucket.remove(adopted)          # never adopt the same row twice
+        index.discard(adopted)          # never adopt the same row twice
         self.db.flush()
 
-    def _candidates_in_window(
-        self, league_id: int, home_id: int, away_id: int, start: datetime
-    ) -> list[Game]:
-        return self.db.query(Game).filter(
-            Game.league_id == league_id,
-            Game.source == self.source,
-            Game.home_team_id == home_id,
-            Game.away_team_id == away_id,
-            Game.start_date >= start - NATURAL_KEY_WINDOW,
-            Game.start_date <= start + NATURAL_KEY_WINDOW,
-        ).all()
+    def _sync_window_index(self, league_id: int, since: date, until: date) -> NaturalKeyIndex:
+        """This league's games around the sync window, indexed by natural key.
+
+        One query up front instead of one per ESPN event. An event dated
+        outside the window (ESPN's scoreboard for a day can carry a game
+        rescheduled elsewhere) still resolves: the index falls back to a probe
+        on ix_games_natural_key for anything it did not load.
+        """
+        start, end = day_span(since - ONE_DAY, until)
+        return NaturalKeyIndex(
+            self.db.query(Game).filter(
+                Game.league_id == league_id, Game.source == self.source
+            ),
+            start=start,
+            end=end,
+        )
 
     def _find_by_natural_key(
-        self, league_id: int, home_id: int, away_id: int, start: datetime
+        self, index: NaturalKeyIndex, league_id: int, home_id: int, away_id: int,
+        start: datetime,
     ) -> tuple[Game | None, bool]:
         """The existing row for this matchup. Returns (game, ambiguous).
 
@@ -459,7 +606,7 @@ class NbaAdapter(LeagueAdapter):
         picking the wrong one silently rewrites a real game's date and score,
         and would drag any attendance record along with it.
         """
-        candidates = self._candidates_in_window(league_id, home_id, away_id, start)
+        candidates = index.near(league_id, home_id, away_id, start, NATURAL_KEY_WINDOW)
         if not candidates:
             return None, False
         if len(candidates) > 1:
@@ -473,23 +620,14 @@ class NbaAdapter(LeagueAdapter):
         venue_cache: dict[str, int] = {}
         skips: Counter = Counter()
 
-        day = since
         today = date.today()
-        first = True
-        while day <= today:
-            if not first:
-                await asyncio.sleep(ESPN_THROTTLE_SECONDS)
-            first = False
-            try:
-                payload = await self._fetch_scoreboard(day)
-            except (httpx.HTTPError, ValueError) as e:
-                result.errors.append(f"{day.isoformat()}: fetch failed ({e!r})")
-                day += ONE_DAY
-                continue
-
+        index = self._sync_window_index(league.id, since, today)
+        boards = await self._scoreboards(since, today, ScoreboardCache("nba"), result)
+        for _, payload in boards:
             for event in payload.get("events", []):
-                self._upsert_espn_event(league.id, event, by_name, venue_cache, result, skips)
-            day += ONE_DAY
+                self._upsert_espn_event(
+                    league.id, event, by_name, venue_cache, index, result, skips
+                )
 
         self.db.commit()
         for reason, count in skips.items():
@@ -546,7 +684,7 @@ class NbaAdapter(LeagueAdapter):
 
     def _upsert_espn_event(
         self, league_id: int, event: dict, by_name: dict, venue_cache: dict,
-        result: ImportResult, skips: Counter,
+        index: NaturalKeyIndex, result: ImportResult, skips: Counter,
     ) -> bool:
         """Returns False when the event was skipped (not an error).
 
@@ -600,9 +738,8 @@ class NbaAdapter(LeagueAdapter):
             skips[f"unknown team(s): {', '.join(str(u) for u in unknown)}"] += 1
             return False
 
-        try:
-            start_date = datetime.strptime(event["date"], "%Y-%m-%dT%H:%MZ")
-        except (KeyError, ValueError):
+        start_date = _espn_start(event)
+        if start_date is None:
             result.errors.append(f"event {event.get('id')}: bad date {event.get('date')!r}")
             return True
 
@@ -610,8 +747,7 @@ class NbaAdapter(LeagueAdapter):
         # game comes back with state "post" and score "0", so a state-based
         # check would write a phantom 0-0 final -- and overwrite a real score
         # with it if the game had already been played and later corrected.
-        status_type = (competition.get("status") or {}).get("type") or {}
-        if status_type.get("completed"):
+        if _espn_status(event).get("completed"):
             home_score = _int_or_none(home.get("score"))
             away_score = _int_or_none(away.get("score"))
         else:
@@ -640,7 +776,9 @@ class NbaAdapter(LeagueAdapter):
             "neutral_site": bool(competition.get("neutralSite")),
         }
 
-        existing, ambiguous = self._find_by_natural_key(league_id, home_id, away_id, start_date)
+        existing, ambiguous = self._find_by_natural_key(
+            index, league_id, home_id, away_id, start_date
+        )
         if ambiguous:
             result.errors.append(
                 f"event {event.get('id')}: {start_date.isoformat()} matches more than one "
@@ -663,15 +801,17 @@ class NbaAdapter(LeagueAdapter):
                 ):
                     continue
                 setattr(existing, key, value)
+            index.add(existing)         # start_date may have moved
             result.games_updated += 1
             return True
 
-        upsert_game(
+        game, _ = upsert_game(
             self.db,
             source=self.source,
             source_game_id=f"espn-{event['id']}",
             league_id=league_id,
             **fields,
         )
+        index.add(game)
         result.games_imported += 1
         return True
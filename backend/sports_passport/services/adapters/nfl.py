@@ -87,7 +87,8 @@ from sports_passport.core.config import settings
 from sports_passport.models.team import Team
 from sports_passport.services.adapters import local_time, venue_seed
 from sports_passport.services.adapters.base import ImportResult, LeagueAdapter
-from sports_passport.services.importer import get_league, upsert_game, upsert_team, upsert_venue
+from sports_passport.services.bulk_merge import GameBatch
+from sports_passport.services.importer import get_league, upsert_team, upsert_venue
 
 logger = logging.getLogger(__name__)
 
@@ -366,7 +367,8 @@ class NflAdapter(LeagueAdapter):
         teams = self.db.query(Team).filter(Team.league_id == league_id).all()
         return {t.source_team_id: t.id for t in teams if t.source_team_id}
 
-    def _upsert_row(self, league_id: int, row: dict, by_abbrev: dict, result: ImportResult) -> None:
+    def _stage_row(self, batch: GameBatch, league_id: int, row: dict, by_abbrev: dict,
+                   venue_cache: dict[str, int], result: ImportResult) -> None:
         home_id = by_abbrev.get(row["home_team"])
         away_id = by_abbrev.get(row["away_team"])
         if home_id is None or away_id is None:
@@ -380,9 +382,9 @@ class NflAdapter(LeagueAdapter):
             result.errors.append(f"game {row['game_id']}: bad date {row.get('gameday')!r}")
             return
 
-        venue_id = None
         stadium_id = row.get("stadium_id")
-        if stadium_id:
+        venue_id = venue_cache.get(stadium_id) if stadium_id else None
+        if stadium_id and venue_id is None:
             seed = venue_seed.nfl_stadiums().get(stadium_id)
             venue, created = upsert_venue(
                 self.db,
@@ -397,14 +399,12 @@ class NflAdapter(LeagueAdapter):
                 name=(seed["name"] if seed else row.get("stadium") or stadium_id),
                 **(venue_seed.venue_fields(seed) if seed else {}),
             )
-            venue_id = venue.id
+            venue_id = venue_cache[stadium_id] = venue.id
             if created:
                 result.venues_imported += 1
 
-        _, created = upsert_game(
-            self.db,
-            source=self.source,
-            source_game_id=row["game_id"],
+        batch.add(
+            row["game_id"],
             league_id=league_id,
             home_team_id=home_id,
             away_team_id=away_id,
@@ -419,10 +419,6 @@ class NflAdapter(LeagueAdapter):
             neutral_site=row.get("location") == "Neutral",
             overtime_flag="OT" if row.get("overtime") == "1" else None,
         )
-        if created:
-            result.games_imported += 1
-        else:
-            result.games_updated += 1
 
     async def _import_games(
         self, result: ImportResult, *,
@@ -432,6 +428,8 @@ class NflAdapter(LeagueAdapter):
         league = get_league(self.db, self.league_code)
         by_abbrev = self._team_lookup(league.id)
         games = await self._get_csv(GAMES_URL)
+        batch = GameBatch(self.db, self.source)
+        venue_cache: dict[str, int] = {}
         for row in games:
             season = int(row["season"])
             if min_season is not None and season < min_season:
@@ -442,8 +440,8 @@ class NflAdapter(LeagueAdapter):
                 gameday = row.get("gameday")
                 if not gameday or date.fromisoformat(gameday) < since:
                     continue
-            self._upsert_row(league.id, row, by_abbrev, result)
-        self.db.commit()
+            self._stage_row(batch, league.id, row, by_abbrev, venue_cache, result)
+        batch.merge_into(result)
         logger.info(
             "NFL import: %s games imported, %s updated",
             result.games_imported,
@@ -539,6 +537,7 @@ class NflAdapter(LeagueAdapter):
         league = get_league(self.db, self.league_code)
         venue_cache: dict[str, int | None] = {}
         unmapped_venues: set[str] = set()
+        batch = GameBatch(self.db, self.source)
 
         for row in rows:
             season = int(row["schedule_season"])
@@ -558,15 +557,10 @@ class NflAdapter(LeagueAdapter):
                 continue
 
             week_raw = (row.get("schedule_week") or "").strip()
-            _, created = upsert_game(
-                self.db,
-                source=self.source,
+            batch.add(
                 # No stable id in this file, so key on the natural one. Verified
                 # unique across 1970-1998.
-                source_game_id=(
-                    f"spreadspoke-{game_day:%Y-%m-%d}-"
-                    f"{_slug(home_raw)}-{_slug(away_raw)}"
-                ),
+                f"spreadspoke-{game_day:%Y-%m-%d}-{_slug(home_raw)}-{_slug(away_raw)}",
                 league_id=league.id,
                 home_team_id=home_id,
                 away_team_id=away_id,
@@ -591,11 +585,7 @@ class NflAdapter(LeagueAdapter):
                 ),
                 neutral_site=row.get("stadium_neutral") == "TRUE",
             )
-            if created:
-                result.games_imported += 1
-            else:
-                result.games_updated += 1
-        self.db.commit()
+        batch.merge_into(result)
         logger.info(
             "NFL Spreadspoke import: %s games imported, %s updated",
             result.games_imported, result.games_updated,
@@ -9,13 +9,14 @@ sync (single-source league). Endpoints verified live:
     https://api-web.nhle.com/v1/club-schedule-season/{TRICODE}/{SEASONID}
 - Standings on a date (which teams played that season):
     https://api-web.nhle.com/v1/standings/{YYYY-MM-DD}
-- Scores by date (sync):
+- League schedule, seven days from a date (sync):
+    https://api-web.nhle.com/v1/schedule/{YYYY-MM-DD}
+- Scores by date (sync, only for days with a game in progress):
     https://api-web.nhle.com/v1/score/{YYYY-MM-DD}
 
 `season` is stored as the start year (1993 = the 1993-94 season); the API's
 seasonId is f"{year}{year+1}". gameType: 1=preseason, 2=regular, 3=postseason.
 """
-import asyncio
 import logging
 from datetime import date, datetime, timedelta
 from typing import Any, Literal, overload
@@ -32,6 +33,11 @@ TEAMS_URL = "https://api.nhle.com/stats/rest/en/team"
 GAME_TYPES = {1: "preseason", 2: "regular", 3: "postseason"}
 # Be polite to the free API during the big one-time backfill
 BACKFILL_DELAY_SECONDS = 0.25
+# Days one /schedule/{date} page covers.
+SCHEDULE_WEEK_DAYS = 7
+# gameState of a game still being played. Its schedule row lags the live
+# score, so its day is re-read from /score/{date}.
+IN_PROGRESS_STATES = {"LIVE", "CRIT"}
 
 
 class NhlAdapter(LeagueAdapter):
@@ -197,7 +203,7 @@ class NhlAdapter(LeagueAdapter):
             payload = await self._get(
                 f"{settings.nhl_api_url}/club-schedule-season/{tricode}/{season_id}", ok_404=True
             )
-            await asyncio.sleep(BACKFILL_DELAY_SECONDS)
+            await self._throttle(BACKFILL_DELAY_SECONDS)
             if not payload:
                 continue
             for game in payload.get("games", []):
@@ -220,24 +226,55 @@ class NhlAdapter(LeagueAdapter):
         return result
 
     async def sync_recent(self, since: date) -> ImportResult:
+        """Re-import games from `since` through today.
+
+        Walks the window a week at a time: one /schedule/{date} page carries
+        seven days of games, final scores included, where /score/{date}
+        carries one (plus neighbouring days' games, which it repeats). Only
+        days with a game still in progress are fetched from /score/{date}.
+        """
         result = ImportResult(league=self.league_code)
         league = get_league(self.db, self.league_code)
         by_source_id, by_abbrev = self._team_lookups(league.id)
 
+        first, last = since.isoformat(), date.today().isoformat()
+        games: dict[str, dict] = {}
+        live_days: set[str] = set()
         day = since
-        today = date.today()
-        while day <= today:
+        while day <= date.today():
             payload = await self._get(
-                f"{settings.nhl_api_url}/score/{day.isoformat()}", ok_404=True
+                f"{settings.nhl_api_url}/schedule/{day.isoformat()}", ok_404=True
             )
-            if payload:
-                for game in payload.get("games", []):
-                    # /score/{date} includes surrounding days; only take the target date
-                    if game.get("gameDate") != day.isoformat():
-                        continue
-                    self._upsert_api_game(league.id, game, by_source_id, by_abbrev, result)
-            day += timedelta(days=1)
+            week = (payload or {}).get("gameWeek", [])
+            for game_day in week:
+                game_date = game_day.get("date")
+                if not game_date or not first <= game_date <= last:
+                    continue
+                for game in game_day.get("games", []):
+                    # Schedule rows leave the date to their day; _parse_start
+                    # falls back to it when there is no start time.
+                    games.setdefault(str(game.get("id")), {"gameDate": game_date, **game})
+                    if game.get("gameState") in IN_PROGRESS_STATES:
+                        live_days.add(game_date)
+            # Carry on after the last day the page covered; an empty page or
+            # a 404 still moves a week on.
+            covered = max((d["date"] for d in week if d.get("date")), default=None)
+            next_day = (
+                date.fromisoformat(covered) + timedelta(days=1)
+                if covered
+                else day + timedelta(days=SCHEDULE_WEEK_DAYS)
+            )
+            day = max(next_day, day + timedelta(days=1))
+
+        for game_date in sorted(live_days):
+            payload = await self._get(f"{settings.nhl_api_url}/score/{game_date}", ok_404=True)
+            for game in (payload or {}).get("games", []):
+                game_id = str(game.get("id"))
+                if game.get("gameDate") == game_date and game_id in games:
+                    games[game_id] = game
 
+        for game in games.values():
+            self._upsert_api_game(league.id, game, by_source_id, by_abbrev, result)
         self.db.commit()
         return result
 
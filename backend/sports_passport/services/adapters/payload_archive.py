@@ -0,0 +1,176 @@
+"""Archive of raw upstream responses, for re-importing without re-downloading.
+
+Adapters parse each response straight into upserts, so fixing a parser used
+to mean a data migration or fetching decades again from rate-limited APIs.
+With the archive enabled, every response an adapter's client receives is
+kept under `settings.data_dir`/archive (the Docker bind-mount volume):
+
+* blobs/ab/abcd….gz — the decoded body, gzipped and named by its SHA-256.
+  A body fetched again unchanged (a finished season, a team list) is stored
+  once, however many times it is fetched.
+* index/{LEAGUE}.jsonl — one line per response, appended: method, URL,
+  endpoint and query params, status, the headers a replay needs, body hash
+  and size, and when it was fetched. Request headers (API keys) are not kept.
+
+`RecordingTransport` sits under the adapter's client and records as
+responses arrive. Replay mode (`LeagueAdapter.replay_from_archive`) swaps the
+network out for `ReplayTransport`, which answers each request with the
+latest archived response for the same method and URL — or the latest one
+fetched by `as_of` — so an import re-runs at local-disk speed against exactly
+what was downloaded. A request that was never archived fails with
+`NotArchived`, a transport error, which adapters already handle as a failed
+fetch.
+
+Like the scoreboard cache, a failed write is logged and dropped: the archive
+can never fail an import. A torn final index line (a killed process) is
+skipped on load.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from datetime import UTC, datetime
+
+import httpx
+
+from sports_passport.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Response headers a replay needs to behave like the original: how to parse
+# the body, and where a redirect pointed.
+REPLAYED_HEADERS = ("content-type", "location")
+
+
+class NotArchived(httpx.TransportError):
+    """Replay asked for a request the archive has no response for."""
+
+
+class PayloadArchive:
+    def __init__(self, league: str):
+        self.league = league
+        self.enabled = settings.payload_archive_enabled
+        self.directory = os.path.join(settings.data_dir, "archive")
+        self.index_path = os.path.join(self.directory, "index", f"{league}.jsonl")
+        # (method, url) -> entries, oldest first; loaded on first lookup.
+        self._index: dict[tuple[str, str], list[dict]] | None = None
+
+    def _blob_path(self, sha256: str) -> str:
+        return os.path.join(self.directory, "blobs", sha256[:2], f"{sha256}.gz")
+
+    def record(self, request: httpx.Request, response: httpx.Response, body: bytes) -> None:
+        """Keep one response. `body` is the decoded content."""
+        if not self.enabled:
+            return
+        sha256 = hashlib.sha256(body).hexdigest()
+        entry = {
+            "method": request.method,
+            "url": str(request.url),
+            "endpoint": f"{request.url.host}{request.url.path}",
+            "params": dict(request.url.params),
+            "status": response.status_code,
+            "headers": {k: response.headers[k] for k in REPLAYED_HEADERS if k in response.headers},
+            "sha256": sha256,
+            "bytes": len(body),
+            "fetched_at": datetime.now(UTC).replace(tzinfo=None).isoformat(),
+        }
+        try:
+            self._write_blob(sha256, body)
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            with open(self.index_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+        except OSError as e:
+            logger.warning("Payload archive: could not record %s (%r)", entry["url"], e)
+            return
+        if self._index is not None:
+            self._index.setdefault((entry["method"], entry["url"]), []).append(entry)
+
+    def _write_blob(self, sha256: str, body: bytes) -> None:
+        path = self._blob_path(sha256)
+        if os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write-then-rename, so a reader never sees half a blob.
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(path), delete=False) as tmp:
+            tmp.write(gzip.compress(body))
+        os.replace(tmp.name, path)
+
+    def _load(self) -> dict[tuple[str, str], list[dict]]:
+        if self._index is None:
+            self._index = {}
+            try:
+                with open(self.index_path, encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                            key = (entry["method"], entry["url"])
+                        except (ValueError, KeyError, TypeError):
+                            continue  # a torn final line from an interrupted run
+                        self._index.setdefault(key, []).append(entry)
+            except FileNotFoundError:
+                pass
+        return self._index
+
+    def lookup(self, method: str, url: str, as_of: datetime | None = None) -> dict | None:
+        """The latest entry for a request, or the latest fetched by `as_of`."""
+        cutoff = as_of.isoformat() if as_of is not None else None
+        for entry in reversed(self._load().get((method, url), [])):
+            if cutoff is None or entry["fetched_at"] <= cutoff:
+                return entry
+        return None
+
+    def read_body(self, sha256: str) -> bytes:
+        with open(self._blob_path(sha256), "rb") as f:
+            return gzip.decompress(f.read())
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Pass requests through to `inner`, archiving each response."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, archive: PayloadArchive):
+        self._inner = inner
+        self._archive = archive
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self._inner.handle_async_request(request)
+        stream = response.stream
+        if not isinstance(stream, httpx.AsyncByteStream):
+            return response
+        try:
+            raw = b"".join([chunk async for chunk in stream])
+        finally:
+            await stream.aclose()
+        # Rebuilt from the raw bytes with the original headers, so the client
+        # decodes it exactly as it would have; the archive keeps the decoded body.
+        rebuilt = httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            content=raw,
+            extensions=response.extensions,
+        )
+        self._archive.record(request, rebuilt, rebuilt.content)
+        return rebuilt
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Answer requests from the archive; nothing goes to the network."""
+
+    def __init__(self, archive: PayloadArchive, as_of: datetime | None = None):
+        self._archive = archive
+        self._as_of = as_of
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        entry = self._archive.lookup(request.method, str(request.url), self._as_of)
+        if entry is None:
+            raise NotArchived(f"no archived response for {request.method} {request.url}",
+                              request=request)
+        return httpx.Response(
+            entry["status"],
+            headers=entry["headers"],
+            content=self._archive.read_body(entry["sha256"]),
+        )
@@ -0,0 +1,57 @@
+"""On-disk cache of finished ESPN scoreboard days.
+
+A day whose games are all final never changes again, yet every sync window
+that covers it — the nightly lookback overlaps the previous night's by design,
+and a recovery sync after an outage (see scheduler.compute_since) re-covers
+weeks — fetched it afresh. Caching those days makes re-running a window cost
+only the days that can still change.
+
+One JSON file per (sport, day) under `settings.data_dir`/cache/espn, which is
+the Docker bind-mount volume and so survives container rebuilds. The cache
+decides nothing about *what* is cacheable; the adapter only `put`s a day once
+it has checked every game on it is final. A missing, unreadable or corrupt
+file is simply a miss, and a failed write is logged and dropped — the cache
+can only ever save a request, never fail a sync.
+"""
+import json
+import logging
+import os
+from datetime import date
+
+from sports_passport.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ScoreboardCache:
+    def __init__(self, sport: str):
+        self.enabled = settings.espn_cache_enabled
+        self.directory = os.path.join(settings.data_dir, "cache", "espn", sport)
+
+    def _path(self, day: date) -> str:
+        return os.path.join(self.directory, f"{day:%Y%m%d}.json")
+
+    def get(self, day: date) -> dict | None:
+        if not self.enabled:
+            return None
+        try:
+            with open(self._path(day), encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return payload if isinstance(payload, dict) else None
+
+    def put(self, day: date, payload: dict) -> None:
+        if not self.enabled:
+            return
+        path = self._path(day)
+        # Write-then-rename, so a crash mid-write leaves no half file that a
+        # later run would read as a (corrupt, hence missed) day.
+        tmp = f"{path}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning("Scoreboard cache: could not write %s (%r)", path, e)
@@ -0,0 +1,110 @@
+"""Running per-user (venue, league) counts behind the attendance atlas.
+
+The atlas choropleth used to be computed by loading every attended game with
+its venue and league and counting in Python: O(games attended) on every map
+load, for an answer that only changes when attendance does. `user_atlas_counts`
+holds the counts instead, and this module keeps them current:
+
+* Attendance writes call `add_games` / `remove_games` with the game ids they
+  inserted or deleted, inside the same transaction, so a rolled-back write
+  rolls its counts back with it.
+* A game that moves venue (or league) after people attended it — a sync
+  correcting an arena, `backfill_venue_seeds.py` filling in a NULL venue — is
+  caught by a session hook, which recounts the affected users. Every writer of
+  `games` goes through the ORM, so the hook sees them all; a process that
+  writes games must import this module for the hook to be registered.
+
+`rebuild` recounts from the attendance log, for the hook and for repair.
+"""
+from collections.abc import Collection, Iterable
+
+from sqlalchemy import Connection, delete, event, func, insert, literal, select
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from sports_passport.models.atlas import UserAtlasCount
+from sports_passport.models.attendance import UserGameAttendance
+from sports_passport.models.game import Game
+
+
+def _apply(db: Session, user_id: int, game_ids: Collection[int], sign: int) -> None:
+    if not game_ids:
+        return
+    counts = (
+        select(
+            literal(user_id), Game.venue_id, Game.league_id, sign * func.count()
+        )
+        .where(Game.id.in_(game_ids), Game.venue_id.is_not(None))
+        .group_by(Game.venue_id, Game.league_id)
+    )
+    stmt = sqlite_insert(UserAtlasCount).from_select(
+        ["user_id", "venue_id", "league_id", "count"], counts
+    )
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=["user_id", "venue_id", "league_id"],
+        set_={"count": UserAtlasCount.count + stmt.excluded.count},
+    ))
+    if sign < 0:
+        db.execute(delete(UserAtlasCount).where(
+            UserAtlasCount.user_id == user_id, UserAtlasCount.count <= 0
+        ))
+
+
+def add_games(db: Session, user_id: int, game_ids: Collection[int]) -> None:
+    """Count newly attended games. Pass only ids whose attendance row was inserted."""
+    _apply(db, user_id, game_ids, 1)
+
+
+def remove_games(db: Session, user_id: int, game_ids: Collection[int]) -> None:
+    """Uncount games whose attendance rows were deleted."""
+    _apply(db, user_id, game_ids, -1)
+
+
+def rebuild(conn: Connection | Session, user_ids: Iterable[int] | None = None) -> None:
+    """Recount from the attendance log — every user, or just `user_ids`."""
+    counts = (
+        select(
+            UserGameAttendance.user_id, Game.venue_id, Game.league_id, func.count()
+        )
+        .join(Game, Game.id == UserGameAttendance.game_id)
+        .where(Game.venue_id.is_not(None))
+        .group_by(UserGameAttendance.user_id, Game.venue_id, Game.league_id)
+    )
+    clear = delete(UserAtlasCount)
+    if user_ids is not None:
+        user_ids = list(user_ids)
+        counts = counts.where(UserGameAttendance.user_id.in_(user_ids))
+        clear = clear.where(UserAtlasCount.user_id.in_(user_ids))
+    conn.execute(clear)
+    conn.execute(insert(UserAtlasCount).from_select(
+        ["user_id", "venue_id", "league_id", "count"], counts
+    ))
+
+
+def _moved(game: Game) -> bool:
+    state = sa_inspect(game)
+    return (
+        state.attrs.venue_id.history.has_changes()
+        or state.attrs.league_id.history.has_changes()
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _recount_moved_games(session: Session, flush_context) -> None:
+    # after_flush: the games' new venue/league are already written, so a
+    # recount on the session's own connection sees them.
+    game_ids = [
+        obj.id for obj in (*session.dirty, *session.deleted)
+        if isinstance(obj, Game) and (obj in session.deleted or _moved(obj))
+    ]
+    if not game_ids:
+        return
+    conn = session.connection()
+    user_ids = conn.scalars(
+        select(UserGameAttendance.user_id)
+        .where(UserGameAttendance.game_id.in_(game_ids))
+        .distinct()
+    ).all()
+    if user_ids:
+        rebuild(conn, user_ids)
@@ -0,0 +1,212 @@
+"""Set-based game merges for the bulk importers.
+
+Retrosheet gamelogs, the NBA's Games.csv, nflverse's games.csv, Spreadspoke
+and the Kaggle MLS matches run to tens of thousands of games a file. Through
+`upsert_game` each game costs a SELECT, an ORM update or an INSERT with a
+flush of its own, and the flush hooks' bookkeeping — a few round trips per
+row. `GameBatch` collects the rows an adapter has parsed and resolved, then
+merges each season in a fixed handful of statements:
+
+1. the season's rows go into a TEMP staging table in one executemany;
+2. an anti-join against the league's teams drops, and reports, rows whose
+   team ids are not that league's;
+3. one UPDATE … FROM rewrites the games whose values differ;
+4. one INSERT … SELECT adds the games not there yet;
+
+and the season commits, so a failure mid-backfill costs one season rather
+than the run. Teams and venues are still resolved by the adapters against
+their in-memory lookups; those are dictionary hits, not round trips.
+
+Semantics match `upsert_game`: rows are keyed on (source, source_game_id),
+every field given is overwritten, and a source id repeated in a batch keeps
+its last row (counted as an update, as the second upsert would have been).
+
+Core statements bypass the session's flush hooks, so a merge reports to
+them directly: the touched leagues' status counts are recounted at commit
+(league_stats), cached responses are invalidated (core/response_cache),
+attendees of games that changed venue or league have their atlas counts
+rebuilt (services/atlas), and row outcomes count toward the tracked import
+(core/metrics).
+"""
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import (
+    Column,
+    MetaData,
+    Table,
+    and_,
+    delete,
+    exists,
+    func,
+    insert,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.orm import Session
+
+from sports_passport.core.metrics import count_rows, sample_memory
+from sports_passport.core.response_cache import mark_catalog_changed
+from sports_passport.models.attendance import UserGameAttendance
+from sports_passport.models.game import Game
+from sports_passport.models.team import Team
+from sports_passport.services import atlas, league_stats
+from sports_passport.services.adapters.base import ImportResult
+from sports_passport.services.adapters.local_time import local_game_date
+
+_KEY = ("source", "source_game_id")
+# Changing either of these on a game moves it on its attendees' maps.
+_MOVE_FIELDS = ("venue_id", "league_id")
+
+
+@dataclass
+class MergeCounts:
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    unmatched: list[str] = field(default_factory=list)
+
+
+def _staging_table(fields: tuple[str, ...]) -> Table:
+    games = Game.__table__
+    return Table(
+        "staged_games",
+        MetaData(),
+        *(Column(name, games.c[name].type) for name in (*_KEY, *fields)),
+        prefixes=["TEMPORARY"],
+    )
+
+
+def merge_games(db: Session, fields: tuple[str, ...], rows: list[dict[str, Any]]) -> MergeCounts:
+    """Merge `rows` — each `source`, `source_game_id` and `fields` — into games.
+
+    Runs on the session's transaction and does not commit.
+    """
+    counts = MergeCounts()
+    if not rows:
+        return counts
+    db.flush()  # venues and re-keyed rows the adapter added must be visible
+    conn = db.connection()
+    games, teams = Game.__table__, Team.__table__
+    staged = _staging_table(fields)
+    staged.drop(conn, checkfirst=True)
+    staged.create(conn)
+    try:
+        conn.execute(insert(staged), rows)
+
+        def in_league(team_id: Column) -> Any:
+            return exists().where(teams.c.id == team_id, teams.c.league_id == staged.c.league_id)
+
+        foreign = or_(~in_league(staged.c.home_team_id), ~in_league(staged.c.away_team_id))
+        counts.unmatched = list(conn.scalars(select(staged.c.source_game_id).where(foreign)))
+        if counts.unmatched:
+            conn.execute(delete(staged).where(foreign))
+
+        match = and_(*(games.c[name] == staged.c[name] for name in _KEY))
+        differs = or_(*(games.c[name].is_distinct_from(staged.c[name]) for name in fields))
+        staged_count = conn.scalar(select(func.count()).select_from(staged)) or 0
+        matched = conn.scalar(select(func.count()).select_from(games.join(staged, match))) or 0
+        counts.updated = conn.scalar(
+            select(func.count()).select_from(games.join(staged, match)).where(differs)
+        ) or 0
+        counts.unchanged = matched - counts.updated
+        counts.inserted = staged_count - matched
+
+        moves = [games.c[name].is_distinct_from(staged.c[name])
+                 for name in _MOVE_FIELDS if name in fields]
+        moved = (
+            conn.execute(
+                select(games.c.id, games.c.league_id)
+                .select_from(games.join(staged, match))
+                .where(or_(*moves))
+            ).all()
+            if moves and counts.updated
+            else []
+        )
+
+        if counts.updated:
+            conn.execute(
+                update(Game)
+                .where(match, differs)
+                .values({name: staged.c[name] for name in fields})
+            )
+        if counts.inserted:
+            columns = [*_KEY, *fields]
+            conn.execute(insert(Game).from_select(
+                columns,
+                select(*(staged.c[name] for name in columns)).where(~exists().where(match)),
+            ))
+
+        if counts.inserted or counts.updated:
+            leagues = set(conn.scalars(select(staged.c.league_id).distinct()))
+            league_stats.mark_stale(db, leagues | {league_id for _, league_id in moved})
+            mark_catalog_changed(db)
+        if moved:
+            user_ids = conn.scalars(
+                select(UserGameAttendance.user_id)
+                .where(UserGameAttendance.game_id.in_([game_id for game_id, _ in moved]))
+                .distinct()
+            ).all()
+            if user_ids:
+                atlas.rebuild(conn, user_ids)
+    finally:
+        staged.drop(conn)
+
+    count_rows("games", "inserted", counts.inserted)
+    count_rows("games", "updated", counts.updated)
+    count_rows("games", "unchanged", counts.unchanged)
+    return counts
+
+
+class GameBatch:
+    """Games from one bulk source, merged a season at a time.
+
+    Every row must give the same fields, `league_id` and `season` among
+    them: the staging table has one set of columns.
+    """
+
+    def __init__(self, db: Session, source: str):
+        self.db = db
+        self.source = source
+        self.fields: tuple[str, ...] | None = None
+        self._seasons: dict[int, dict[str, dict[str, Any]]] = {}
+        self._repeats = 0
+
+    def __len__(self) -> int:
+        return sum(len(rows) for rows in self._seasons.values())
+
+    def add(self, source_game_id: str, **fields: Any) -> None:
+        if "start_date" in fields:
+            # What the ORM hook sets on every other write (models/game).
+            fields["local_game_date"] = local_game_date(fields["start_date"])
+        names = tuple(sorted(fields))
+        if self.fields is None:
+            missing = {"league_id", "season"} - set(names)
+            if missing:
+                raise ValueError(f"game {source_game_id}: missing {', '.join(sorted(missing))}")
+            self.fields = names
+        elif names != self.fields:
+            raise ValueError(
+                f"game {source_game_id}: fields {names} differ from the batch's {self.fields}"
+            )
+        rows = self._seasons.setdefault(fields["season"], {})
+        if source_game_id in rows:
+            self._repeats += 1
+        rows[source_game_id] = {"source": self.source, "source_game_id": source_game_id, **fields}
+
+    def merge_into(self, result: ImportResult) -> None:
+        """Merge and commit season by season, oldest first, tallying into `result`."""
+        result.games_updated += self._repeats
+        self._repeats = 0
+        for season in sorted(self._seasons):
+            rows = self._seasons.pop(season)
+            assert self.fields is not None  # set by the first add()
+            counts = merge_games(self.db, self.fields, list(rows.values()))
+            self.db.commit()
+            sample_memory()
+            result.games_imported += counts.inserted
+            result.games_updated += counts.updated + counts.unchanged
+            result.errors.extend(
+                f"game {game_id}: team not in this league" for game_id in counts.unmatched
+            )
@@ -0,0 +1,96 @@
+"""Distance queries over venue coordinates.
+
+"Venues within 100 km" is a great-circle question, and SQLite has no
+trigonometry to answer it in SQL. Computing haversine in Python for every
+placed venue would work — there are a few thousand — but it would read the
+whole table on every request. Instead a query is answered in two steps:
+
+1. A bounding box around the circle, as plain range predicates on latitude
+   and longitude. `ix_venues_lat_lon` turns that into an index range scan,
+   and it returns a superset of the answer: the box's corners lie outside
+   the circle.
+2. Exact haversine over what the box let through, which drops the corners
+   and gives each survivor its distance.
+
+The box is conservative everywhere it has to be: its longitude span is
+widened by the latitude's cosine, it wraps the antimeridian as a
+`west > east` box, and a circle that reaches a pole takes every longitude.
+"""
+import math
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+from sports_passport.models.venue import Venue
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = EARTH_RADIUS_KM * math.pi / 180
+
+# Largest radius the API accepts: a continent, not a hemisphere. Past this
+# the box is the whole map and the prefilter stops doing anything.
+MAX_RADIUS_KM = 5000.0
+
+
+def haversine_km(a: tuple, b: tuple) -> float:
+    """Great-circle distance between two (lat, lon) points, in km."""
+    lat1, lon1, lat2, lon2 = map(math.radians, (a[0], a[1], b[0], b[1]))
+    h = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(h, 1.0)))
+
+
+@dataclass(frozen=True)
+class BoundingBox:
+    """A lat/lon box. `west > east` is a box crossing the antimeridian."""
+    west: float
+    south: float
+    east: float
+    north: float
+
+    def clause(self):
+        """SQL filter on Venue coordinates; NULL coordinates never match."""
+        if self.west <= self.east:
+            longitude = and_(Venue.longitude >= self.west, Venue.longitude <= self.east)
+        else:
+            longitude = or_(Venue.longitude >= self.west, Venue.longitude <= self.east)
+        return and_(Venue.latitude >= self.south, Venue.latitude <= self.north, longitude)
+
+
+def bounding_box(lat: float, lon: float, radius_km: float) -> BoundingBox:
+    """The smallest lat/lon box containing every point within `radius_km`."""
+    dlat = radius_km / KM_PER_DEGREE
+    south, north = lat - dlat, lat + dlat
+    if south <= -90 or north >= 90:
+        # The circle covers a pole, and with it every meridian.
+        return BoundingBox(-180.0, max(south, -90.0), 180.0, min(north, 90.0))
+
+    # A degree of longitude shrinks with latitude; use the circle's edge
+    # nearest the pole, where it is smallest, so the box stays a superset.
+    dlon = dlat / math.cos(math.radians(max(abs(south), abs(north))))
+    if dlon >= 180:
+        return BoundingBox(-180.0, south, 180.0, north)
+    west, east = lon - dlon, lon + dlon
+    if west < -180:
+        west += 360
+    if east > 180:
+        east -= 360
+    return BoundingBox(west, south, east, north)
+
+
+def within(query: Query, lat: float, lon: float, radius_km: float) -> list[tuple[Any, float]]:
+    """Rows of `query` within `radius_km` of (lat, lon), nearest first.
+
+    `query` may select `Venue` objects or columns, as long as each row carries
+    `latitude` and `longitude`. Returns (row, distance_km) pairs.
+    """
+    found = []
+    for row in query.filter(bounding_box(lat, lon, radius_km).clause()):
+        distance = haversine_km((lat, lon), (row.latitude, row.longitude))
+        if distance <= radius_km:
+            found.append((row, distance))
+    found.sort(key=lambda pair: pair[1])
+    return found
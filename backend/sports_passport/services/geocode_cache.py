@@ -0,0 +1,124 @@
+"""Append-only store for Nominatim answers, shared by the venue scripts.
+
+`scripts/geocode_venues.py` caches every lookup — venue tier and city tier,
+hits and misses alike — so a re-run costs only the lookups it has never made.
+The cache used to be a single pretty-printed JSON object rewritten in full
+after every answer: across a ~3,500-lookup pass that is quadratic I/O, and a
+process killed mid-write left a truncated file that failed the next load.
+
+Here each answer is one JSON line appended to a log, so a write costs the same
+on the first lookup as on the last, and a crash can tear at most the final
+line, which the loader skips and the next append cuts off. The whole log is
+read into a dict once per process; later entries win, which is what makes
+re-answering a key (a manual correction, say) safe. `compact` rewrites the
+log down to one line per key — `close` does it when the log has grown well
+past the live set — so it does not grow without bound across many passes. A
+session that only read, like the export script's, leaves the file as it
+found it.
+
+The store behaves like the dict it replaces (`in`, `[]`, assignment,
+`items`), so the scripts' lookup logic did not change shape. It lives in the
+package rather than beside the scripts so `export_venue_coords.py` reads the
+same file through the same code.
+
+A cache written in the old format is picked up once: when the log does not
+exist yet and the legacy JSON does, the JSON is imported and the log written
+from it. The JSON file is left where it is.
+"""
+import json
+import os
+from collections.abc import ItemsView
+from pathlib import Path
+from typing import IO
+
+# Compact on close once the log holds this many lines per live key.
+COMPACT_RATIO = 2
+
+Coords = list[float] | None
+
+
+class GeocodeCache:
+    def __init__(self, path: Path, legacy_path: Path | None = None):
+        self.path = path
+        self._entries: dict[str, Coords] = {}
+        self._log_lines = 0
+        self._log: IO[str] | None = None
+        self._written = False
+        # Length of the log up to its last complete line, when a torn line
+        # follows it; cut back to this before the first append.
+        self._torn_at: int | None = None
+
+        if path.exists():
+            self._replay()
+        elif legacy_path is not None and legacy_path.exists():
+            self._entries.update(json.loads(legacy_path.read_text(encoding="utf-8")))
+            self.compact()
+
+    def _replay(self) -> None:
+        data = self.path.read_bytes()
+        if data and not data.endswith(b"\n"):
+            # A torn final line from an interrupted run. Appending after it
+            # would glue the next answer onto the fragment.
+            self._torn_at = data.rfind(b"\n") + 1
+            data = data[:self._torn_at]
+        for line in data.decode("utf-8").splitlines():
+            try:
+                record = json.loads(line)
+                key, value = record["k"], record["v"]
+            except (ValueError, KeyError, TypeError):
+                continue
+            self._entries[key] = value
+            self._log_lines += 1
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __getitem__(self, key: str) -> Coords:
+        return self._entries[key]
+
+    def __setitem__(self, key: str, value: Coords) -> None:
+        self._entries[key] = value
+        if self._log is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self._torn_at is not None:
+                os.truncate(self.path, self._torn_at)
+                self._torn_at = None
+            # Line-buffered: each answer reaches the OS as soon as it is
+            # written, so killing a long pass loses nothing already paid for.
+            self._log = self.path.open("a", encoding="utf-8", buffering=1)
+        self._log.write(json.dumps({"k": key, "v": value}) + "\n")
+        self._log_lines += 1
+        self._written = True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def items(self) -> ItemsView[str, Coords]:
+        return self._entries.items()
+
+    def compact(self) -> None:
+        """Rewrite the log as one line per key, sorted, via write-then-rename."""
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as fh:
+            for key in sorted(self._entries):
+                fh.write(json.dumps({"k": key, "v": self._entries[key]}) + "\n")
+        os.replace(tmp, self.path)
+        self._log_lines = len(self._entries)
+        self._torn_at = None
+
+    def close(self) -> None:
+        if self._written and self._log_lines > COMPACT_RATIO * max(len(self._entries), 1):
+            self.compact()
+        elif self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def __enter__(self) -> "GeocodeCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,68 @@
+"""Run imports off the API's event loop.
+
+Adapters are async for their HTTP, but the rest of what they do blocks:
+SQLAlchemy lookups, upserts, flushes and commits, and parsing payloads that
+run to tens of megabytes (Retrosheet zips, the NBA CSV). Awaited on
+uvicorn's loop — which is where the nightly job, the admin sync endpoints
+and their BackgroundTasks all run — each of those stalls every request in
+flight, /health included, for as long as it takes.
+
+`run_import` runs an adapter call to completion on a dedicated import
+thread, in an event loop of its own. The API's loop only awaits a future, so
+it keeps serving while the import fetches, parses and writes. Moving just
+the writes onto a writer thread would have left the parsing on the loop, and
+would have meant threading every adapter's session use through a queue.
+
+The session is handed over rather than shared: the caller passes the
+adapter (and its session) in and does not touch either until the import
+returns. Context variables — the import being tracked in core/metrics, the
+query profile — are copied into the thread, so attribution still works.
+
+At most IMPORT_WORKERS imports run at once; further ones wait for a thread.
+SQLite takes one writer at a time anyway, and two workers keep a multi-hour
+historical backfill from holding up the nightly sync.
+"""
+import asyncio
+import contextvars
+from collections.abc import Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from sports_passport.services.adapters.base import LeagueAdapter
+
+IMPORT_WORKERS = 2
+
+_executor = ThreadPoolExecutor(max_workers=IMPORT_WORKERS, thread_name_prefix="import")
+
+
+def _run_to_completion[T](
+    adapter: LeagueAdapter,
+    call: Callable[[], Coroutine[Any, Any, T]],
+    timeout: float | None,
+) -> T:
+    async def main() -> T:
+        try:
+            return await asyncio.wait_for(call(), timeout)
+        finally:
+            # The adapter's HTTP client belongs to this loop; close it here.
+            await adapter.aclose()
+
+    return asyncio.run(main())
+
+
+async def run_import[T](
+    adapter: LeagueAdapter,
+    call: Callable[[], Coroutine[Any, Any, T]],
+    *,
+    timeout: float | None = None,
+) -> T:
+    """Await `call()` — an adapter coroutine — on an import thread.
+
+    `timeout` is enforced inside that thread, so a timed-out import is
+    cancelled there (raising TimeoutError here) rather than left running.
+    Closes the adapter's HTTP client when done.
+    """
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(
+        _executor, lambda: context.run(_run_to_completion, adapter, call, timeout)
+    )
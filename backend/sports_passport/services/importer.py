@@ -1,14 +1,50 @@
 """Shared upsert helpers used by all league adapters.
 
 All upserts are idempotent, keyed on (source, source_*_id), so imports and
-syncs can be re-run safely.
+syncs can be re-run safely. Importing this module registers the hooks that
+keep the per-league status counts current (services/league_stats).
+
+Every CHECKPOINT_EVERY upserts, `_checkpoint` flushes the session and checks
+memory. The session's identity map holds clean rows only weakly, but an
+updated row is held strongly until it is flushed — and updating an existing
+row does not flush, only inserting one does. A re-import over rows that
+already exist (a replay, a sync re-reading a long window) would otherwise
+keep every game it touched in memory until the final commit. The bulk
+sources merge through services/bulk_merge instead and never get here.
+The flush releases them without committing, so the adapters' transactions
+are unchanged. The checkpoint also samples RSS for the run's peak (see
+core/metrics) and raises ImportMemoryExceeded past IMPORT_MEMORY_LIMIT_MB.
 """
 from sqlalchemy.orm import Session
 
+from sports_passport.core.config import settings
+from sports_passport.core.metrics import sample_memory
 from sports_passport.models.game import Game
 from sports_passport.models.league import League
 from sports_passport.models.team import Team
 from sports_passport.models.venue import Venue
+from sports_passport.services import league_stats  # noqa: F401  (registers the count hooks)
+
+CHECKPOINT_EVERY = 500
+
+
+class ImportMemoryExceeded(RuntimeError):
+    """The process grew past IMPORT_MEMORY_LIMIT_MB during an import."""
+
+
+def _checkpoint(db: Session) -> None:
+    count = db.info.get("upserts_since_checkpoint", 0) + 1
+    if count < CHECKPOINT_EVERY:
+        db.info["upserts_since_checkpoint"] = count
+        return
+    db.info["upserts_since_checkpoint"] = 0
+    db.flush()
+    rss = sample_memory()
+    limit_mb = settings.import_memory_limit_mb
+    if limit_mb and rss is not None and rss > limit_mb * 2**20:
+        raise ImportMemoryExceeded(
+            f"import stopped at {rss // 2**20} MB RSS, over the {limit_mb} MB limit"
+        )
 
 
 def get_league(db: Session, code: str) -> League:
@@ -30,10 +66,12 @@ def upsert_team(
         for key, value in fields.items():
             if value is not None:
                 setattr(team, key, value)
+        _checkpoint(db)
         return team, False
     team = Team(source=source, source_team_id=source_team_id, league_id=league_id, **fields)
     db.add(team)
     db.flush()  # assign PK so callers can reference team.id before commit
+    _checkpoint(db)
     return team, True
 
 
@@ -47,10 +85,12 @@ def upsert_venue(db: Session, source: str, source_venue_id: str, **fields) -> tu
         for key, value in fields.items():
             if value is not None:
                 setattr(venue, key, value)
+        _checkpoint(db)
         return venue, False
     venue = Venue(source=source, source_venue_id=source_venue_id, **fields)
     db.add(venue)
     db.flush()
+    _checkpoint(db)
     return venue, True
 
 
@@ -69,8 +109,10 @@ def upsert_game(
     if game:
         for key, value in fields.items():
             setattr(game, key, value)
+        _checkpoint(db)
         return game, False
     game = Game(source=source, source_game_id=source_game_id, league_id=league_id, **fields)
     db.add(game)
     db.flush()  # session runs autoflush=False; make the row visible to later upserts
+    _checkpoint(db)
     return game, True
@@ -0,0 +1,231 @@
+"""Running per-league catalog counts behind the admin status table.
+
+/api/admin/status used to aggregate the whole games table per poll — counts,
+season span — while the admin page polls it every few seconds during a
+sync. `league_stats` holds those numbers instead, and this module keeps them
+current from the import path:
+
+* Games and teams inserted during a transaction are tallied by an
+  `after_flush` hook and applied as one increment per league just before
+  the transaction commits. A historical import inserts a game per flush;
+  applying per commit keeps that to a couple of extra statements per batch
+  rather than per game. A rolled-back transaction drops its tally.
+* Deletes and moves — a game changing league, venue, season or start time,
+  a team changing league — can shrink a bound or a distinct-venue count,
+  which no increment can express. Those leagues are recounted instead, in
+  the same pre-commit step. They are rare: a postponement, a venue fix.
+
+Like the atlas hook, this sees every writer that goes through the ORM, which
+is all of them but the bulk merges (services/bulk_merge) — those write with
+Core statements and call `mark_stale` for the leagues they touch. A process
+that writes the catalog must import this module (services/importer and the
+admin router do) for the hooks to be registered.
+
+`recount` rebuilds rows from the catalog, for the hook and for repair
+(scripts/recount_league_stats.py).
+"""
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from sqlalchemy import Connection, delete, event, func, insert, select, tuple_
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from sports_passport.models.game import Game
+from sports_passport.models.league import League
+from sports_passport.models.league_stats import LeagueStats
+from sports_passport.models.team import Team
+
+# A change to any of these on an existing game can move a league's bounds.
+_GAME_FIELDS = ("league_id", "venue_id", "season", "start_date")
+
+
+@dataclass
+class _Delta:
+    games: int = 0
+    teams: int = 0
+    venues: int = 0
+    first_season: int | None = None
+    last_season: int | None = None
+    last_game_at: datetime | None = None
+
+    def add_game(self, game: Game) -> None:
+        self.games += 1
+        if game.season is not None:
+            self.first_season = min(self.first_season or game.season, game.season)
+            self.last_season = max(self.last_season or game.season, game.season)
+        if game.start_date is not None:
+            self.last_game_at = max(self.last_game_at or game.start_date, game.start_date)
+
+
+@dataclass
+class _Pending:
+    deltas: dict[int, _Delta] = field(default_factory=dict)
+    # (league_id, venue_id) -> games inserted there this transaction
+    venue_games: Counter[tuple[int, int]] = field(default_factory=Counter)
+    stale: set[int] = field(default_factory=set)
+
+
+def recount(conn: Connection | Session, league_ids: Iterable[int] | None = None) -> None:
+    """Rebuild rows from the catalog — every league, or just `league_ids`."""
+    games = select(
+        Game.league_id,
+        func.count().label("games"),
+        func.count(Game.venue_id.distinct()).label("venues"),
+        func.min(Game.season).label("first_season"),
+        func.max(Game.season).label("last_season"),
+        func.max(Game.start_date).label("last_game_at"),
+    ).group_by(Game.league_id)
+    teams = select(Team.league_id, func.count().label("teams")).group_by(Team.league_id)
+    leagues = select(League.id)
+    clear = delete(LeagueStats)
+    if league_ids is not None:
+        # Filter inside the aggregates too, or recounting one league would
+        # still scan every league's games.
+        league_ids = list(league_ids)
+        games = games.where(Game.league_id.in_(league_ids))
+        teams = teams.where(Team.league_id.in_(league_ids))
+        leagues = leagues.where(League.id.in_(league_ids))
+        clear = clear.where(LeagueStats.league_id.in_(league_ids))
+
+    g, t = games.subquery(), teams.subquery()
+    rows = (
+        leagues.add_columns(
+            func.coalesce(g.c.games, 0),
+            func.coalesce(t.c.teams, 0),
+            func.coalesce(g.c.venues, 0),
+            g.c.first_season,
+            g.c.last_season,
+            g.c.last_game_at,
+        )
+        .outerjoin(g, g.c.league_id == League.id)
+        .outerjoin(t, t.c.league_id == League.id)
+    )
+    conn.execute(clear)
+    conn.execute(insert(LeagueStats).from_select(
+        ["league_id", "games", "teams", "venues", "first_season", "last_season", "last_game_at"],
+        rows,
+    ))
+
+
+def mark_stale(session: Session, league_ids: Iterable[int]) -> None:
+    """Recount `league_ids` when `session` commits.
+
+    For writes made with Core statements (services/bulk_merge), which the
+    flush hook cannot see.
+    """
+    pending = session.info.setdefault("league_stats", _Pending())
+    pending.stale.update(league_ids)
+
+
+def _apply(conn: Connection, pending: _Pending) -> None:
+    # A venue is new to a league if every game the league has there was
+    # inserted in this transaction.
+    new_venues = Counter[int]()
+    if pending.venue_games:
+        totals = {
+            (league_id, venue_id): total
+            for league_id, venue_id, total in conn.execute(
+                select(Game.league_id, Game.venue_id, func.count())
+                .where(tuple_(Game.league_id, Game.venue_id).in_(list(pending.venue_games)))
+                .group_by(Game.league_id, Game.venue_id)
+            )
+        }
+        for (league_id, venue_id), inserted in pending.venue_games.items():
+            if totals.get((league_id, venue_id)) == inserted:
+                new_venues[league_id] += 1
+
+    for league_id, delta in pending.deltas.items():
+        if league_id in pending.stale:
+            continue
+        stmt = sqlite_insert(LeagueStats).values(
+            league_id=league_id,
+            games=delta.games,
+            teams=delta.teams,
+            venues=new_venues[league_id],
+            first_season=delta.first_season,
+            last_season=delta.last_season,
+            last_game_at=delta.last_game_at,
+        )
+        new = stmt.excluded
+        conn.execute(stmt.on_conflict_do_update(
+            index_elements=["league_id"],
+            set_={
+                "games": LeagueStats.games + new.games,
+                "teams": LeagueStats.teams + new.teams,
+                "venues": LeagueStats.venues + new.venues,
+                # Two-argument MIN/MAX are scalar in SQLite, and NULL if
+                # either side is; fall back to whichever side is set.
+                "first_season": func.coalesce(
+                    func.min(LeagueStats.first_season, new.first_season),
+                    LeagueStats.first_season, new.first_season,
+                ),
+                "last_season": func.coalesce(
+                    func.max(LeagueStats.last_season, new.last_season),
+                    LeagueStats.last_season, new.last_season,
+                ),
+                "last_game_at": func.coalesce(
+                    func.max(LeagueStats.last_game_at, new.last_game_at),
+                    LeagueStats.last_game_at, new.last_game_at,
+                ),
+            },
+        ))
+    if pending.stale:
+        recount(conn, pending.stale)
+
+
+def _changed_leagues(obj: Game | Team, fields: Iterable[str]) -> set[int] | None:
+    """Old and new league ids if any of `fields` changed, else None."""
+    state = sa_inspect(obj)
+    if not any(state.attrs[name].history.has_changes() for name in fields):
+        return None
+    return {obj.league_id, *state.attrs.league_id.history.deleted} - {None}
+
+
+@event.listens_for(Session, "after_flush")
+def _tally(session: Session, flush_context) -> None:
+    pending: _Pending | None = session.info.get("league_stats")
+    for obj in session.new:
+        if not isinstance(obj, Game | Team):
+            continue
+        if pending is None:
+            pending = session.info["league_stats"] = _Pending()
+        delta = pending.deltas.setdefault(obj.league_id, _Delta())
+        if isinstance(obj, Team):
+            delta.teams += 1
+            continue
+        delta.add_game(obj)
+        if obj.venue_id is not None:
+            pending.venue_games[(obj.league_id, obj.venue_id)] += 1
+
+    for obj in (*session.dirty, *session.deleted):
+        if not isinstance(obj, Game | Team):
+            continue
+        if obj in session.deleted:
+            leagues = {obj.league_id}
+        else:
+            fields = _GAME_FIELDS if isinstance(obj, Game) else ("league_id",)
+            leagues = _changed_leagues(obj, fields)
+        if leagues:
+            if pending is None:
+                pending = session.info["league_stats"] = _Pending()
+            pending.stale |= leagues
+
+
+@event.listens_for(Session, "before_commit")
+def _apply_pending(session: Session) -> None:
+    # Commit flushes after this hook runs; flush here first so that last
+    # flush's rows are tallied, then apply on the same transaction.
+    session.flush()
+    pending = session.info.pop("league_stats", None)
+    if pending is not None:
+        _apply(session.connection(), pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_pending(session: Session) -> None:
+    session.info.pop("league_stats", None)
+
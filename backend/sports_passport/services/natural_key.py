@@ -0,0 +1,161 @@
+"""Natural-key game index: (league, home team, away team, local game date).
+
+Two sources describing the same game rarely share an id — ESPN cannot supply
+the NBA's own gameId, and a user's spreadsheet has no ids at all — so the only
+key they agree on is the matchup and the day it was played. Looking that up
+once per incoming row is a query per row; a nightly NBA sync did one per ESPN
+event, and the bulk import's adoption check would have done 73k.
+
+`NaturalKeyIndex` loads the candidate games once per run and answers lookups
+from memory. Keys use the *local* game date (see `local_game_date`) rather
+than the stored UTC instant, because that is the day both a bulk file and a
+person would name; a 7:30pm ET tip-off is stored on the next UTC day.
+
+That date is stored, as `games.local_game_date`, so readers never convert
+per row. The model keeps it in step with `start_date` on every ORM write;
+Core writers (services/bulk_merge) set it themselves.
+
+An index is built over a date span. A lookup outside it falls through to the
+database, where the `ix_games_natural_key` composite index on
+(league_id, home_team_id, away_team_id, start_date) makes it a single probe
+rather than a scan of the matchup's whole history.
+"""
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Any
+
+from sqlalchemy.orm import Query
+
+from sports_passport.models.game import Game
+from sports_passport.services.adapters.local_time import local_game_date
+
+NaturalKey = tuple[int, int, int, date]
+
+ONE_DAY = timedelta(days=1)
+
+
+def day_span(first: date, last: date) -> tuple[datetime, datetime]:
+    """The stored-instant range covering local days `first`..`last` inclusive.
+
+    A day's games can sit on the next UTC day (evening kickoffs) but never the
+    previous one, so the upper edge carries a day's margin.
+    """
+    return datetime.combine(first, time.min), datetime.combine(last + 2 * ONE_DAY, time.min)
+
+
+class NaturalKeyIndex:
+    """Games grouped by natural key, loaded once and consulted many times.
+
+    `query` selects the games that may match — typically one league, and
+    optionally one source — and may yield `Game` objects or column rows, as
+    long as each carries `id`, `league_id`, `home_team_id`, `away_team_id`,
+    `start_date` and `local_game_date`. Callers that update what they find need `Game` objects;
+    callers that only need ids can select the columns and skip the ORM.
+
+    `start`/`end` bound what gets loaded, in stored (UTC) instants. Leave both
+    unset to load everything `query` selects, which is right when the query
+    itself is already narrow (the NBA adapter's handful of ESPN-synced rows).
+    """
+
+    def __init__(
+        self, query: Query, *, start: datetime | None = None, end: datetime | None = None
+    ):
+        self._query = query
+        self._start = start
+        self._end = end
+        self._by_key: dict[NaturalKey, list[Any]] = defaultdict(list)
+        self._key_of: dict[int, NaturalKey] = {}
+
+        bounded = query
+        if start is not None:
+            bounded = bounded.filter(Game.start_date >= start)
+        if end is not None:
+            bounded = bounded.filter(Game.start_date < end)
+        for game in bounded:
+            self.add(game)
+
+    def __len__(self) -> int:
+        return len(self._key_of)
+
+    def add(self, game: Any) -> None:
+        """Index a game, or re-index it if its teams or start moved.
+
+        Callers that insert or rewrite a game mid-run must call this, so a
+        later row in the same run sees the change — the session does not
+        autoflush, and the in-memory index would not see a flush anyway.
+        """
+        self.discard(game)
+        # A row written before the column existed, or by a Core writer that
+        # skipped it, has no stored day; derive it the way the model would.
+        day = game.local_game_date or local_game_date(game.start_date)
+        key = (game.league_id, game.home_team_id, game.away_team_id, day)
+        self._by_key[key].append(game)
+        self._key_of[game.id] = key
+
+    def discard(self, game: Any) -> None:
+        """Drop a game from the index, e.g. once it has been claimed."""
+        key = self._key_of.pop(game.id, None)
+        if key is not None:
+            self._by_key[key] = [g for g in self._by_key[key] if g.id != game.id]
+
+    def _covers(self, lo: datetime, hi: datetime, *, hi_exclusive: bool = False) -> bool:
+        """Whether the loaded span holds every instant from `lo` to `hi`.
+
+        The span's end is exclusive, so an inclusive `hi` must fall short of
+        it, while an exclusive one — a `day_span` edge — may reach it.
+        """
+        if self._start is not None and lo < self._start:
+            return False
+        if self._end is None:
+            return True
+        return hi <= self._end if hi_exclusive else hi < self._end
+
+    def _from_db(
+        self, league_id: int, home_id: int, away_id: int, lo: datetime, hi: datetime
+    ) -> list[Any]:
+        """Fallback probe for a lookup outside the loaded span."""
+        return self._query.filter(
+            Game.league_id == league_id,
+            Game.home_team_id == home_id,
+            Game.away_team_id == away_id,
+            Game.start_date >= lo,
+            Game.start_date <= hi,
+        ).all()
+
+    def near(
+        self, league_id: int, home_id: int, away_id: int, start: datetime, window: timedelta
+    ) -> list[Any]:
+        """Games for this matchup whose stored start is within `window` of `start`.
+
+        For reconciling two sources that both carry a real time: the date key
+        narrows the search to three buckets, and the window decides. It must
+        stay under a day, or the three buckets stop being enough.
+        """
+        if window >= ONE_DAY:
+            raise ValueError("natural-key window must be under one day")
+        lo, hi = start - window, start + window
+        if not self._covers(lo, hi):
+            return self._from_db(league_id, home_id, away_id, lo, hi)
+        day = local_game_date(start)
+        return [
+            game
+            for d in (day - ONE_DAY, day, day + ONE_DAY)
+            for game in self._by_key.get((league_id, home_id, away_id, d), ())
+            if abs(game.start_date - start) <= window
+        ]
+
+    def on(self, league_id: int, home_id: int, away_id: int, day: date) -> list[Any]:
+        """Games for this matchup played on local calendar day `day`.
+
+        For sources that only know the date — spreadsheets, date-only bulk
+        files. More than one result is a doubleheader, and the caller decides.
+        """
+        lo, hi = day_span(day, day)
+        if not self._covers(lo, hi, hi_exclusive=True):
+            return self._query.filter(
+                Game.league_id == league_id,
+                Game.home_team_id == home_id,
+                Game.away_team_id == away_id,
+                Game.local_game_date == day,
+            ).all()
+        return list(self._by_key.get((league_id, home_id, away_id, day), ()))
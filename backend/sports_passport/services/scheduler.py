@@ -11,21 +11,28 @@ queries by date range, so an out-of-season window simply returns zero games.
 The scheduler is started/stopped from the FastAPI lifespan and is guarded by
 ``settings.scheduler_enabled`` (set false in tests and one-off scripts).
 """
-import asyncio
 import logging
 from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING
 
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from sports_passport.core import perf_log
 from sports_passport.core.config import settings
+from sports_passport.core.metrics import ImportRun, tracking_import
+from sports_passport.core.query_profiler import profiling
+from sports_passport.core.response_cache import bump_data_generation
 from sports_passport.db.database import SessionLocal
 from sports_passport.models.league import League
+from sports_passport.models.sync_run import SyncRun
 from sports_passport.models.sync_state import SyncState
 from sports_passport.services.adapters import ADAPTERS, get_adapter
 from sports_passport.services.adapters.base import ImportResult
+from sports_passport.services.import_runner import run_import
+
+if TYPE_CHECKING:
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +40,7 @@ logger = logging.getLogger(__name__)
 # all third-party endpoints that can stall) — cap each league's run.
 PER_LEAGUE_TIMEOUT_SECONDS = 600
 
-_scheduler: AsyncIOScheduler | None = None
+_scheduler: "AsyncIOScheduler | None" = None
 
 # Single-owner guard for the admin "run now" background job (see trigger_sync_all).
 _sync_all_in_progress = False
@@ -65,6 +72,35 @@ def get_or_create_sync_state(db: Session, league: League) -> SyncState:
     return state
 
 
+def record_sync_run(db: Session, league_id: int, run: ImportRun, result: ImportResult) -> SyncRun:
+    """Add a finished run to the sync_runs history. The caller commits."""
+    phases = run.phases()
+    row = SyncRun(
+        league_id=league_id,
+        kind=run.kind,
+        started_at=run.started_at,
+        status="error" if result.errors else "success",
+        error=result.errors[0] if result.errors else None,
+        duration_ms=round(run.seconds * 1000),
+        fetch_ms=round(phases["fetch"] * 1000),
+        parse_ms=round(phases["parse"] * 1000),
+        resolve_ms=round(phases["resolve"] * 1000),
+        write_ms=round(phases["write"] * 1000),
+        commit_ms=round(phases["commit"] * 1000),
+        requests=run.requests,
+        bytes_downloaded=run.bytes_downloaded,
+        statements=run.statements,
+        peak_rss_mb=round(run.peak_rss_bytes / 2**20) if run.peak_rss_bytes else None,
+        rows_inserted=run.rows["inserted"],
+        rows_updated=run.rows["updated"],
+        rows_unchanged=run.rows["unchanged"],
+        games_imported=result.games_imported,
+        games_updated=result.games_updated,
+    )
+    db.add(row)
+    return row
+
+
 def compute_since(state: SyncState, today: date, lookback_days: int) -> date:
     """Adaptive lookback window.
 
@@ -87,7 +123,8 @@ async def run_sync_for_league(
     league_code: str,
     since: date | None = None,
 ) -> ImportResult:
-    """Sync one league and record the outcome on its SyncState row.
+    """Sync one league and record the outcome on its SyncState row and in
+    the sync_runs history.
 
     Shared by the nightly job and the admin endpoints so every sync path
     updates the same last-run record. ``since`` overrides the adaptive window
@@ -111,13 +148,18 @@ async def run_sync_for_league(
 
     result = ImportResult(league=league.code)
     started = datetime.now()
-    adapter = None
+    run = None
     try:
         adapter = get_adapter(league_code, db)
-        result = await asyncio.wait_for(
-            adapter.sync_recent(since=window_start),
-            timeout=PER_LEAGUE_TIMEOUT_SECONDS,
-        )
+        with tracking_import(league.code, "sync") as run, profiling(f"sync {league.code}"):
+            # Off the event loop: the sync's parsing and writes would otherwise
+            # stall every API request for their duration. Closes the adapter.
+            result = await run_import(
+                adapter,
+                lambda: adapter.sync_recent(since=window_start),
+                timeout=PER_LEAGUE_TIMEOUT_SECONDS,
+            )
+            run.failed = bool(result.errors)
     except TimeoutError:
         db.rollback()  # discard any partial work left by the cancelled coroutine
         result.errors.append(f"timed out after {PER_LEAGUE_TIMEOUT_SECONDS}s")
@@ -130,8 +172,6 @@ async def run_sync_for_league(
         result.errors.append(str(e))
         logger.exception("Sync for %s failed", league_code)
     finally:
-        if adapter is not None:
-            await adapter.aclose()  # release the adapter's pooled connections
         state.last_run_at = started
         state.last_duration_ms = int((datetime.now() - started).total_seconds() * 1000)
         state.last_games_imported = result.games_imported
@@ -140,7 +180,13 @@ async def run_sync_for_league(
         state.last_status = "error" if result.errors else "success"
         if not result.errors:
             state.last_success_at = started
+        if run is not None:
+            record_sync_run(db, league.id, run, result)
         db.commit()
+        # The session hooks already bump on ORM writes to catalog rows; this
+        # covers Core-level statements they cannot see. Cheap and idempotent.
+        if result.games_imported or result.games_updated:
+            bump_data_generation()
 
     return result
 
@@ -210,6 +256,12 @@ async def run_nightly_sync() -> None:
     logger.info("Nightly sync finished")
 
 
+def flush_perf_samples() -> None:
+    """Scheduler entry point: move queued timings into the perf ring buffer."""
+    with SessionLocal() as db:
+        perf_log.flush(db)
+
+
 def start_scheduler() -> None:
     """Start the nightly cron job. No-op if disabled or already running."""
     global _scheduler
@@ -218,6 +270,12 @@ def start_scheduler() -> None:
         return
     if _scheduler is not None:
         return
+    # Imported here: only a process that actually runs the scheduler (the
+    # API server, with SCHEDULER_ENABLED) should pay for APScheduler.
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+    from apscheduler.triggers.cron import CronTrigger
+    from apscheduler.triggers.interval import IntervalTrigger
+
     _scheduler = AsyncIOScheduler()
     _scheduler.add_job(
         run_nightly_sync,
@@ -227,6 +285,13 @@ def start_scheduler() -> None:
         misfire_grace_time=3600,   # if the app was down at the trigger, still run within the hour
         coalesce=True,             # collapse multiple missed runs into one
     )
+    _scheduler.add_job(
+        flush_perf_samples,
+        trigger=IntervalTrigger(seconds=perf_log.FLUSH_INTERVAL_SECONDS),
+        id="flush_perf_samples",
+        replace_existing=True,
+        coalesce=True,
+    )
     _scheduler.start()
     logger.info("Nightly sync scheduled for %02d:00 server-local", settings.sync_hour)
 
@@ -237,3 +302,4 @@ def shutdown_scheduler() -> None:
     if _scheduler is not None:
         _scheduler.shutdown(wait=False)
         _scheduler = None
+        flush_perf_samples()  # keep what the last interval queued
@@ -12,8 +12,14 @@ os.environ["RATE_LIMIT_ENABLED"] = "false"
 # suite's deliberately-raised exceptions to the production project, tagged with
 # whatever SHA happens to be checked out.
 os.environ["SENTRY_DSN"] = ""
+# Tests must not read or leave ESPN scoreboards in the developer's data/
+# directory; the cache's own tests point it at tmp_path.
+os.environ["ESPN_CACHE_ENABLED"] = "false"
+# Likewise the payload archive; its tests point it at tmp_path.
+os.environ["PAYLOAD_ARCHIVE_ENABLED"] = "false"
 
 from datetime import datetime
+from functools import partial
 
 import pytest
 from fastapi.testclient import TestClient
@@ -21,6 +27,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from sports_passport.core import query_profiler
 from sports_passport.core.security import get_password_hash
 from sports_passport.db.database import Base, get_db
 from sports_passport.db.seed import seed_leagues
@@ -31,6 +38,7 @@ from sports_passport.models.league import League
 from sports_passport.models.team import Team
 from sports_passport.models.user import User
 from sports_passport.models.venue import Venue
+from sports_passport.services.atlas import rebuild as rebuild_atlas
 
 # Test database setup - using in-memory SQLite
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
@@ -80,6 +88,16 @@ def client(db_session, monkeypatch):
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def query_budget():
+    """`with query_budget(n):` fails the test if the block runs over n statements.
+
+    Watches the test engine, so it sees the app's queries on TestClient's
+    thread. Pass max_repeats=k to also cap repeats of any one statement.
+    """
+    return partial(query_profiler.query_budget, engine)
+
+
 @pytest.fixture
 def cfb_league(db_session):
     return db_session.query(League).filter(League.code == "CFB").first()
@@ -402,6 +420,9 @@ def sample_attendance(db_session, test_user, sample_games):
     for attendance in attendances:
         db_session.add(attendance)
     db_session.commit()
+    # Added behind the API's back, so count them as the migration backfill would.
+    rebuild_atlas(db_session, [test_user.id])
+    db_session.commit()
     for attendance in attendances:
         db_session.refresh(attendance)
     return attendances
@@ -3,11 +3,12 @@ Tests for admin endpoints.
 """
 from unittest.mock import AsyncMock, Mock, patch
 
+from sports_passport.models.sync_run import SyncRun
 from sports_passport.services.adapters.base import ImportResult
 
 
 def _mock_adapter(**overrides):
-    adapter = Mock()
+    adapter = Mock(league_code="CFB")
     result = ImportResult(league="CFB", games_imported=100, **overrides)
     adapter.import_teams = AsyncMock(return_value=result)
     adapter.import_historical = AsyncMock(return_value=result)
@@ -29,6 +30,29 @@ class TestImportEndpoints:
         assert response.status_code == 200
         assert response.json()["games_imported"] == 100
 
+    @patch('sports_passport.routers.admin.get_adapter')
+    def test_historical_import_is_recorded_in_run_history(
+        self, mock_get_adapter, client, db_session, admin_headers
+    ):
+        adapter = _mock_adapter()
+        adapter.import_historical = AsyncMock(side_effect=Exception("upstream 500"))
+        mock_get_adapter.return_value = adapter
+        client.post(
+            "/api/admin/import/CFB/historical?start_season=2023&end_season=2023",
+            headers=admin_headers
+        )
+        mock_get_adapter.return_value = _mock_adapter()
+        client.post(
+            "/api/admin/import/CFB/historical?start_season=2023&end_season=2023",
+            headers=admin_headers
+        )
+
+        runs = db_session.query(SyncRun).order_by(SyncRun.id).all()
+        assert [(r.kind, r.status, r.games_imported) for r in runs] == [
+            ("historical", "error", 0), ("historical", "success", 100),
+        ]
+        assert runs[0].error == "upstream 500"
+
     @patch('sports_passport.routers.admin.get_adapter')
     def test_historical_import_rejects_implausible_seasons(
         self, mock_get_adapter, client, admin_headers
@@ -119,6 +143,18 @@ class TestDataStatus:
         assert rows["MLB"]["games"] == 0
         assert rows["CFB"]["adapter_available"] is True
 
+    def test_status_counts_follow_catalog_writes(
+        self, client, db_session, sample_games, admin_headers
+    ):
+        def cfb_games():
+            rows = client.get("/api/admin/status", headers=admin_headers).json()
+            return next(row["games"] for row in rows if row["league"] == "CFB")
+
+        assert cfb_games() == 3
+        db_session.delete(sample_games[2])
+        db_session.commit()
+        assert cfb_games() == 2
+
     def test_status_as_regular_user(self, client, auth_headers):
         response = client.get("/api/admin/status", headers=auth_headers)
         assert response.status_code == 403
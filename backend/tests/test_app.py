@@ -1,12 +1,17 @@
 """
 Tests for app-level behaviour: health check, routing fallbacks, CORS config.
 """
+import subprocess
+import sys
 from unittest.mock import patch
 
 from sqlalchemy.exc import OperationalError
 
 from sports_passport.core.config import settings
 from sports_passport.core.queries import contains_pattern
+from sports_passport.db.seed import LEAGUES, seed_leagues
+from sports_passport.models.league import League
+from sports_passport.services.adapters import ADAPTERS
 
 
 class TestHealthCheck:
@@ -26,6 +31,44 @@ class TestHealthCheck:
         assert response.status_code == 503
 
 
+class TestStartup:
+    def test_importing_the_app_defers_heavy_modules(self):
+        """Adapters, APScheduler, Mailtrap and (without a DSN) Sentry load on
+        first use. Checked in a fresh interpreter: this one has long since
+        imported everything."""
+        deferred = [
+            "sports_passport.services.adapters.nfl",
+            "sports_passport.services.adapters.nba",
+            "sports_passport.services.importer",
+            "apscheduler",
+            "mailtrap",
+            "sentry_sdk",
+        ]
+        code = (
+            "import sys, sports_passport.main; "
+            f"print([m for m in {deferred!r} if m in sys.modules])"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+            env={"SECRET_KEY": "test", "SENTRY_DSN": "", "PATH": ""},
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_every_registered_adapter_loads_under_its_code(self):
+        assert set(ADAPTERS) == {row["code"] for row in LEAGUES}
+        for code in ADAPTERS:
+            assert ADAPTERS[code].league_code == code
+
+    def test_seed_leagues_is_one_statement(self, db_session, query_budget):
+        db_session.query(League).filter(League.code == "MLS").delete()
+        db_session.commit()
+        with query_budget(1):
+            assert seed_leagues(db_session) == 1
+        with query_budget(1):
+            assert seed_leagues(db_session) == 0
+        assert db_session.query(League).count() == len(LEAGUES)
+
+
 class TestApiRouting:
     def test_unknown_api_path_returns_404(self, client):
         """An unmatched /api route is a broken route, not a client-side one —
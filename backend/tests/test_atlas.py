@@ -0,0 +1,100 @@
+"""
+Tests for the attendance atlas counts and GET /api/attendance/atlas.
+"""
+from sports_passport.models.atlas import UserAtlasCount
+from sports_passport.services.atlas import rebuild
+
+
+def _atlas(client, auth_headers):
+    response = client.get("/api/attendance/atlas", headers=auth_headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+def _rows(db_session):
+    return sorted(
+        (r.user_id, r.venue_id, r.league_id, r.count)
+        for r in db_session.query(UserAtlasCount)
+    )
+
+
+class TestAttendanceAtlas:
+    """Tests for GET /api/attendance/atlas."""
+
+    def test_empty(self, client, auth_headers):
+        assert _atlas(client, auth_headers) == {"states": {}, "venues": {}}
+
+    def test_counts_from_backfilled_attendance(
+        self, client, sample_attendance, sample_venues, auth_headers
+    ):
+        data = _atlas(client, auth_headers)
+        assert data["states"] == {
+            "Alabama": {"total": 1, "leagues": {"CFB": 1}},
+            "Michigan": {"total": 1, "leagues": {"CFB": 1}},
+        }
+        assert data["venues"][str(sample_venues[0].id)] == {"total": 1, "leagues": {"CFB": 1}}
+
+    def test_single_mark_and_delete_keep_counts_current(
+        self, client, sample_games, sample_venues, auth_headers
+    ):
+        ids = []
+        for game in (sample_games[0], sample_games[2]):     # both at Bryant-Denny
+            response = client.post("/api/attendance/", json={"game_id": game.id},
+                                   headers=auth_headers)
+            ids.append(response.json()["id"])
+        assert _atlas(client, auth_headers)["states"] == {
+            "Alabama": {"total": 2, "leagues": {"CFB": 2}},
+        }
+
+        # A rejected duplicate must not count twice.
+        client.post("/api/attendance/", json={"game_id": sample_games[0].id}, headers=auth_headers)
+        assert _atlas(client, auth_headers)["states"]["Alabama"]["total"] == 2
+
+        client.delete(f"/api/attendance/{ids[0]}", headers=auth_headers)
+        assert _atlas(client, auth_headers)["states"]["Alabama"]["total"] == 1
+        client.delete(f"/api/attendance/{ids[1]}", headers=auth_headers)
+        assert _atlas(client, auth_headers) == {"states": {}, "venues": {}}
+
+    def test_bulk_counts_only_inserted_rows(
+        self, client, sample_attendance, sample_games, auth_headers
+    ):
+        response = client.post(
+            "/api/attendance/bulk",
+            json={"games": [{"game_id": g.id} for g in sample_games]},
+            headers=auth_headers,
+        )
+        assert response.json()["created"] == 1
+        assert _atlas(client, auth_headers)["states"] == {
+            "Alabama": {"total": 2, "leagues": {"CFB": 2}},
+            "Michigan": {"total": 1, "leagues": {"CFB": 1}},
+        }
+
+    def test_game_moving_venue_recounts(
+        self, client, db_session, sample_attendance, sample_games, sample_venues, auth_headers
+    ):
+        sample_games[0].venue_id = sample_venues[2].id       # Bryant-Denny -> MSG
+        db_session.commit()
+        assert _atlas(client, auth_headers)["states"] == {
+            "NY": {"total": 1, "leagues": {"CFB": 1}},
+            "Michigan": {"total": 1, "leagues": {"CFB": 1}},
+        }
+
+    def test_state_correction_needs_no_recount(
+        self, client, db_session, sample_attendance, sample_venues, auth_headers
+    ):
+        sample_venues[0].state = "AL"
+        db_session.commit()
+        assert "AL" in _atlas(client, auth_headers)["states"]
+
+    def test_incremental_matches_rebuild(
+        self, client, db_session, sample_attendance, sample_games, auth_headers
+    ):
+        client.post("/api/attendance/", json={"game_id": sample_games[2].id}, headers=auth_headers)
+        client.delete(f"/api/attendance/{sample_attendance[1].id}", headers=auth_headers)
+        incremental = _rows(db_session)
+        rebuild(db_session)
+        db_session.commit()
+        assert _rows(db_session) == incremental
+
+    def test_requires_auth(self, client):
+        assert client.get("/api/attendance/atlas").status_code == 401
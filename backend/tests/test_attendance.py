@@ -1,10 +1,16 @@
 """
 Tests for attendance endpoints.
 """
+import csv
+import io
+import json
 from datetime import datetime
 
 import pytest
+from sqlalchemy import update
 
+from sports_passport.core import export
+from sports_passport.core.id_sets import ENCODING, decode_id_set
 from sports_passport.models.attendance import UserGameAttendance
 from sports_passport.models.game import Game
 
@@ -171,6 +177,133 @@ class TestBulkAttendance:
         assert response.status_code == 401
 
 
+    def test_bulk_statement_count_is_independent_of_payload_size(
+        self, client, db_session, sample_games, auth_headers
+    ):
+        """Validation, the existing-row check and the insert are set-at-a-time,
+        so a large payload costs the same handful of statements as a small one."""
+        from sqlalchemy import event
+
+        from tests.conftest import engine
+
+        statements = []
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        # Enough ids to span several insert chunks; all but three are unknown,
+        # which still exercises the single IN-list validation query.
+        games = [{"game_id": g.id} for g in sample_games]
+        games += [{"game_id": 100000 + i} for i in range(600)]
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            response = client.post(
+                "/api/attendance/bulk", json={"games": games}, headers=auth_headers
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+
+        assert response.status_code == 201
+        assert response.json()["created"] == 3
+        assert len(response.json()["errors"]) == 600
+        touching_attendance_or_games = [
+            s for s in statements
+            if "user_game_attendance" in s or s.lstrip().startswith("SELECT games.id")
+        ]
+        assert len(touching_attendance_or_games) <= 4
+
+
+class TestAttendanceImport:
+    """Tests for POST /api/attendance/import (CSV/JSON history upload)."""
+
+    def test_import_csv_resolves_games_by_natural_key(
+        self, client, db_session, test_user, sample_games, auth_headers
+    ):
+        # Game 0 is stored at 2023-09-02 23:30 UTC, i.e. the evening of Sept 2
+        # Eastern; game 2 at 2024-01-02 00:00 UTC is New Year's night.
+        csv_body = (
+            "League,Date,Home,Away,Notes\n"
+            "cfb,2023-09-02,Alabama,Michigan,Opener\n"
+            "CFB,2024-01-01,ALA,OSU,\n"
+        )
+        response = client.post(
+            "/api/attendance/import",
+            files={"file": ("history.csv", csv_body, "text/csv")},
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+        data = response.json()
+        assert (data["created"], data["skipped"], data["errors"]) == (2, 0, [])
+
+        rows = {
+            a.game_id: a.notes
+            for a in db_session.query(UserGameAttendance)
+            .filter(UserGameAttendance.user_id == test_user.id)
+        }
+        assert rows == {sample_games[0].id: "Opener", sample_games[2].id: None}
+
+    def test_import_json_reports_unresolved_rows(self, client, sample_games, auth_headers):
+        body = [
+            {"league": "CFB", "date": "2023-11-25", "home": "Michigan", "away": "Ohio State"},
+            {"league": "CFB", "date": "2023-11-26", "home": "Michigan", "away": "Ohio State"},
+            {"league": "XFL", "date": "2023-11-25", "home": "A", "away": "B"},
+            {"league": "CFB", "date": "2023-11-25", "home": "Nowhere U", "away": "Michigan"},
+            {"league": "CFB", "home": "Michigan", "away": "Ohio State"},
+        ]
+        response = client.post(
+            "/api/attendance/import",
+            files={"file": ("history.json", json.dumps(body), "application/json")},
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+        data = response.json()
+        assert data["created"] == 1
+        errors = " | ".join(data["errors"])
+        assert "Row 2: no CFB game" in errors
+        assert "Row 3: unknown league" in errors
+        assert "Row 4: unknown CFB team 'Nowhere U'" in errors
+        assert "Row 5: invalid or missing date" in errors
+
+    def test_import_skips_games_already_attended(
+        self, client, sample_attendance, sample_games, auth_headers
+    ):
+        body = {"games": [
+            {"league": "CFB", "date": "2023-09-02", "home": "Alabama", "away": "Michigan"},
+        ]}
+        response = client.post(
+            "/api/attendance/import",
+            files={"file": ("history.json", json.dumps(body), "application/json")},
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+        assert (response.json()["created"], response.json()["skipped"]) == (0, 1)
+
+    def test_import_jsonl_reports_the_bad_line(self, client, sample_games, auth_headers):
+        body = '{"league": "CFB", "date": "2023-11-25", "home": "Michigan", "away": "Ohio State"}\n\n{oops\n'
+        response = client.post(
+            "/api/attendance/import",
+            files={"file": ("history.jsonl", body, "application/x-ndjson")},
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+        assert "line 3" in response.json()["detail"]
+
+    def test_import_rejects_unknown_format(self, client, auth_headers):
+        response = client.post(
+            "/api/attendance/import",
+            files={"file": ("history.xlsx", b"PK\x03\x04", "application/zip")},
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+
+    def test_import_requires_auth(self, client):
+        response = client.post(
+            "/api/attendance/import",
+            files={"file": ("history.csv", "league,date,home,away\n", "text/csv")},
+        )
+        assert response.status_code == 401
+
+
 class TestListAttendance:
     """Tests for GET /api/attendance/ endpoint."""
 
@@ -224,6 +357,173 @@ class TestListAttendance:
         assert response.status_code == 401
 
 
+class TestAttendedGameIds:
+    """Tests for GET /api/attendance/game-ids."""
+
+    def test_returns_the_attended_ids(self, client, sample_attendance, sample_games, auth_headers):
+        response = client.get("/api/attendance/game-ids", headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == 2
+        assert data["encoding"] == ENCODING
+        assert decode_id_set(data["ids"]) == sorted([sample_games[0].id, sample_games[1].id])
+
+    def test_revalidates_until_attendance_changes(
+        self, client, sample_attendance, sample_games, auth_headers
+    ):
+        etag = client.get("/api/attendance/game-ids", headers=auth_headers).headers["etag"]
+        unchanged = client.get(
+            "/api/attendance/game-ids", headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert unchanged.status_code == 304
+        assert unchanged.content == b""
+
+        client.post("/api/attendance/", json={"game_id": sample_games[2].id}, headers=auth_headers)
+        changed = client.get(
+            "/api/attendance/game-ids", headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert changed.status_code == 200
+        assert changed.json()["count"] == 3
+
+    def test_empty(self, client, auth_headers):
+        response = client.get("/api/attendance/game-ids", headers=auth_headers)
+        assert response.json() == {"count": 0, "encoding": ENCODING, "ids": ""}
+
+    def test_requires_auth(self, client):
+        assert client.get("/api/attendance/game-ids").status_code == 401
+
+
+class TestAttendanceExport:
+    """Tests for GET /api/attendance/export."""
+
+    def test_csv(self, client, sample_attendance, sample_games, auth_headers):
+        response = client.get("/api/attendance/export", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert "sports-passport.csv" in response.headers["content-disposition"]
+
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [row["game_id"] for row in rows] == [str(sample_games[0].id), str(sample_games[1].id)]
+        assert {k: rows[0][k] for k in ("league", "date", "home", "away", "notes", "venue")} == {
+            "league": "CFB",
+            "date": "2023-09-02",
+            "home": "Alabama",
+            "away": "Michigan",
+            "notes": "Great game!",
+            "venue": "Bryant-Denny Stadium",
+        }
+        assert rows[0]["start"] == "2023-09-02T23:30:00+00:00"
+
+    def _reimport(self, client, db_session, test_user, sample_attendance, auth_headers, fmt):
+        body = client.get(f"/api/attendance/export?format={fmt}", headers=auth_headers).text
+        for attendance in sample_attendance:
+            client.delete(f"/api/attendance/{attendance.id}", headers=auth_headers)
+
+        media_type = export.FORMATS[fmt][0]
+        response = client.post(
+            "/api/attendance/import",
+            files={"file": (f"sports-passport.{fmt}", body, media_type)},
+            headers=auth_headers,
+        )
+        assert response.status_code == 201, response.text
+        assert response.json()["errors"] == []
+        return {
+            a.game_id: a.notes
+            for a in db_session.query(UserGameAttendance)
+            .filter(UserGameAttendance.user_id == test_user.id)
+        }
+
+    @pytest.mark.parametrize("fmt", ["csv", "jsonl"])
+    def test_imports_back(
+        self, client, db_session, test_user, sample_attendance, sample_games, auth_headers, fmt
+    ):
+        rows = self._reimport(client, db_session, test_user, sample_attendance, auth_headers, fmt)
+        assert rows == {sample_games[0].id: "Great game!", sample_games[1].id: "Amazing atmosphere"}
+
+    @pytest.mark.parametrize("fmt", ["csv", "jsonl"])
+    def test_game_without_a_local_date_imports_back(
+        self, client, db_session, test_user, sample_attendance, sample_games, auth_headers, fmt
+    ):
+        # Rows written by a Core path that skipped the column carry no local date.
+        db_session.execute(update(Game).values(local_game_date=None))
+        db_session.commit()
+
+        rows = self._reimport(client, db_session, test_user, sample_attendance, auth_headers, fmt)
+        assert set(rows) == {sample_games[0].id, sample_games[1].id}
+
+    def test_game_without_a_local_date_exports_its_start_day(
+        self, client, db_session, sample_attendance, sample_games, auth_headers
+    ):
+        sample_games[0].has_time = False
+        db_session.commit()
+        db_session.execute(update(Game).values(local_game_date=None))
+        db_session.commit()
+
+        records = [
+            json.loads(line)
+            for line in client.get(
+                "/api/attendance/export?format=jsonl", headers=auth_headers
+            ).text.splitlines()
+        ]
+        assert records[0]["date"] == "2023-09-02"
+        ics = client.get("/api/attendance/export?format=ics", headers=auth_headers).text
+        assert "DTSTART;VALUE=DATE:20230902" in ics
+
+    def test_jsonl(self, client, db_session, sample_attendance, sample_venues, auth_headers):
+        sample_venues[0].latitude, sample_venues[0].longitude = 33.208, -87.550
+        db_session.commit()
+        response = client.get("/api/attendance/export?format=jsonl", headers=auth_headers)
+        assert response.headers["content-type"] == "application/x-ndjson"
+
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert len(records) == 2
+        assert list(records[0]) == list(export.EXPORT_FIELDS)
+        assert (records[0]["latitude"], records[0]["longitude"]) == (33.208, -87.550)
+        assert records[1]["latitude"] is None
+
+    def test_ics(self, client, db_session, sample_attendance, sample_games, auth_headers):
+        sample_attendance[0].notes = "Rain; then sun, " + "and a very long night " * 5
+        db_session.commit()
+        response = client.get("/api/attendance/export?format=ics", headers=auth_headers)
+        assert response.headers["content-type"].startswith("text/calendar")
+
+        text = response.text
+        assert text.startswith("BEGIN:VCALENDAR\r\n")
+        assert text.endswith("END:VCALENDAR\r\n")
+        assert text.count("BEGIN:VEVENT") == 2
+        assert "DTSTART:20230902T233000Z" in text
+        assert "SUMMARY:Michigan @ Alabama (28-35)" in text
+        assert all(len(line.encode()) <= 75 for line in text.split("\r\n"))
+        unfolded = text.replace("\r\n ", "")
+        assert "DESCRIPTION:Rain\\; then sun\\, and a very long night" in unfolded
+
+    def test_date_only_game_is_an_all_day_event(
+        self, client, db_session, sample_attendance, sample_games, auth_headers
+    ):
+        sample_games[0].has_time = False
+        db_session.commit()
+        text = client.get("/api/attendance/export?format=ics", headers=auth_headers).text
+        assert "DTSTART;VALUE=DATE:20230902" in text
+
+    def test_streams_a_chunk_per_batch(
+        self, db_session, test_user, sample_attendance, monkeypatch
+    ):
+        monkeypatch.setattr(export, "EXPORT_BATCH_SIZE", 1)
+        chunks = list(export.stream_export(db_session, test_user.id, "jsonl"))
+        assert len(chunks) == 2
+
+    def test_empty_history_is_just_the_header(self, client, auth_headers):
+        response = client.get("/api/attendance/export", headers=auth_headers)
+        assert response.text.strip() == ",".join(export.EXPORT_FIELDS)
+
+    def test_unknown_format(self, client, auth_headers):
+        response = client.get("/api/attendance/export?format=xlsx", headers=auth_headers)
+        assert response.status_code == 422
+
+    def test_requires_auth(self, client):
+        assert client.get("/api/attendance/export").status_code == 401
+
+
 class TestAttendanceStats:
     """Tests for GET /api/attendance/stats endpoint."""
 
@@ -351,6 +651,16 @@ class TestAttendanceStats:
         assert data["unique_stadiums"] == 1
         assert data["new_venues_by_season"] == {"2023": 1}
 
+    def test_rows_without_a_stored_local_date(
+        self, client, db_session, sample_attendance, auth_headers
+    ):
+        """A game written around the ORM, with no local date, still counts."""
+        db_session.execute(update(Game).values(local_game_date=None))
+        db_session.commit()
+        data = client.get("/api/attendance/stats", headers=auth_headers).json()
+        assert data["games_by_weekday"] == {"5": 2}
+        assert data["longest_gap_days"] == 84
+
     def test_weekday_month_and_longest_gap(self, client, sample_attendance, auth_headers):
         """Both attended games fall on a Saturday, 84 days apart.
 
@@ -595,9 +905,9 @@ class TestAttendanceUniqueness:
         """A row committed by a concurrent request between the lookup and the
         insert must cost only itself.
 
-        Before the per-row savepoint the unique index aborted the whole
-        transaction at commit, so one collided row took every good row with it
-        and the caller got a 500 with nothing saved.
+        Originally the unique index aborted the whole transaction at commit, so
+        one collided row took every good row with it and the caller got a 500
+        with nothing saved. ON CONFLICT DO NOTHING now drops just that row.
 
         The tests share one session with the endpoint (see conftest), so a row
         committed here is visible to the lookup and would simply be skipped.
@@ -612,8 +922,8 @@ class TestAttendanceUniqueness:
         db_session.commit()
 
         monkeypatch.setattr(
-            "sports_passport.routers.attendance._existing_attendance",
-            lambda db, user_id, game_id: None,
+            "sports_passport.routers.attendance._existing_attended_ids",
+            lambda db, user_id, game_ids: set(),
         )
 
         response = client.post(
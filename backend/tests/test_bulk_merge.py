@@ -0,0 +1,168 @@
+"""
+Tests for the staging-table game merge the bulk importers use.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from sports_passport.core import response_cache
+from sports_passport.core.metrics import tracking_import
+from sports_passport.models.game import Game
+from sports_passport.models.league_stats import LeagueStats
+from sports_passport.services.adapters.base import ImportResult
+from sports_passport.services.atlas import rebuild
+from sports_passport.services.bulk_merge import GameBatch
+
+
+def _add(batch, league, teams, n, *, season=2024, **fields):
+    batch.add(
+        f"g{n}",
+        league_id=league.id,
+        home_team_id=teams[0].id,
+        away_team_id=teams[1].id,
+        home_score=fields.pop("home_score", n),
+        away_score=0,
+        start_date=datetime(season, 9, 1) + timedelta(days=n % 60),
+        has_time=False,
+        season=season,
+        venue_id=fields.pop("venue_id", None),
+        **fields,
+    )
+
+
+def _games(db_session):
+    db_session.expire_all()
+    return {
+        g.source_game_id: g
+        for g in db_session.query(Game).filter(Game.source == "bulk-test")
+    }
+
+
+class TestGameBatch:
+    def test_inserts_then_updates_only_what_changed(
+        self, db_session, cfb_league, sample_teams
+    ):
+        batch = GameBatch(db_session, "bulk-test")
+        for n in range(3):
+            _add(batch, cfb_league, sample_teams, n)
+        first = ImportResult(league="CFB")
+        batch.merge_into(first)
+        assert (first.games_imported, first.games_updated, first.errors) == (3, 0, [])
+
+        batch = GameBatch(db_session, "bulk-test")
+        for n in range(4):
+            _add(batch, cfb_league, sample_teams, n, home_score=99 if n == 1 else n)
+        second = ImportResult(league="CFB")
+        with tracking_import("CFB", "test") as run:
+            batch.merge_into(second)
+        assert (second.games_imported, second.games_updated) == (1, 3)
+        assert (run.rows["inserted"], run.rows["updated"], run.rows["unchanged"]) == (1, 1, 2)
+
+        games = _games(db_session)
+        assert sorted(games) == ["g0", "g1", "g2", "g3"]
+        assert games["g1"].home_score == 99
+        assert games["g0"].has_time is False
+
+    def test_repeated_id_keeps_the_last_row(self, db_session, cfb_league, sample_teams):
+        batch = GameBatch(db_session, "bulk-test")
+        _add(batch, cfb_league, sample_teams, 0, home_score=1)
+        _add(batch, cfb_league, sample_teams, 0, home_score=2)
+        result = ImportResult(league="CFB")
+        batch.merge_into(result)
+        assert (result.games_imported, result.games_updated) == (1, 1)
+        assert _games(db_session)["g0"].home_score == 2
+
+    def test_team_from_another_league_is_reported(
+        self, db_session, cfb_league, sample_teams, sample_nhl_teams
+    ):
+        batch = GameBatch(db_session, "bulk-test")
+        _add(batch, cfb_league, sample_teams, 0)
+        _add(batch, cfb_league, [sample_teams[0], sample_nhl_teams[0]], 1)
+        result = ImportResult(league="CFB")
+        batch.merge_into(result)
+        assert result.games_imported == 1
+        assert result.errors == ["game g1: team not in this league"]
+        assert sorted(_games(db_session)) == ["g0"]
+
+    def test_fields_must_match_the_batch(self, db_session, cfb_league, sample_teams):
+        batch = GameBatch(db_session, "bulk-test")
+        _add(batch, cfb_league, sample_teams, 0)
+        with pytest.raises(ValueError, match="differ"):
+            _add(batch, cfb_league, sample_teams, 1, week=3)
+
+    def test_commits_each_season(self, db_session, cfb_league, sample_teams):
+        batch = GameBatch(db_session, "bulk-test")
+        for season in (2022, 2021, 2023):
+            _add(batch, cfb_league, sample_teams, season, season=season)
+        commits = []
+        original = db_session.commit
+        db_session.commit = lambda: (commits.append(len(_games(db_session))), original())[1]
+        batch.merge_into(ImportResult(league="CFB"))
+        assert commits == [1, 2, 3]
+        assert len(batch) == 0
+
+    def test_statements_do_not_grow_with_rows(
+        self, db_session, cfb_league, sample_teams, query_budget
+    ):
+        batch = GameBatch(db_session, "bulk-test")
+        for n in range(500):
+            _add(batch, cfb_league, sample_teams, n)
+        with query_budget(15, max_repeats=3):
+            batch.merge_into(ImportResult(league="CFB"))
+        assert len(_games(db_session)) == 500
+
+
+class TestBookkeeping:
+    def test_league_stats_are_recounted(self, db_session, cfb_league, sample_games, sample_teams):
+        batch = GameBatch(db_session, "bulk-test")
+        for n in range(4):
+            _add(batch, cfb_league, sample_teams, n, season=2030)
+        batch.merge_into(ImportResult(league="CFB"))
+        db_session.expire_all()
+        stats = db_session.get(LeagueStats, cfb_league.id)
+        assert stats is not None
+        assert (stats.games, stats.last_season) == (7, 2030)
+
+    def test_cached_responses_are_invalidated(self, db_session, cfb_league, sample_teams):
+        before = response_cache.data_generation()
+        batch = GameBatch(db_session, "bulk-test")
+        _add(batch, cfb_league, sample_teams, 0)
+        batch.merge_into(ImportResult(league="CFB"))
+        assert response_cache.data_generation() > before
+
+    def test_unchanged_merge_leaves_the_cache(self, db_session, cfb_league, sample_teams):
+        batch = GameBatch(db_session, "bulk-test")
+        _add(batch, cfb_league, sample_teams, 0)
+        batch.merge_into(ImportResult(league="CFB"))
+        before = response_cache.data_generation()
+        batch = GameBatch(db_session, "bulk-test")
+        _add(batch, cfb_league, sample_teams, 0)
+        batch.merge_into(ImportResult(league="CFB"))
+        assert response_cache.data_generation() == before
+
+    def test_moving_a_game_rebuilds_its_attendees_atlas(
+        self, client, db_session, cfb_league, sample_teams, sample_attendance,
+        sample_games, sample_venues, auth_headers,
+    ):
+        game = sample_games[0]
+        batch = GameBatch(db_session, game.source)
+        batch.add(
+            game.source_game_id,
+            league_id=cfb_league.id,
+            home_team_id=game.home_team_id,
+            away_team_id=game.away_team_id,
+            season=game.season,
+            venue_id=sample_venues[2].id,               # Bryant-Denny -> MSG
+        )
+        batch.merge_into(ImportResult(league="CFB"))
+
+        atlas = client.get("/api/attendance/atlas", headers=auth_headers).json()
+        assert atlas["states"] == {
+            "NY": {"total": 1, "leagues": {"CFB": 1}},
+            "Michigan": {"total": 1, "leagues": {"CFB": 1}},
+        }
+        # Same as recounting from scratch.
+        before = atlas["venues"]
+        rebuild(db_session)
+        db_session.commit()
+        assert client.get("/api/attendance/atlas", headers=auth_headers).json()["venues"] == before
@@ -0,0 +1,75 @@
+"""
+Tests for the CFB adapter's team import using mocked CollegeFootballData.com
+(CFBD) payloads.
+"""
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from sports_passport.models.team import Team
+from sports_passport.services.adapters.cfb import CfbAdapter
+from sports_passport.services.importer import ImportMemoryExceeded
+
+ALABAMA = {
+    "id": 333, "school": "Alabama", "mascot": "Crimson Tide", "abbreviation": "ALA",
+    "conference": "SEC", "division": "West", "classification": "fbs",
+}
+MONTANA = {
+    "id": 149, "school": "Montana", "mascot": "Grizzlies", "abbreviation": "MONT",
+    "conference": "Big Sky", "division": None, "classification": "fcs",
+}
+
+
+def _fake_get(fcs=None):
+    async def fake_get(endpoint, params=None):
+        if endpoint == "/teams/fbs":
+            return [ALABAMA]
+        if endpoint == "/teams":
+            if isinstance(fcs, Exception):
+                raise fcs
+            return [MONTANA] if fcs is None else fcs
+        raise AssertionError(f"unexpected endpoint {endpoint} {params}")
+
+    return fake_get
+
+
+@pytest.fixture
+def adapter(db_session):
+    return CfbAdapter(db_session)
+
+
+class TestCfbImportTeams:
+    @pytest.mark.asyncio
+    async def test_import_teams(self, adapter, db_session, cfb_league):
+        with patch.object(adapter, "_get", AsyncMock(side_effect=_fake_get())):
+            result = await adapter.import_teams()
+
+        assert result.teams_imported == 2
+        montana = db_session.query(Team).filter(Team.name == "Montana").one()
+        assert montana.classification == "fcs"
+        assert montana.league_id == cfb_league.id
+
+    @pytest.mark.asyncio
+    async def test_fcs_failure_is_best_effort(self, adapter):
+        request = httpx.Request("GET", "https://api.example.com/teams")
+        error = httpx.HTTPStatusError(
+            "503", request=request, response=httpx.Response(503, request=request)
+        )
+        with patch.object(adapter, "_get", AsyncMock(side_effect=_fake_get(fcs=error))):
+            result = await adapter.import_teams()
+
+        assert result.teams_imported == 1
+        assert result.errors[0].startswith("FCS team import skipped")
+
+    @pytest.mark.asyncio
+    async def test_memory_ceiling_is_not_swallowed(self, adapter):
+        """The ceiling can trip on an FCS upsert; it must stop the run, not
+        read as a skipped FCS fetch."""
+        ceiling = ImportMemoryExceeded("import stopped at 900 MB RSS, over the 800 MB limit")
+        with (
+            patch.object(adapter, "_get", AsyncMock(side_effect=_fake_get())),
+            patch.object(adapter, "_upsert_team_row", side_effect=[True, ceiling]),
+            pytest.raises(ImportMemoryExceeded),
+        ):
+            await adapter.import_teams()
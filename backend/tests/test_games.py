@@ -1,6 +1,9 @@
 """
 Tests for games endpoints.
 """
+from sqlalchemy import update
+
+from sports_passport.models.game import Game
 
 
 class TestListGames:
@@ -65,6 +68,43 @@ class TestListGames:
         data = response.json()
         assert len(data) == 2
 
+    def test_list_games_near(self, client, db_session, sample_games, sample_venues, auth_headers):
+        """near= keeps games at venues within radius_km of the point."""
+        sample_venues[0].latitude, sample_venues[0].longitude = 33.208, -87.550   # Tuscaloosa
+        sample_venues[1].latitude, sample_venues[1].longitude = 42.266, -83.749   # Ann Arbor
+        db_session.commit()
+
+        response = client.get(
+            "/api/games/", params={"near": "33.52,-86.80", "radius_km": 100},   # Birmingham
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 2
+        assert all(game["venue"]["name"] == "Bryant-Denny Stadium" for game in data)
+
+        response = client.get("/api/games/", params={"near": "0,0"}, headers=auth_headers)
+        assert response.json() == []
+
+    def test_list_games_near_rejects_bad_point(self, client, auth_headers):
+        for near in ("40.7", "north,west", "95,0"):
+            response = client.get("/api/games/", params={"near": near}, headers=auth_headers)
+            assert response.status_code == 400
+
+    def test_list_games_flags_attended(self, client, sample_attendance, sample_games, auth_headers):
+        """Each row says whether the caller attended it."""
+        response = client.get("/api/games/", headers=auth_headers)
+        attended = {game["id"]: game["attended"] for game in response.json()}
+        assert attended == {
+            sample_games[0].id: True, sample_games[1].id: True, sample_games[2].id: False,
+        }
+
+    def test_attended_flag_is_per_caller(
+        self, client, sample_attendance, sample_games, admin_headers
+    ):
+        response = client.get("/api/games/", headers=admin_headers)
+        assert not any(game["attended"] for game in response.json())
+
     def test_list_games_requires_auth(self, client, sample_games):
         """Test that listing games requires authentication."""
         response = client.get("/api/games/")
@@ -172,6 +212,94 @@ class TestListSeasons:
         assert response.json() == []
 
 
+class TestGamesOnDate:
+    """Tests for GET /api/games/on/{day} endpoint."""
+
+    def test_games_on_a_local_date(self, client, sample_games, auth_headers):
+        """Test a game is found on the day it was played, not its UTC date."""
+        response = client.get("/api/games/on/2024-01-01", headers=auth_headers)
+        assert response.status_code == 200
+        assert [g["id"] for g in response.json()] == [sample_games[2].id]
+        assert client.get("/api/games/on/2024-01-02", headers=auth_headers).json() == []
+
+    def test_flags_attended(self, client, sample_attendance, sample_games, auth_headers):
+        """Test each game carries the caller's attended flag."""
+        response = client.get("/api/games/on/2023-09-02", headers=auth_headers)
+        assert [(g["id"], g["attended"]) for g in response.json()] == [(sample_games[0].id, True)]
+
+    def test_league_filter(self, client, sample_games, sample_nhl_teams, auth_headers):
+        """Test filtering by league code."""
+        response = client.get("/api/games/on/2023-09-02?league=NHL", headers=auth_headers)
+        assert response.json() == []
+
+    def test_invalid_date(self, client, auth_headers):
+        """Test a malformed date is rejected."""
+        response = client.get("/api/games/on/2023-13-01", headers=auth_headers)
+        assert response.status_code == 422
+
+
+class TestGamesInRange:
+    """Tests for GET /api/games/range endpoint."""
+
+    def test_range_is_inclusive_and_oldest_first(self, client, sample_games, auth_headers):
+        """Test both ends of the range are included, in date order."""
+        response = client.get(
+            "/api/games/range?start=2023-09-02&end=2024-01-01", headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert [g["id"] for g in response.json()] == [g.id for g in sample_games]
+
+    def test_pagination(self, client, sample_games, auth_headers):
+        """Test skip and limit page through the range."""
+        response = client.get(
+            "/api/games/range?start=2023-09-01&end=2024-01-31&skip=1&limit=1",
+            headers=auth_headers,
+        )
+        assert [g["id"] for g in response.json()] == [sample_games[1].id]
+
+    def test_rejects_backwards_or_overlong_range(self, client, auth_headers):
+        """Test the range must run forward and stay within a year."""
+        for query in ("start=2024-01-02&end=2024-01-01", "start=2020-01-01&end=2024-01-01"):
+            response = client.get(f"/api/games/range?{query}", headers=auth_headers)
+            assert response.status_code == 400
+
+
+class TestGameCalendar:
+    """Tests for GET /api/games/calendar endpoint."""
+
+    def test_counts_per_local_day(self, client, sample_games, auth_headers):
+        """Test a season's games are counted per local day, in day order."""
+        response = client.get("/api/games/calendar?season=2023&league=CFB", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json() == [
+            {"day": "2023-09-02", "game_count": 1},
+            {"day": "2023-11-25", "game_count": 1},
+            {"day": "2024-01-01", "game_count": 1},
+        ]
+
+    def test_other_season_or_league_is_empty(self, client, sample_games, auth_headers):
+        """Test nothing is counted outside the league and season."""
+        assert client.get("/api/games/calendar?season=2022", headers=auth_headers).json() == []
+        response = client.get("/api/games/calendar?season=2023&league=NHL", headers=auth_headers)
+        assert response.json() == []
+
+    def test_rows_without_a_local_date_are_left_out(
+        self, client, db_session, sample_games, auth_headers
+    ):
+        """Test a game written around the ORM, with no local date, is skipped."""
+        db_session.execute(
+            update(Game).where(Game.id == sample_games[0].id).values(local_game_date=None)
+        )
+        db_session.commit()
+        response = client.get("/api/games/calendar?season=2023&league=CFB", headers=auth_headers)
+        assert response.status_code == 200
+        assert [d["day"] for d in response.json()] == ["2023-11-25", "2024-01-01"]
+
+    def test_season_required(self, client, auth_headers):
+        """Test the season parameter is required."""
+        assert client.get("/api/games/calendar", headers=auth_headers).status_code == 422
+
+
 class TestCountGames:
     """Tests for GET /api/games/count endpoint."""
 
@@ -0,0 +1,61 @@
+"""
+Tests for the venue distance helpers.
+"""
+import math
+
+import pytest
+
+from sports_passport.services.geo import KM_PER_DEGREE, BoundingBox, bounding_box, haversine_km
+
+
+def _destination(lat: float, lon: float, bearing: float, km: float) -> tuple[float, float]:
+    """The point `km` from (lat, lon) along `bearing` degrees (spherical earth)."""
+    phi, lam, theta = math.radians(lat), math.radians(lon), math.radians(bearing)
+    delta = km / (KM_PER_DEGREE * 180 / math.pi)
+    phi2 = math.asin(math.sin(phi) * math.cos(delta)
+                     + math.cos(phi) * math.sin(delta) * math.cos(theta))
+    lam2 = lam + math.atan2(math.sin(theta) * math.sin(delta) * math.cos(phi),
+                            math.cos(delta) - math.sin(phi) * math.sin(phi2))
+    return math.degrees(phi2), (math.degrees(lam2) + 540) % 360 - 180
+
+
+def _contains(box: BoundingBox, lat: float, lon: float) -> bool:
+    if not box.south - 1e-9 <= lat <= box.north + 1e-9:
+        return False
+    if box.west <= box.east:
+        return box.west - 1e-9 <= lon <= box.east + 1e-9
+    return lon >= box.west - 1e-9 or lon <= box.east + 1e-9
+
+
+class TestHaversine:
+    def test_known_distance(self):
+        """Madison Square Garden to Crypto.com Arena is about 3,940 km."""
+        assert haversine_km((40.7505, -73.9934), (34.0430, -118.2673)) == pytest.approx(3936, abs=10)
+
+    def test_across_the_antimeridian(self):
+        assert haversine_km((0, 179.5), (0, -179.5)) == pytest.approx(KM_PER_DEGREE, rel=1e-6)
+
+    def test_same_point(self):
+        assert haversine_km((33.2, -87.5), (33.2, -87.5)) == 0
+
+
+class TestBoundingBox:
+    @pytest.mark.parametrize("lat, lon, km", [
+        (40.75, -73.99, 100),
+        (-33.86, 151.21, 800),
+        (64.0, -150.0, 1500),   # Alaska: longitude degrees are short
+        (-18.0, 179.0, 400),    # wraps the antimeridian eastward
+        (10.0, -179.5, 300),    # and westward
+    ])
+    def test_contains_the_circle(self, lat, lon, km):
+        box = bounding_box(lat, lon, km)
+        for bearing in range(0, 360, 5):
+            assert _contains(box, *_destination(lat, lon, bearing, km))
+
+    def test_antimeridian_box_wraps(self):
+        box = bounding_box(-18.0, 179.0, 400)
+        assert box.west > box.east
+
+    def test_circle_over_a_pole_takes_every_longitude(self):
+        box = bounding_box(88.0, 20.0, 500)
+        assert (box.west, box.east, box.north) == (-180.0, 180.0, 90.0)
@@ -0,0 +1,83 @@
+"""
+Tests for the append-only geocode cache behind scripts/geocode_venues.py.
+"""
+import json
+
+from sports_passport.services.geocode_cache import GeocodeCache
+
+
+class TestGeocodeCache:
+    """Appends are O(1), reloads replay the log, and old caches migrate."""
+
+    def test_answers_survive_a_reload(self, tmp_path):
+        path = tmp_path / "geocode_cache.jsonl"
+        with GeocodeCache(path) as cache:
+            cache["boston|ma|usa"] = [42.36, -71.06]
+            cache["venue|nowhere field"] = None     # a miss is a real answer
+
+        reloaded = GeocodeCache(path)
+        assert reloaded["boston|ma|usa"] == [42.36, -71.06]
+        assert "venue|nowhere field" in reloaded
+        assert reloaded["venue|nowhere field"] is None
+
+    def test_each_answer_appends_one_line(self, tmp_path):
+        """The old store rewrote the whole file per answer; this must not."""
+        path = tmp_path / "geocode_cache.jsonl"
+        cache = GeocodeCache(path)
+        for i in range(3):
+            cache[f"city{i}"] = [float(i), float(i)]
+            assert len(path.read_text().splitlines()) == i + 1
+        cache.close()
+
+    def test_torn_final_line_is_skipped(self, tmp_path):
+        path = tmp_path / "geocode_cache.jsonl"
+        path.write_text(json.dumps({"k": "a", "v": [1.0, 2.0]}) + "\n" + '{"k": "b", "v": [3')
+
+        cache = GeocodeCache(path)
+        assert cache["a"] == [1.0, 2.0]
+        assert "b" not in cache
+
+    def test_append_after_a_torn_line_starts_a_fresh_one(self, tmp_path):
+        path = tmp_path / "geocode_cache.jsonl"
+        path.write_text(json.dumps({"k": "a", "v": [1.0, 2.0]}) + "\n" + '{"k": "b", "v": [3')
+
+        cache = GeocodeCache(path)
+        cache["c"] = [5.0, 6.0]
+        cache.close()
+
+        reloaded = GeocodeCache(path)
+        assert reloaded["c"] == [5.0, 6.0]
+        assert "b" not in reloaded
+        assert len(path.read_text().splitlines()) == 2
+
+    def test_reading_leaves_the_log_untouched(self, tmp_path):
+        """The export script only reads; closing must not compact behind it."""
+        path = tmp_path / "geocode_cache.jsonl"
+        lines = [json.dumps({"k": "a", "v": [float(i), 0.0]}) for i in range(3)]
+        path.write_text("\n".join(lines) + "\n" + '{"k": "b"')
+        before = path.read_bytes()
+
+        with GeocodeCache(path) as cache:
+            assert cache["a"] == [2.0, 0.0]
+        assert path.read_bytes() == before
+
+    def test_later_lines_win_and_close_compacts(self, tmp_path):
+        path = tmp_path / "geocode_cache.jsonl"
+        with GeocodeCache(path) as cache:
+            for value in ([1.0, 1.0], [2.0, 2.0], [3.0, 3.0]):
+                cache["a"] = value
+
+        assert path.read_text().splitlines() == [json.dumps({"k": "a", "v": [3.0, 3.0]})]
+        assert GeocodeCache(path)["a"] == [3.0, 3.0]
+
+    def test_legacy_json_is_imported_once(self, tmp_path):
+        legacy = tmp_path / "geocode_cache.json"
+        legacy.write_text(json.dumps({"chicago|il|usa": [41.88, -87.63], "venue|x": None}))
+        path = tmp_path / "geocode_cache.jsonl"
+
+        cache = GeocodeCache(path, legacy_path=legacy)
+        assert len(cache) == 2
+        assert path.exists()
+
+        legacy.write_text(json.dumps({"ignored": [0.0, 0.0]}))   # log now authoritative
+        assert "ignored" not in GeocodeCache(path, legacy_path=legacy)
@@ -0,0 +1,31 @@
+"""
+Tests for the compact id-set encoding behind GET /api/attendance/game-ids.
+"""
+import pytest
+
+from sports_passport.core.id_sets import decode_id_set, encode_id_set
+
+
+class TestIdSets:
+    def test_round_trip(self):
+        ids = [5, 1, 300, 301, 2**40, 127, 128]
+        assert decode_id_set(encode_id_set(ids)) == sorted(ids)
+
+    def test_duplicates_and_order_do_not_matter(self):
+        assert encode_id_set([3, 1, 3, 2]) == encode_id_set([1, 2, 3])
+
+    def test_empty(self):
+        assert encode_id_set([]) == ""
+        assert decode_id_set("") == []
+
+    def test_dense_ids_take_a_byte_each(self):
+        encoded = encode_id_set(range(1, 10_001))
+        assert len(encoded) == len("A" * 10_000) * 4 // 3 + 1   # unpadded base64 of 10,000 bytes
+
+    def test_rejects_negative_ids(self):
+        with pytest.raises(ValueError):
+            encode_id_set([-1])
+
+    def test_rejects_a_truncated_set(self):
+        with pytest.raises(ValueError):
+            decode_id_set(encode_id_set([1000])[:2])
@@ -0,0 +1,86 @@
+"""
+Tests for running imports off the API's event loop.
+"""
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from sports_passport.core.metrics import _current_run, tracking_import
+from sports_passport.services.import_runner import run_import
+
+
+def _adapter(call):
+    adapter = Mock()
+    adapter.sync_recent = AsyncMock(side_effect=call)
+    adapter.aclose = AsyncMock()
+    return adapter
+
+
+class TestRunImport:
+    def test_runs_on_an_import_thread_and_returns_its_result(self):
+        async def sync(since=None):
+            return threading.current_thread().name
+
+        adapter = _adapter(sync)
+        thread = asyncio.run(run_import(adapter, adapter.sync_recent))
+        assert thread.startswith("import")
+        adapter.aclose.assert_awaited_once()
+
+    def test_loop_keeps_running_while_the_import_blocks(self):
+        async def sync(since=None):
+            time.sleep(0.3)     # parsing and SQLite writes, as far as the loop can tell
+
+        async def main():
+            ticks = 0
+
+            async def tick():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            ticker = asyncio.create_task(tick())
+            adapter = _adapter(sync)
+            await run_import(adapter, adapter.sync_recent)
+            ticker.cancel()
+            return ticks
+
+        assert asyncio.run(main()) >= 10
+
+    def test_errors_propagate_and_the_adapter_is_closed(self):
+        adapter = _adapter(RuntimeError("network down"))
+        with pytest.raises(RuntimeError, match="network down"):
+            asyncio.run(run_import(adapter, adapter.sync_recent))
+        adapter.aclose.assert_awaited_once()
+
+    def test_timeout_cancels_the_import(self):
+        cancelled = threading.Event()
+
+        async def sync(since=None):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        adapter = _adapter(sync)
+        with pytest.raises(TimeoutError):
+            asyncio.run(run_import(adapter, adapter.sync_recent, timeout=0.05))
+        assert cancelled.is_set()
+        adapter.aclose.assert_awaited_once()
+
+    def test_tracked_import_follows_into_the_thread(self):
+        async def sync(since=None):
+            return _current_run.get()
+
+        adapter = _adapter(sync)
+
+        async def main():
+            with tracking_import("XRI", "sync") as run:
+                return run, await run_import(adapter, adapter.sync_recent)
+
+        run, seen = asyncio.run(main())
+        assert seen is run
@@ -1,13 +1,22 @@
 """
 Tests for the shared importer helpers and multi-league behavior.
 """
+import gc
 from datetime import datetime
 
 import pytest
 
+from sports_passport.core.config import settings
 from sports_passport.models.game import Game
 from sports_passport.models.team import Team
-from sports_passport.services.importer import get_league, upsert_game, upsert_team, upsert_venue
+from sports_passport.services import importer
+from sports_passport.services.importer import (
+    ImportMemoryExceeded,
+    get_league,
+    upsert_game,
+    upsert_team,
+    upsert_venue,
+)
 
 
 class TestUpserts:
@@ -78,6 +87,44 @@ class TestUpserts:
             get_league(db_session, "XFL")
 
 
+class TestCheckpoints:
+    """Long imports must not hold every updated row until their commit."""
+
+    def _reimport(self, db_session, games, **fields):
+        for game in games:
+            upsert_game(
+                db_session, source=game.source, source_game_id=game.source_game_id,
+                league_id=game.league_id, home_team_id=game.home_team_id,
+                away_team_id=game.away_team_id, start_date=game.start_date,
+                season=game.season, **fields,
+            )
+
+    def test_updates_are_flushed_every_checkpoint(
+        self, db_session, sample_games, monkeypatch
+    ):
+        monkeypatch.setattr(importer, "CHECKPOINT_EVERY", 3)
+        db_session.info.pop("upserts_since_checkpoint", None)
+        games = list(sample_games)
+        db_session.expunge_all()
+
+        self._reimport(db_session, games[:2], home_score=99)
+        assert len(db_session.dirty) == 2        # updated, held until a flush
+        self._reimport(db_session, games[2:], home_score=99)
+        assert not db_session.dirty              # the third upsert flushed them
+        del games
+        gc.collect()
+        assert len(db_session.identity_map) == 0
+
+        db_session.commit()
+        assert {g.home_score for g in db_session.query(Game)} == {99}
+
+    def test_memory_ceiling_stops_the_import(self, db_session, sample_games, monkeypatch):
+        monkeypatch.setattr(importer, "CHECKPOINT_EVERY", 1)
+        monkeypatch.setattr(settings, "import_memory_limit_mb", 1)
+        with pytest.raises(ImportMemoryExceeded, match="over the 1 MB limit"):
+            self._reimport(db_session, sample_games, home_score=1)
+
+
 class TestMultiLeagueFilters:
     """Games endpoints must separate leagues cleanly."""
 
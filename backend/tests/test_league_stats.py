@@ -0,0 +1,108 @@
+"""
+Tests for the per-league catalog counts behind GET /api/admin/status.
+"""
+from datetime import datetime
+
+from sports_passport.models.game import Game
+from sports_passport.models.league_stats import LeagueStats
+from sports_passport.services import league_stats
+from sports_passport.services.importer import upsert_game
+
+
+def _stats(db_session, league_id):
+    db_session.expire_all()
+    row = db_session.get(LeagueStats, league_id)
+    assert row is not None
+    return (
+        row.games, row.teams, row.venues, row.first_season, row.last_season, row.last_game_at
+    )
+
+
+def _recounted(db_session, league_id):
+    league_stats.recount(db_session, [league_id])
+    db_session.commit()
+    return _stats(db_session, league_id)
+
+
+def _game(league, teams, n, **fields):
+    return {
+        "league_id": league.id,
+        "home_team_id": teams[0].id,
+        "away_team_id": teams[1].id,
+        "start_date": datetime(2024, 9, 1 + n),
+        "season": 2024,
+        **fields,
+    }
+
+
+class TestIncrementalCounts:
+    def test_inserts_match_a_recount(self, db_session, cfb_league, sample_games, sample_teams):
+        counted = _stats(db_session, cfb_league.id)
+        assert counted == (
+            3, len(sample_teams), 2, 2023, 2023, datetime(2024, 1, 2, 0, 0)
+        )
+        assert _recounted(db_session, cfb_league.id) == counted
+
+    def test_batch_of_upserts_is_applied_once_per_commit(
+        self, db_session, cfb_league, sample_games, sample_teams, sample_venues, query_budget
+    ):
+        for n in range(5):
+            upsert_game(db_session, source="test", source_game_id=f"b{n}",
+                        **_game(cfb_league, sample_teams, n, venue_id=sample_venues[2].id))
+        with query_budget(2) as profile:    # the new-venue check and one upsert
+            db_session.commit()
+        assert sum("league_stats" in fp for fp in profile.fingerprints) == 1
+
+        counted = _stats(db_session, cfb_league.id)
+        games, teams, venues, first, last, last_at = counted
+        assert (games, venues, first, last, last_at) == (8, 3, 2023, 2024, datetime(2024, 9, 5))
+        assert _recounted(db_session, cfb_league.id) == counted
+
+    def test_game_at_a_known_venue_adds_no_venue(
+        self, db_session, cfb_league, sample_games, sample_teams, sample_venues
+    ):
+        upsert_game(db_session, source="test", source_game_id="k1",
+                    **_game(cfb_league, sample_teams, 0, venue_id=sample_venues[0].id))
+        db_session.commit()
+        assert _stats(db_session, cfb_league.id)[2] == 2
+
+    def test_rolled_back_inserts_are_not_counted(
+        self, db_session, cfb_league, sample_games, sample_teams
+    ):
+        before = _stats(db_session, cfb_league.id)
+        upsert_game(db_session, source="test", source_game_id="r1",
+                    **_game(cfb_league, sample_teams, 0))
+        db_session.rollback()
+        db_session.commit()
+        assert _stats(db_session, cfb_league.id) == before
+
+    def test_deletes_and_moves_recount_the_league(
+        self, db_session, cfb_league, sample_games
+    ):
+        db_session.delete(sample_games[1])       # the only game at venue 1
+        db_session.commit()
+        games, teams, venues, *bounds = _stats(db_session, cfb_league.id)
+        assert (games, venues) == (2, 1)
+
+        game = db_session.get(Game, sample_games[2].id)
+        game.season = 2019
+        db_session.commit()
+        assert _stats(db_session, cfb_league.id)[3:5] == (2019, 2023)
+
+    def test_recount_repairs_a_drifted_row(self, db_session, cfb_league, sample_games):
+        expected = _stats(db_session, cfb_league.id)
+        db_session.get(LeagueStats, cfb_league.id).games = 999
+        db_session.commit()
+        assert _recounted(db_session, cfb_league.id) == expected
+
+
+class TestStatusEndpoint:
+    def test_status_is_one_query(self, client, sample_games, admin_headers, query_budget):
+        client.get("/api/admin/status", headers=admin_headers)   # warm the auth path
+        with query_budget(2) as profile:    # the admin user, then the status read
+            rows = client.get("/api/admin/status", headers=admin_headers).json()
+        assert not any("count(" in fp for fp in profile.fingerprints)
+        cfb = next(row for row in rows if row["league"] == "CFB")
+        assert (cfb["games"], cfb["venues"], cfb["last_game_at"]) == (
+            3, 2, "2024-01-02T00:00:00"
+        )
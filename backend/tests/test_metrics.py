@@ -0,0 +1,199 @@
+"""
+Tests for the import and upstream-request metrics.
+"""
+import asyncio
+import time
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+from sports_passport.core.metrics import (
+    InstrumentedTransport,
+    monitor_event_loop_lag,
+    tracking_import,
+)
+from sports_passport.services.adapters.base import ImportResult
+from sports_passport.services.importer import upsert_game
+from sports_passport.services.scheduler import run_sync_for_league
+
+
+def _value(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestTrackingImport:
+    def test_duration_and_in_progress(self):
+        labels = {"league": "XTA", "kind": "sync"}
+        before = _value("sports_passport_import_duration_seconds_count", **labels, outcome="success")
+        with tracking_import("XTA", "sync"):
+            assert _value("sports_passport_imports_in_progress", **labels) == 1
+        assert _value("sports_passport_imports_in_progress", **labels) == 0
+        assert _value(
+            "sports_passport_import_duration_seconds_count", **labels, outcome="success"
+        ) == before + 1
+
+    def test_failures_are_labelled(self):
+        with tracking_import("XTB", "teams") as run:
+            run.failed = True
+        with pytest.raises(RuntimeError), tracking_import("XTB", "teams"):
+            raise RuntimeError("boom")
+        assert _value(
+            "sports_passport_import_duration_seconds_count",
+            league="XTB", kind="teams", outcome="error",
+        ) == 2
+
+    def test_rows_statements_and_commits(self, db_session, nhl_league, sample_nhl_teams):
+        def rows(outcome):
+            return _value("sports_passport_import_rows_total",
+                          league="XTC", table="games", outcome=outcome)
+
+        fields = {
+            "league_id": nhl_league.id,
+            "home_team_id": sample_nhl_teams[0].id,
+            "away_team_id": sample_nhl_teams[1].id,
+            "start_date": datetime(2024, 1, 5, 0, 0),
+            "season": 2024,
+            "home_score": 3,
+            "away_score": 2,
+        }
+        with tracking_import("XTC", "sync"):
+            upsert_game(db_session, source="nhl", source_game_id="m1", **fields)
+            db_session.commit()
+            upsert_game(db_session, source="nhl", source_game_id="m1", **fields)
+            db_session.commit()
+            upsert_game(db_session, source="nhl", source_game_id="m1", **{**fields, "home_score": 4})
+            db_session.commit()
+
+        assert (rows("inserted"), rows("unchanged"), rows("updated")) == (1, 1, 1)
+        assert _value("sports_passport_import_db_statements_total", league="XTC") >= 4
+        assert _value("sports_passport_import_commit_seconds_count", league="XTC") == 3
+
+    def test_run_splits_database_time_into_phases(
+        self, db_session, nhl_league, sample_nhl_teams
+    ):
+        with tracking_import("XTD", "historical") as run:
+            for i in range(3):
+                upsert_game(
+                    db_session, source="nhl", source_game_id=f"p{i}", league_id=nhl_league.id,
+                    home_team_id=sample_nhl_teams[0].id, away_team_id=sample_nhl_teams[1].id,
+                    start_date=datetime(2024, 1, 7 + i), season=2024,
+                )
+            db_session.commit()
+
+        assert run.rows == {"inserted": 3, "updated": 0, "unchanged": 0}
+        assert run.statements >= 4   # three existence lookups and the inserts
+        assert run.resolve_seconds > 0 and run.write_seconds > 0
+        phases = run.phases()
+        assert list(phases) == ["fetch", "parse", "resolve", "write", "commit"]
+        assert sum(phases.values()) == pytest.approx(run.seconds)
+
+    def test_work_outside_an_import_is_not_counted(self, db_session, nhl_league, sample_nhl_teams):
+        before = _value("sports_passport_import_rows_total",
+                        league="NHL", table="games", outcome="inserted")
+        upsert_game(
+            db_session, source="nhl", source_game_id="m2", league_id=nhl_league.id,
+            home_team_id=sample_nhl_teams[0].id, away_team_id=sample_nhl_teams[1].id,
+            start_date=datetime(2024, 1, 6), season=2024,
+        )
+        db_session.commit()
+        assert _value("sports_passport_import_rows_total",
+                      league="NHL", table="games", outcome="inserted") == before
+
+    @patch("sports_passport.services.scheduler.get_adapter")
+    def test_scheduler_sync_is_tracked(self, mock_get_adapter, db_session, cfb_league):
+        adapter = Mock()
+        adapter.sync_recent = AsyncMock(return_value=ImportResult(league="CFB", errors=["x"]))
+        adapter.aclose = AsyncMock()
+        mock_get_adapter.return_value = adapter
+        labels = {"league": "CFB", "kind": "sync", "outcome": "error"}
+        before = _value("sports_passport_import_duration_seconds_count", **labels)
+        asyncio.run(run_sync_for_league(db_session, "CFB"))
+        assert _value("sports_passport_import_duration_seconds_count", **labels) == before + 1
+
+
+class TestInstrumentedTransport:
+    def _client(self, handler) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=InstrumentedTransport(httpx.MockTransport(handler)))
+
+    def test_records_status_and_latency_per_host(self):
+        async def go():
+            async with self._client(lambda request: httpx.Response(503)) as client:
+                await client.get("https://metrics-a.example/x")
+                await client.get("https://metrics-a.example/y")
+
+        asyncio.run(go())
+        assert _value("sports_passport_upstream_requests_total",
+                      host="metrics-a.example", status="503") == 2
+        assert _value("sports_passport_upstream_request_seconds_count",
+                      host="metrics-a.example") == 2
+
+    def test_tracked_import_counts_requests_and_bytes(self):
+        def handler(request):
+            # A stream, not content=, so the body is read through the transport
+            # as a real network response would be.
+            return httpx.Response(200, stream=httpx.ByteStream(b"x" * 1000))
+
+        async def go():
+            async with self._client(handler) as client:
+                with tracking_import("XTE", "sync") as run:
+                    await client.get("https://metrics-c.example/a")
+                    await client.get("https://metrics-c.example/b")
+                await client.get("https://metrics-c.example/untracked")
+            return run
+
+        run = asyncio.run(go())
+        assert (run.requests, run.bytes_downloaded) == (2, 2000)
+        assert run.fetch_seconds > 0
+
+    def test_transport_errors_are_counted(self):
+        def fail(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        async def go():
+            async with self._client(fail) as client:
+                await client.get("https://metrics-b.example/")
+
+        with pytest.raises(httpx.ConnectError):
+            asyncio.run(go())
+        assert _value("sports_passport_upstream_requests_total",
+                      host="metrics-b.example", status="error") == 1
+
+
+def test_metrics_endpoint_exposes_import_metrics(client):
+    body = client.get("/metrics").text
+    assert "sports_passport_import_duration_seconds" in body
+    assert "sports_passport_upstream_requests_total" in body
+
+
+class TestPeakMemory:
+    def test_run_records_peak_rss(self):
+        with tracking_import("XPM", "historical") as run:
+            pass
+        assert run.peak_rss_bytes > 0
+        assert _value(
+            "sports_passport_import_peak_rss_bytes", league="XPM", kind="historical"
+        ) == run.peak_rss_bytes
+
+
+class TestEventLoopLag:
+    def test_blocked_loop_is_observed(self):
+        def over_50ms():
+            return (
+                _value("sports_passport_event_loop_lag_seconds_count")
+                - _value("sports_passport_event_loop_lag_seconds_bucket", le="0.05")
+            )
+
+        before = over_50ms()
+
+        async def main():
+            monitor = asyncio.create_task(monitor_event_loop_lag(interval=0.01))
+            await asyncio.sleep(0.05)
+            time.sleep(0.1)                 # block the loop
+            await asyncio.sleep(0.05)
+            monitor.cancel()
+
+        asyncio.run(main())
+        assert over_50ms() == before + 1
@@ -22,7 +22,7 @@ import tempfile
 import pytest
 
 BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-HEAD = "a9f2c7e4b8d1"
+HEAD = "d4b8f1c6e2a7"
 
 # Revisions real databases have been found stamped at. None = empty database.
 # Each non-None case also gets the *current* full schema from create_all, which
@@ -33,6 +33,7 @@ KNOWN_STATES = [
     pytest.param("a7e4c2f1b3d6", id="stamped-sync-state-last-success"),
     pytest.param("e2f5b8c3d4a1", id="stamped-password-reset-tokens"),
     pytest.param("f3a9d4b6c281", id="stamped-unique-user-game-attendance"),
+    pytest.param("a9f2c7e4b8d1", id="stamped-park-date-only-games-at-noon"),
     pytest.param(HEAD, id="already-at-head"),
 ]
 
@@ -209,6 +210,110 @@ class TestUpgradeConvergence:
         assert con.execute("SELECT count(*) FROM games").fetchone()[0] == 1
         con.close()
 
+    def test_upgrade_backfills_atlas_counts(self, tmp_db):
+        """user_atlas_counts starts out matching the attendance already logged."""
+        _create_all(tmp_db)
+        assert _alembic(["stamp", "c5e8a1d3f6b2"], tmp_db).returncode == 0
+
+        con = sqlite3.connect(tmp_db)
+        con.execute(
+            "INSERT INTO users (email, password_hash, full_name, is_admin,"
+            " created_at, updated_at) VALUES ('a@b.c','h','A',0,"
+            " datetime('now'), datetime('now'))"
+        )
+        con.execute("INSERT INTO leagues (code, name, sport, active) VALUES ('CFB','x','football',1)")
+        con.execute(
+            "INSERT INTO teams (league_id, source, source_team_id, name)"
+            " VALUES (1,'s','1','T')"
+        )
+        con.execute("INSERT INTO venues (source, name, state) VALUES ('s','V','AL')")
+        for game_id, venue_id in ((1, 1), (2, 1), (3, None)):
+            con.execute(
+                "INSERT INTO games (league_id, source, source_game_id, home_team_id,"
+                " away_team_id, start_date, season, has_time, neutral_site, venue_id)"
+                " VALUES (1,'s',?,1,1,'2023-01-01',2023,1,0,?)",
+                (str(game_id), venue_id),
+            )
+            con.execute(
+                "INSERT INTO user_game_attendance (user_id, game_id,"
+                " created_at, updated_at) VALUES (1,?, datetime('now'), datetime('now'))",
+                (game_id,),
+            )
+        con.commit()
+        con.close()
+
+        assert _alembic(["upgrade", "head"], tmp_db).returncode == 0
+
+        con = sqlite3.connect(f"file:{tmp_db}?mode=ro", uri=True)
+        assert con.execute("SELECT * FROM user_atlas_counts").fetchall() == [(1, 1, 1, 2)]
+        con.close()
+
+    def test_upgrade_backfills_league_stats(self, tmp_db):
+        """league_stats starts out matching the catalog already imported."""
+        _create_all(tmp_db)
+        assert _alembic(["stamp", "f2c9d4b7e1a3"], tmp_db).returncode == 0
+
+        con = sqlite3.connect(tmp_db)
+        con.execute("INSERT INTO leagues (code, name, sport, active) VALUES ('CFB','x','football',1)")
+        con.execute("INSERT INTO leagues (code, name, sport, active) VALUES ('MLB','x','baseball',1)")
+        con.execute(
+            "INSERT INTO teams (league_id, source, source_team_id, name)"
+            " VALUES (1,'s','1','T')"
+        )
+        con.execute("INSERT INTO venues (source, name) VALUES ('s','V')")
+        for game_id, season, venue_id in ((1, 2021, 1), (2, 2023, 1), (3, 2022, None)):
+            con.execute(
+                "INSERT INTO games (league_id, source, source_game_id, home_team_id,"
+                " away_team_id, start_date, season, has_time, neutral_site, venue_id)"
+                " VALUES (1,'s',?,1,1,?,?,1,0,?)",
+                (str(game_id), f"{season}-10-01 00:00:00.000000", season, venue_id),
+            )
+        con.commit()
+        con.close()
+
+        assert _alembic(["upgrade", "head"], tmp_db).returncode == 0
+
+        con = sqlite3.connect(f"file:{tmp_db}?mode=ro", uri=True)
+        assert con.execute("SELECT * FROM league_stats ORDER BY league_id").fetchall() == [
+            (1, 3, 1, 1, 2021, 2023, "2023-10-01 00:00:00.000000"),
+            (2, 0, 0, 0, None, None, None),
+        ]
+        con.close()
+
+
+    def test_upgrade_backfills_local_game_date(self, tmp_db):
+        """Existing games get the Eastern calendar day of their stored instant."""
+        _create_all(tmp_db)
+        assert _alembic(["stamp", "b3f9e6a1c4d8"], tmp_db).returncode == 0
+
+        con = sqlite3.connect(tmp_db)
+        con.execute("INSERT INTO leagues (code, name, sport, active) VALUES ('NBA','x','basketball',1)")
+        con.execute(
+            "INSERT INTO teams (league_id, source, source_team_id, name)"
+            " VALUES (1,'s','1','T')"
+        )
+        for game_id, start in (
+            (1, "2024-01-11 00:30:00.000000"),   # 7:30pm EST the evening before
+            (2, "2024-07-04 03:59:00.000000"),   # 11:59pm EDT
+            (3, "1975-10-05 12:00:00.000000"),   # date-only, parked at noon
+        ):
+            con.execute(
+                "INSERT INTO games (league_id, source, source_game_id, home_team_id,"
+                " away_team_id, start_date, season, has_time, neutral_site)"
+                " VALUES (1,'s',?,1,1,?,2024,1,0)",
+                (str(game_id), start),
+            )
+        con.commit()
+        con.close()
+
+        assert _alembic(["upgrade", "head"], tmp_db).returncode == 0
+
+        con = sqlite3.connect(f"file:{tmp_db}?mode=ro", uri=True)
+        assert con.execute("SELECT local_game_date FROM games ORDER BY id").fetchall() == [
+            ("2024-01-10",), ("2024-07-03",), ("1975-10-05",),
+        ]
+        con.close()
+
 
 class TestSchemaParity:
     def test_migrated_schema_matches_models(self, tmp_db):
@@ -0,0 +1,147 @@
+"""
+Tests for the natural-key game index shared by source reconciliation (NBA
+bulk vs. ESPN sync) and the attendance file import.
+"""
+import subprocess
+import sys
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from sports_passport.models.game import Game
+from sports_passport.services.natural_key import NaturalKeyIndex, day_span, local_game_date
+
+WINDOW = timedelta(hours=12)
+
+
+@pytest.fixture
+def matchup(db_session, nhl_league, sample_nhl_teams):
+    """(league id, home id, away id) for two seeded NHL teams."""
+    return nhl_league.id, sample_nhl_teams[0].id, sample_nhl_teams[1].id
+
+
+def _game(db_session, matchup, start, source_game_id):
+    league_id, home_id, away_id = matchup
+    game = Game(
+        source="nhl", source_game_id=source_game_id,
+        league_id=league_id, home_team_id=home_id, away_team_id=away_id,
+        start_date=start, season=2024, season_type="regular",
+        has_time=True, neutral_site=False,
+    )
+    db_session.add(game)
+    db_session.flush()
+    return game
+
+
+def _index(db_session, first, last):
+    start, end = day_span(first, last)
+    return NaturalKeyIndex(db_session.query(Game), start=start, end=end)
+
+
+class TestNaturalKeyIndex:
+    """Lookups by (league, home, away, local day) must agree with the database."""
+
+    def test_evening_game_is_keyed_on_its_local_day(self, db_session, matchup: tuple[int, int, int]):
+        """7:30pm EST is 00:30 UTC the next day; a person names the earlier one."""
+        game = _game(db_session, matchup, datetime(2024, 1, 11, 0, 30), "1")
+        assert local_game_date(game.start_date) == date(2024, 1, 10)
+
+        index = _index(db_session, date(2024, 1, 9), date(2024, 1, 11))
+        assert index.on(*matchup, date(2024, 1, 10)) == [game]
+        assert index.on(*matchup, date(2024, 1, 11)) == []
+
+    def test_near_spans_midnight_but_not_the_next_night(self, db_session, matchup: tuple[int, int, int]):
+        night1 = _game(db_session, matchup, datetime(2024, 1, 11, 0, 30), "1")
+        night2 = _game(db_session, matchup, datetime(2024, 1, 12, 0, 30), "2")
+        index = _index(db_session, date(2024, 1, 9), date(2024, 1, 12))
+
+        assert index.near(*matchup, datetime(2024, 1, 10, 23, 0), WINDOW) == [night1]
+        assert index.near(*matchup, datetime(2024, 1, 12, 1, 0), WINDOW) == [night2]
+
+    def test_lookup_outside_the_loaded_span_falls_back_to_the_database(
+        self, db_session, matchup: tuple[int, int, int]
+    ):
+        old = _game(db_session, matchup, datetime(2020, 3, 1, 0, 0), "1")
+        index = _index(db_session, date(2024, 1, 9), date(2024, 1, 12))
+
+        assert len(index) == 0
+        assert index.near(*matchup, datetime(2020, 3, 1, 2, 0), WINDOW) == [old]
+        assert index.on(*matchup, date(2020, 2, 29)) == [old]
+
+    def test_every_day_of_the_span_is_answered_from_memory(
+        self, db_session, matchup: tuple[int, int, int], query_budget
+    ):
+        last = _game(db_session, matchup, datetime(2024, 1, 13, 0, 30), "1")
+        index = _index(db_session, date(2024, 1, 9), date(2024, 1, 12))
+
+        with query_budget(0):
+            assert index.on(*matchup, date(2024, 1, 9)) == []
+            assert index.on(*matchup, date(2024, 1, 12)) == [last]
+
+    def test_add_rekeys_a_moved_game_and_discard_removes_it(self, db_session, matchup: tuple[int, int, int]):
+        game = _game(db_session, matchup, datetime(2024, 1, 11, 0, 30), "1")
+        index = _index(db_session, date(2024, 1, 9), date(2024, 1, 14))
+
+        game.start_date = datetime(2024, 1, 13, 0, 30)   # postponed two nights
+        index.add(game)
+        assert index.on(*matchup, date(2024, 1, 10)) == []
+        assert index.on(*matchup, date(2024, 1, 12)) == [game]
+
+        index.discard(game)
+        assert index.on(*matchup, date(2024, 1, 12)) == []
+        assert len(index) == 0
+
+    def test_column_rows_index_like_games(self, db_session, matchup: tuple[int, int, int]):
+        """The attendance import selects columns only; the index accepts them."""
+        game = _game(db_session, matchup, datetime(2024, 1, 11, 0, 30), "1")
+        start, end = day_span(date(2024, 1, 10), date(2024, 1, 10))
+        index = NaturalKeyIndex(
+            db_session.query(
+                Game.id, Game.league_id, Game.home_team_id, Game.away_team_id,
+                Game.start_date, Game.local_game_date,
+            ),
+            start=start,
+            end=end,
+        )
+        assert [row.id for row in index.on(*matchup, date(2024, 1, 10))] == [game.id]
+
+    def test_window_of_a_day_or_more_is_refused(self, db_session, matchup: tuple[int, int, int]):
+        index = _index(db_session, date(2024, 1, 9), date(2024, 1, 12))
+        with pytest.raises(ValueError):
+            index.near(*matchup, datetime(2024, 1, 10), timedelta(days=1))
+
+
+class TestStoredLocalDate:
+    """games.local_game_date follows start_date on every ORM write."""
+
+    def test_set_on_insert(self, db_session, matchup: tuple[int, int, int]):
+        game = _game(db_session, matchup, datetime(2024, 1, 11, 0, 30), "1")
+        db_session.commit()
+        db_session.expire_all()
+        assert db_session.get(Game, game.id).local_game_date == date(2024, 1, 10)
+
+    def test_follows_a_reschedule(self, db_session, matchup: tuple[int, int, int]):
+        game = _game(db_session, matchup, datetime(2024, 1, 11, 0, 30), "1")
+        db_session.commit()
+        game.start_date = datetime(2024, 1, 13, 0, 30)
+        db_session.commit()
+        db_session.expire_all()
+        assert db_session.get(Game, game.id).local_game_date == date(2024, 1, 12)
+
+    def test_date_only_rows_keep_their_day(self, db_session, matchup: tuple[int, int, int]):
+        game = _game(db_session, matchup, datetime(1975, 10, 5, 12, 0), "1")
+        assert game.local_game_date == date(1975, 10, 5)
+
+    def test_needs_nothing_but_the_model(self):
+        """Set by the model itself, with no service module imported to hook it."""
+        code = (
+            "import sys; from datetime import datetime; "
+            "from sports_passport.models.game import Game; "
+            "game = Game(start_date=datetime(2024, 1, 11, 0, 30)); "
+            "print(game.local_game_date, 'sports_passport.services.natural_key' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+            env={"SECRET_KEY": "test", "PATH": ""},
+        )
+        assert result.stdout.split() == ["2024-01-10", "False"]
@@ -4,15 +4,20 @@ the real Kaggle "historical-nba-data-and-player-box-scores" dataset on
 2026-07-11/12) and a mocked ESPN scoreboard payload (shape verified against
 the live endpoint on 2026-08-01, when NBA sync moved off stats.nba.com).
 """
+import asyncio
 from datetime import date, datetime, timedelta
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
+from sports_passport.core.config import settings
 from sports_passport.models.game import Game
 from sports_passport.models.team import Team
 from sports_passport.models.venue import Venue
+from sports_passport.services.adapters import nba
 from sports_passport.services.adapters.nba import NbaAdapter
+from sports_passport.services.natural_key import NaturalKeyIndex
 
 SONICS_ID = "1610612760"
 LAKERS_ID = "1610612747"
@@ -394,6 +399,36 @@ class TestNbaSync:
         assert game.source_game_id == "22500001"     # keeps the canonical id
         assert (game.home_score, game.away_score) == (110, 105)   # scores refreshed
 
+    @pytest.mark.asyncio
+    async def test_sync_window_reconciles_from_the_preloaded_index(self, adapter, db_session):
+        """Events inside the sync window resolve against the index loaded up
+        front; the per-event probe is only for dates outside it."""
+        yesterday = date.today() - timedelta(days=1)
+        bulk = _row(
+            gameId="22500001",
+            hometeamCity="Oklahoma City", hometeamName="Thunder", hometeamId=SONICS_ID,
+            awayteamCity="Boston", awayteamName="Celtics", awayteamId=CELTICS_ID,
+            homeScore="1", awayScore="1",
+            gameDate=f"{yesterday.isoformat()} 19:00:00",
+        )
+        with patch.object(adapter, "_read_games_csv", return_value=ALL_ROWS + [bulk]):
+            await adapter.import_historical(2025, 2025)
+        tip_off = db_session.query(Game).one().start_date
+        event = _espn_event(date=tip_off.strftime("%Y-%m-%dT%H:%MZ"))
+
+        probe = patch.object(
+            NaturalKeyIndex, "_from_db", side_effect=AssertionError("fell back to a DB probe")
+        )
+        with probe, patch.object(adapter, "_fetch_scoreboard",
+                                 AsyncMock(side_effect=[_payload(event), _payload()])):
+            result = await adapter.sync_recent(since=yesterday)
+
+        assert not result.errors
+        assert (result.games_imported, result.games_updated) == (0, 1)
+        game = db_session.query(Game).one()
+        assert game.source_game_id == "22500001"
+        assert (game.home_score, game.away_score) == (110, 105)
+
     @pytest.mark.asyncio
     async def test_later_bulk_import_adopts_the_synced_row(self, adapter, db_session):
         """The other direction: sync sees a game first, then a refreshed
@@ -565,3 +600,101 @@ class TestNbaSync:
 
         game = db_session.query(Game).one()
         assert (game.home_score, game.away_score) == (110, 105)
+
+
+def _on(day, event_id):
+    """A final Thunder–Celtics event tipping off on the evening (ET) of `day`."""
+    tip_off = datetime.combine(day, datetime.min.time()) + timedelta(hours=24)
+    return _espn_event(id=event_id, date=tip_off.strftime("%Y-%m-%dT%H:%MZ"))
+
+
+class TestNbaScoreboardFetching:
+    """Range calls for long windows, bounded per-day fallback, finished-day cache."""
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "espn_cache_enabled", True)
+        monkeypatch.setattr(settings, "data_dir", str(tmp_path))
+        return tmp_path / "cache" / "espn" / "nba"
+
+    async def _sync(self, adapter, since, per_day, by_range=None):
+        with patch.object(adapter, "_read_games_csv", return_value=ALL_ROWS):
+            await adapter.import_teams()
+        with patch.object(adapter, "_fetch_scoreboard", per_day), \
+                patch.object(adapter, "_fetch_scoreboard_range",
+                             by_range or AsyncMock(side_effect=AssertionError("range call"))):
+            return await adapter.sync_recent(since=since)
+
+    @pytest.mark.asyncio
+    async def test_long_window_is_one_range_call(self, adapter, db_session):
+        """A recovery sync after an outage must not walk ESPN one day at a time."""
+        today = date.today()
+        since = today - timedelta(days=9)
+        by_range = AsyncMock(return_value=_payload(_on(since + timedelta(days=2), "401000001")))
+        per_day = AsyncMock(side_effect=AssertionError("per-day call"))
+
+        result = await self._sync(adapter, since, per_day, by_range)
+
+        assert not result.errors
+        by_range.assert_awaited_once_with(since, today)
+        assert db_session.query(Game).one().source_game_id == "espn-401000001"
+
+    @pytest.mark.asyncio
+    async def test_failed_or_truncated_range_falls_back_to_per_day(self, adapter, db_session):
+        since = date.today() - timedelta(days=3)
+        for by_range in (
+            AsyncMock(side_effect=httpx.ConnectError("range refused")),
+            AsyncMock(return_value=_payload(*[_espn_event()] * nba.ESPN_RANGE_LIMIT)),
+        ):
+            per_day = AsyncMock(return_value=_payload())
+            result = await self._sync(adapter, since, per_day, by_range)
+
+            assert not result.errors
+            assert per_day.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_short_window_fetches_days_with_a_bounded_fan_out(self, adapter, db_session):
+        in_flight = peak = 0
+
+        async def fetch(day):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return _payload()
+
+        with patch.object(nba, "ESPN_RANGE_MIN_DAYS", 100):
+            await self._sync(adapter, date.today() - timedelta(days=9), fetch)
+
+        assert 1 < peak <= nba.ESPN_MAX_CONCURRENT_FETCHES
+
+    @pytest.mark.asyncio
+    async def test_finished_days_are_served_from_cache(self, adapter, db_session, cache_dir):
+        yesterday = date.today() - timedelta(days=1)
+        per_day = AsyncMock(side_effect=lambda day: _payload(_on(day, f"40100{day:%d}")))
+        await self._sync(adapter, yesterday, per_day)
+        assert per_day.await_count == 2
+        # today can still change, so only yesterday is on disk
+        assert [p.name for p in cache_dir.iterdir()] == [f"{yesterday:%Y%m%d}.json"]
+
+        per_day.reset_mock()
+        result = await self._sync(adapter, yesterday, per_day)
+        per_day.assert_awaited_once_with(date.today())
+        assert result.games_updated == 2
+
+    @pytest.mark.asyncio
+    async def test_unfinished_day_is_not_cached(self, adapter, db_session, cache_dir):
+        """A postponed game is never `completed`; caching its day would freeze it."""
+        postponed = _espn_event(competitions=[{
+            "status": {"type": {"state": "post", "name": "STATUS_POSTPONED",
+                                "completed": False}},
+            "competitors": [
+                {"homeAway": "home", "score": "0", "team": {"displayName": "Oklahoma City Thunder"}},
+                {"homeAway": "away", "score": "0", "team": {"displayName": "Boston Celtics"}},
+            ],
+        }])
+        per_day = AsyncMock(return_value=_payload(postponed))
+        await self._sync(adapter, date.today() - timedelta(days=1), per_day)
+
+        assert not cache_dir.exists() or not any(cache_dir.iterdir())
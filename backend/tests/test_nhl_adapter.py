@@ -2,7 +2,7 @@
 Tests for the NHL adapter using mocked API payloads (shapes verified against
 the live API on 2026-07-11).
 """
-from datetime import date
+from datetime import date, timedelta
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -195,27 +195,93 @@ class TestNhlVenueSeedFallback:
         assert venue.latitude is None
 
 
+class _Jan6(date):
+    @classmethod
+    def today(cls):
+        return date(1994, 1, 6)
+
+
+def _week(start: date, games_by_day: dict[str, list[dict]]):
+    """A /schedule/{date} page: seven days from `start`."""
+    days = [(start + timedelta(days=n)).isoformat() for n in range(7)]
+    return {"gameWeek": [{"date": d, "games": games_by_day.get(d, [])} for d in days]}
+
+
+def _schedule_row(game: dict, **fields) -> dict:
+    """The shape /schedule/{date} returns: no gameDate, a gameState."""
+    row = {k: v for k, v in game.items() if k != "gameDate"}
+    return {"gameState": "OFF", **row, **fields}
+
+
 class TestNhlSync:
-    @pytest.mark.asyncio
-    async def test_sync_recent_updates_score(self, adapter, db_session):
-        async def fake_get(url, ok_404=False):
+    async def _sync(self, adapter, since, fake_get):
+        calls = []
+
+        async def get(url, ok_404=False):
+            calls.append(url)
             if "stats/rest/en/team" in url:
                 return TEAMS_PAYLOAD
-            if "/score/" in url:
-                if url.endswith("1994-01-05"):
-                    return {"games": [GAME_REGULAR_OT]}
-                return {"games": []}
-            if "/standings/" in url:
-                return STANDINGS_PAYLOAD
-            raise AssertionError(f"unexpected url {url}")
+            return await fake_get(url)
 
-        with patch.object(adapter, "_get", AsyncMock(side_effect=fake_get)), \
-             patch("sports_passport.services.adapters.nhl.date") as mock_date:
-            mock_date.today.return_value = date(1994, 1, 6)
-            mock_date.side_effect = date
+        with patch.object(adapter, "_get", AsyncMock(side_effect=get)), \
+             patch("sports_passport.services.adapters.nhl.date", _Jan6):
             await adapter.import_teams()
-            result = await adapter.sync_recent(since=date(1994, 1, 4))
+            result = await adapter.sync_recent(since=since)
+        return result, [url for url in calls if "stats/rest" not in url]
+
+    @pytest.mark.asyncio
+    async def test_window_is_walked_a_week_at_a_time(self, adapter, db_session):
+        async def fake_get(url):
+            start = date.fromisoformat(url.rsplit("/", 1)[1])
+            return _week(start, {"1994-01-05": [_schedule_row(GAME_REGULAR_OT)]})
 
+        result, calls = await self._sync(adapter, date(1993, 12, 28), fake_get)
+
+        # Ten days, two pages, and no per-day score requests for final games.
+        assert [url.split("/v1/")[1] for url in calls] == [
+            "schedule/1993-12-28", "schedule/1994-01-04",
+        ]
         assert result.games_imported == 1
         game = db_session.query(Game).one()
-        assert game.home_score == 4
+        assert (game.home_score, game.away_score, game.overtime_flag) == (4, 3, "OT")
+
+    @pytest.mark.asyncio
+    async def test_games_outside_the_window_are_skipped(self, adapter, db_session):
+        later = {**GAME_REGULAR_OT, "id": 1993020600}
+
+        async def fake_get(url):
+            return _week(date(1994, 1, 4), {
+                "1994-01-05": [_schedule_row(GAME_REGULAR_OT)],
+                "1994-01-08": [_schedule_row(later)],       # after today
+            })
+
+        result, calls = await self._sync(adapter, date(1994, 1, 4), fake_get)
+        assert len(calls) == 1
+        assert result.games_imported == 1
+
+    @pytest.mark.asyncio
+    async def test_in_progress_games_are_read_from_score(self, adapter, db_session):
+        live = {**GAME_REGULAR_OT, "homeTeam": {"id": 3, "abbrev": "NYR", "score": 5}}
+
+        async def fake_get(url):
+            if "/score/" in url:
+                assert url.endswith("1994-01-05")
+                # /score/{date} also carries neighbouring days' games.
+                return {"games": [live, {**GAME_PRESEASON, "gameDate": "1994-01-04"}]}
+            return _week(date(1994, 1, 4), {
+                "1994-01-05": [_schedule_row(GAME_REGULAR_OT, gameState="LIVE")],
+            })
+
+        result, calls = await self._sync(adapter, date(1994, 1, 4), fake_get)
+        assert sum("/score/" in url for url in calls) == 1
+        assert result.games_imported == 1
+        assert db_session.query(Game).one().home_score == 5
+
+    @pytest.mark.asyncio
+    async def test_missing_page_still_advances(self, adapter, db_session):
+        async def fake_get(url):
+            return None
+
+        result, calls = await self._sync(adapter, date(1993, 12, 20), fake_get)
+        assert len(calls) == 3
+        assert result.games_imported == 0
@@ -2,7 +2,11 @@
 Tests for change-password and forgot/reset-password endpoints.
 """
 from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
 
+import mailtrap as mt
+
+from sports_passport.core.config import settings
 from sports_passport.models.password_reset_token import PasswordResetToken
 from sports_passport.routers.password_reset import _hash_token
 
@@ -86,6 +90,22 @@ class TestForgotPassword:
         )
         assert len(tokens) == 1
 
+    def test_failed_send_is_reported_and_rolled_back(
+        self, client, test_user, db_session, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "mailtrap_api_key", "key")
+        error = mt.APIError(401, ["Unauthorized"])
+        with (
+            patch("mailtrap.MailtrapClient") as mock_client,
+            patch("sentry_sdk.capture_exception") as capture,
+        ):
+            mock_client.return_value.send.side_effect = error
+            response = client.post("/api/auth/forgot-password", json={"email": test_user.email})
+
+        assert response.status_code == 200
+        capture.assert_called_once_with(error)
+        assert db_session.query(PasswordResetToken).count() == 0
+
 
 class TestResetPassword:
     """Tests for POST /api/auth/reset-password."""
@@ -0,0 +1,147 @@
+"""
+Tests for the raw upstream payload archive and replay mode.
+"""
+import gzip
+import json
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from sports_passport.core.config import settings
+from sports_passport.core.metrics import InstrumentedTransport, tracking_import
+from sports_passport.models.team import Team
+from sports_passport.services.adapters.nhl import TEAMS_URL, NhlAdapter
+from sports_passport.services.adapters.payload_archive import (
+    NotArchived,
+    PayloadArchive,
+    RecordingTransport,
+    ReplayTransport,
+)
+
+TEAMS = {"data": [{"id": 3, "franchiseId": 10, "fullName": "New York Rangers", "triCode": "NYR"}]}
+
+
+@pytest.fixture
+def archive_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "payload_archive_enabled", True)
+    monkeypatch.setattr(settings, "data_dir", str(tmp_path))
+    return tmp_path / "archive"
+
+
+def _upstream(payload, **headers):
+    def handler(request):
+        return httpx.Response(200, json=payload, headers=headers)
+    return httpx.MockTransport(handler)
+
+
+async def _fetch(transport, url, **params):
+    async with httpx.AsyncClient(transport=transport) as client:
+        return await client.get(url, params=params)
+
+
+class TestRecording:
+    @pytest.mark.asyncio
+    async def test_response_is_indexed_and_stored_by_content(self, archive_dir):
+        archive = PayloadArchive("NHL")
+        transport = RecordingTransport(_upstream(TEAMS), archive)
+        for _ in range(2):
+            response = await _fetch(transport, "https://api.example.com/v1/team", lang="en")
+            assert response.json() == TEAMS
+
+        lines = (archive_dir / "index" / "NHL.jsonl").read_text().splitlines()
+        first, second = (json.loads(line) for line in lines)
+        assert first["endpoint"] == "api.example.com/v1/team"
+        assert first["params"] == {"lang": "en"}
+        assert (first["status"], first["headers"]["content-type"]) == (200, "application/json")
+        # Same body, one blob.
+        assert first["sha256"] == second["sha256"]
+        blobs = list((archive_dir / "blobs").rglob("*.gz"))
+        assert len(blobs) == 1
+        assert json.loads(gzip.decompress(blobs[0].read_bytes())) == TEAMS
+
+    @pytest.mark.asyncio
+    async def test_compressed_responses_are_archived_decoded(self, archive_dir):
+        def handler(request):
+            return httpx.Response(
+                200, content=gzip.compress(json.dumps(TEAMS).encode()),
+                headers={"content-encoding": "gzip", "content-type": "application/json"},
+            )
+
+        archive = PayloadArchive("NHL")
+        response = await _fetch(RecordingTransport(httpx.MockTransport(handler), archive),
+                                "https://api.example.com/v1/team")
+        assert response.json() == TEAMS
+        entry = archive.lookup("GET", "https://api.example.com/v1/team")
+        assert entry is not None
+        assert json.loads(archive.read_body(entry["sha256"])) == TEAMS
+
+    @pytest.mark.asyncio
+    async def test_download_bytes_are_still_counted(self, archive_dir):
+        transport = RecordingTransport(
+            InstrumentedTransport(_upstream(TEAMS)), PayloadArchive("NHL")
+        )
+        with tracking_import("XPA", "sync") as run:
+            await _fetch(transport, "https://api.example.com/v1/team")
+        assert run.bytes_downloaded == len(httpx.Response(200, json=TEAMS).content)
+
+    @pytest.mark.asyncio
+    async def test_disabled_archive_writes_nothing(self, archive_dir, monkeypatch):
+        monkeypatch.setattr(settings, "payload_archive_enabled", False)
+        await _fetch(RecordingTransport(_upstream(TEAMS), PayloadArchive("NHL")),
+                     "https://api.example.com/v1/team")
+        assert not archive_dir.exists()
+
+
+class TestReplay:
+    @pytest.mark.asyncio
+    async def test_adapter_replays_without_the_network(
+        self, archive_dir, db_session, nhl_league
+    ):
+        await _fetch(RecordingTransport(_upstream(TEAMS), PayloadArchive("NHL")), TEAMS_URL)
+
+        adapter = NhlAdapter(db_session)
+        adapter.replay_from_archive()
+        try:
+            result = await adapter.import_teams()
+        finally:
+            await adapter.aclose()
+
+        assert result.teams_imported == 1
+        assert db_session.query(Team).one().abbreviation == "NYR"
+
+    @pytest.mark.asyncio
+    async def test_as_of_picks_an_earlier_fetch(self, archive_dir):
+        archive = PayloadArchive("NHL")
+        url = "https://api.example.com/v1/team"
+        await _fetch(RecordingTransport(_upstream({"v": 1}), archive), url)
+        first = archive.lookup("GET", url)
+        assert first is not None
+        cutoff = datetime.fromisoformat(first["fetched_at"])
+        await _fetch(RecordingTransport(_upstream({"v": 2}), archive), url)
+
+        latest = await _fetch(ReplayTransport(PayloadArchive("NHL")), url)
+        earlier = await _fetch(ReplayTransport(PayloadArchive("NHL"), cutoff), url)
+        assert (latest.json(), earlier.json()) == ({"v": 2}, {"v": 1})
+        assert archive.lookup("GET", url, cutoff - timedelta(days=1)) is None
+
+    @pytest.mark.asyncio
+    async def test_unarchived_request_is_a_transport_error(self, archive_dir):
+        with pytest.raises(NotArchived) as raised:
+            await _fetch(ReplayTransport(PayloadArchive("NHL")), "https://api.example.com/x")
+        assert isinstance(raised.value, httpx.TransportError)
+
+    @pytest.mark.asyncio
+    async def test_replay_must_be_chosen_before_the_first_request(self, db_session):
+        adapter = NhlAdapter(db_session)
+        assert adapter.http is not None     # opens the client
+        with pytest.raises(RuntimeError):
+            adapter.replay_from_archive()
+        await adapter.aclose()
+
+    def test_torn_index_line_is_skipped(self, archive_dir):
+        index = archive_dir / "index" / "NHL.jsonl"
+        index.parent.mkdir(parents=True)
+        entry = {"method": "GET", "url": "https://a/b", "fetched_at": "2026-01-01T00:00:00"}
+        index.write_text(json.dumps(entry) + "\n" + '{"method": "GE')
+        assert PayloadArchive("NHL").lookup("GET", "https://a/b") == entry
@@ -0,0 +1,106 @@
+"""
+Tests for the perf ring buffer and GET /api/admin/perf.
+"""
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from sports_passport.core import perf_log
+from sports_passport.models.perf_sample import PerfSample
+from sports_passport.models.sync_run import SyncRun
+
+
+@pytest.fixture(autouse=True)
+def empty_queue():
+    for queue in perf_log._pending.values():
+        queue.clear()
+    yield
+    for queue in perf_log._pending.values():
+        queue.clear()
+
+
+def _sync_run(league, started_at, status, **fields) -> SyncRun:
+    defaults = dict.fromkeys((
+        "fetch_ms", "parse_ms", "resolve_ms", "write_ms", "commit_ms", "requests",
+        "bytes_downloaded", "statements", "rows_inserted", "rows_updated", "rows_unchanged",
+        "games_imported", "games_updated",
+    ), 0)
+    return SyncRun(
+        league_id=league.id, kind="sync", started_at=started_at, status=status,
+        duration_ms=2000, **{**defaults, **fields},
+    )
+
+
+class TestRingBuffer:
+    def test_oldest_samples_are_overwritten(self, db_session, monkeypatch):
+        monkeypatch.setattr(perf_log, "RING_SIZES", {"route": 3, "upstream": 3})
+        monkeypatch.setattr(perf_log, "_next_seq", {})
+        for i in range(5):
+            perf_log.record("route", f"GET /r{i}", float(i))
+        assert perf_log.flush(db_session) == 5
+
+        keys = [s.key for s in db_session.query(PerfSample).order_by(PerfSample.seq)]
+        assert keys == ["GET /r2", "GET /r3", "GET /r4"]
+        assert perf_log.flush(db_session) == 0
+
+    def test_route_traffic_does_not_overwrite_upstream_samples(self, db_session, monkeypatch):
+        monkeypatch.setattr(perf_log, "RING_SIZES", {"route": 3, "upstream": 2})
+        monkeypatch.setattr(perf_log, "_next_seq", {})
+        perf_log.record("upstream", "api.example", 1.0)
+        perf_log.flush(db_session)
+        for i in range(10):
+            perf_log.record("route", f"GET /r{i}", float(i))
+        perf_log.flush(db_session)
+
+        kinds = [s.kind for s in db_session.query(PerfSample).order_by(PerfSample.slot)]
+        assert kinds == ["route", "route", "route", "upstream"]
+
+    def test_sequence_resumes_from_table(self, db_session, monkeypatch):
+        monkeypatch.setattr(perf_log, "_next_seq", {})
+        perf_log.record("route", "GET /a", 1.0)
+        perf_log.flush(db_session)
+        monkeypatch.setattr(perf_log, "_next_seq", {})   # as after a restart
+        perf_log.record("route", "GET /b", 1.0)
+        perf_log.flush(db_session)
+        assert db_session.query(PerfSample).count() == 2
+
+
+class TestPerfEndpoint:
+    def test_reports_syncs_upstream_and_routes(
+        self, client, db_session, cfb_league, sample_games, admin_headers
+    ):
+        now = datetime.now(UTC).replace(tzinfo=None)
+        db_session.add_all([
+            _sync_run(cfb_league, now - timedelta(minutes=10), "success", games_imported=100,
+                      fetch_ms=1500, parse_ms=300, requests=30),
+            _sync_run(cfb_league, now - timedelta(minutes=5), "error", fetch_ms=1800, requests=10),
+            _sync_run(cfb_league, now - timedelta(hours=3), "success", games_imported=999),
+        ])
+        db_session.commit()
+        for ms in range(1, 101):
+            perf_log.record("upstream", "api.example", float(ms), status="200")
+        perf_log.record("upstream", "api.example", 5.0, status="error")
+        client.get(f"/api/games/{sample_games[0].id}", headers=admin_headers)
+
+        response = client.get("/api/admin/perf", params={"hours": 1}, headers=admin_headers)
+        assert response.status_code == 200
+        data = response.json()
+
+        assert [r["status"] for r in data["sync_runs"]] == ["error", "success"]
+        assert data["sync_runs"][1]["rows_per_sec"] == 50.0
+        assert data["sync_runs"][1]["phases_ms"]["fetch"] == 1500
+        assert data["sync_runs"][1]["fetch_ms_per_request"] == 50.0
+        league = data["leagues"][0]
+        assert (league["league"], league["runs"], league["errors"], league["rows"]) == (
+            "CFB", 2, 1, 100
+        )
+        assert (league["seconds"], league["rows_per_sec"]) == (4.0, 25.0)
+        assert league["slowest_phase"] == "fetch"
+        assert league["requests"] == 40 and league["fetch_ms_per_request"] == 82.5
+        upstream = data["upstream"][0]
+        assert (upstream["host"], upstream["requests"], upstream["errors"]) == ("api.example", 101, 1)
+        assert upstream["p50_ms"] == 50.0 and upstream["max_ms"] == 100.0
+        assert "GET /api/games/{game_id}" in {r["route"] for r in data["routes"]}
+
+    def test_requires_admin(self, client, auth_headers):
+        assert client.get("/api/admin/perf", headers=auth_headers).status_code == 403
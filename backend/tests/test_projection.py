@@ -0,0 +1,82 @@
+"""
+Tests for the column-projected list path: it must produce exactly what the
+response schemas would have, for less work.
+"""
+import json
+
+from pydantic import TypeAdapter
+from sqlalchemy import event
+
+from sports_passport.core.projection import (
+    ATTENDANCE_LIST,
+    GAME_LIST,
+    GAME_LIST_ITEM,
+    select_attendance_list,
+    select_game_list,
+    select_game_list_items,
+)
+from sports_passport.models.attendance import UserGameAttendance
+from sports_passport.models.game import Game
+from sports_passport.schemas.attendance import AttendanceResponse
+from sports_passport.schemas.game import GameListResponse
+from tests.conftest import engine
+
+
+def _schema_json(response_type, objects) -> list:
+    adapter = TypeAdapter(response_type)
+    return json.loads(adapter.dump_json(adapter.validate_python(objects, from_attributes=True)))
+
+
+class TestProjectionMatchesSchemas:
+    """Byte-for-byte agreement with the pydantic path, key order included."""
+
+    def test_game_list(self, db_session, sample_games):
+        sample_games[2].venue_id = None          # the outer join's NULL side
+        db_session.commit()
+
+        games = db_session.query(Game).order_by(Game.id).all()
+        projected = GAME_LIST.rows(select_game_list(db_session.query(Game)).order_by(Game.id))
+
+        expected = _schema_json(list[GameListResponse], games)
+        assert json.dumps(projected) == json.dumps(expected)
+        assert projected[2]["venue"] is None
+        assert projected[0]["start_date"].endswith("+00:00")
+
+    def test_game_list_items_add_only_the_attended_flag(
+        self, db_session, sample_attendance, sample_games, test_user
+    ):
+        query = db_session.query(Game)
+        plain = GAME_LIST.rows(select_game_list(query).order_by(Game.id))
+        items = GAME_LIST_ITEM.rows(select_game_list_items(query, test_user.id).order_by(Game.id))
+
+        assert [{**row, "attended": item["attended"]} for row, item in zip(plain, items, strict=True)] == items
+        assert [item["attended"] for item in items] == [True, True, False]
+
+    def test_attendance_list(self, db_session, sample_attendance):
+        attendances = db_session.query(UserGameAttendance).order_by(UserGameAttendance.id).all()
+        projected = ATTENDANCE_LIST.rows(
+            select_attendance_list(db_session.query(UserGameAttendance))
+            .order_by(UserGameAttendance.id)
+        )
+
+        assert json.dumps(projected) == json.dumps(_schema_json(list[AttendanceResponse], attendances))
+
+
+class TestAttendanceListEndpoint:
+    """GET /api/attendance/ runs one SELECT however long the history is."""
+
+    def test_single_statement_for_the_whole_list(self, client, sample_attendance, auth_headers):
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = client.get("/api/attendance/", headers=auth_headers)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert response.status_code == 200
+        assert len(response.json()) == 2
+        assert len([s for s in statements if "user_game_attendance" in s]) == 1
@@ -0,0 +1,129 @@
+"""
+Tests for the SQL profiler and query budgets.
+"""
+import logging
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from sports_passport.core import query_profiler
+from sports_passport.core.config import settings
+from sports_passport.core.query_profiler import (
+    QueryBudgetExceeded,
+    fingerprint,
+    profile_request,
+    profiling,
+)
+from sports_passport.db.database import get_db
+from sports_passport.models.game import Game
+from tests.conftest import engine
+
+
+@pytest.fixture
+def enabled(monkeypatch):
+    monkeypatch.setattr(settings, "query_profiling_enabled", True)
+
+
+class TestFingerprint:
+    def test_collapses_in_lists_and_whitespace(self):
+        assert fingerprint("SELECT x FROM t\n  WHERE id IN (?, ?, ?)") == fingerprint(
+            "SELECT x FROM t WHERE id IN (?)"
+        )
+
+
+class TestProfiling:
+    def test_disabled_by_default(self, db_session):
+        with profiling("off") as profile:
+            db_session.execute(text("SELECT 1"))
+        assert profile is None
+
+    def test_counts_and_flags_repeats(self, enabled, db_session, caplog):
+        with caplog.at_level(logging.WARNING, logger=query_profiler.__name__):
+            with profiling("n+1") as profile:
+                for game_id in range(query_profiler.N_PLUS_ONE_THRESHOLD):
+                    db_session.query(Game).filter(Game.id == game_id).first()
+        assert profile is not None
+        assert profile.statements == query_profiler.N_PLUS_ONE_THRESHOLD
+        assert profile.duplicates()[0][1] == query_profiler.N_PLUS_ONE_THRESHOLD
+        assert "likely N+1" in caplog.text
+
+    def test_slow_query_logged_with_plan(self, enabled, monkeypatch, db_session, caplog):
+        monkeypatch.setattr(settings, "slow_query_ms", 0)
+        with caplog.at_level(logging.WARNING, logger=query_profiler.__name__):
+            with profiling("slow"):
+                db_session.query(Game).filter(Game.season == 2023).all()
+        assert "Slow query" in caplog.text
+        assert "SCAN games" in caplog.text or "SEARCH games" in caplog.text
+
+    def test_hooks_attach_on_first_use(self, db_session):
+        def attached():
+            return [event.contains(Engine, name, hook) for name, hook in query_profiler._HOOKS]
+
+        for name, hook in query_profiler._HOOKS:
+            if event.contains(Engine, name, hook):
+                event.remove(Engine, name, hook)
+        with profiling("off"):
+            db_session.execute(text("SELECT 1"))
+        assert attached() == [False, False, False]
+
+        with query_profiler.watching(engine) as profile:
+            db_session.execute(text("SELECT 1"))
+        assert attached() == [True, True, True]
+        assert profile.statements == 1
+
+    def test_failed_statement_does_not_skew_timers(self, enabled, db_session):
+        with pytest.raises(OperationalError):
+            db_session.execute(text("SELECT * FROM no_such_table"))
+        db_session.rollback()
+        with profiling("after") as profile:
+            db_session.execute(text("SELECT 1"))
+        assert profile is not None and profile.statements == 1
+
+
+class TestQueryBudget:
+    def test_within_budget(self, client, sample_games, auth_headers, query_budget):
+        with query_budget(5, max_repeats=1) as profile:
+            client.get("/api/games/", headers=auth_headers)
+        assert profile.statements >= 1
+
+    def test_over_budget_fails(self, db_session, query_budget):
+        with pytest.raises(QueryBudgetExceeded, match="budget 1"):
+            with query_budget(1):
+                db_session.execute(text("SELECT 1"))
+                db_session.execute(text("SELECT 2"))
+
+    def test_repeats_fail(self, db_session, query_budget):
+        with pytest.raises(QueryBudgetExceeded, match="3 times"):
+            with query_budget(10, max_repeats=2):
+                for game_id in range(3):
+                    db_session.query(Game).filter(Game.id == game_id).first()
+
+    def test_attendance_stats_do_not_load_per_game(
+        self, client, sample_attendance, auth_headers, query_budget
+    ):
+        with query_budget(10, max_repeats=2):
+            assert client.get("/api/attendance/stats", headers=auth_headers).status_code == 200
+
+
+class TestMiddleware:
+    def test_debug_headers(self, enabled, monkeypatch, db_session):
+        monkeypatch.setattr(settings, "debug", True)
+        app = FastAPI()
+        app.middleware("http")(profile_request)
+
+        @app.get("/probe")
+        def probe(db: Session = Depends(get_db)):
+            db.execute(text("SELECT 1"))
+            db.execute(text("SELECT 1"))
+            return {}
+
+        app.dependency_overrides[get_db] = lambda: db_session
+        response = TestClient(app).get("/probe")
+        assert response.headers["X-DB-Statements"] == "2"
+        assert response.headers["X-DB-Max-Repeats"] == "2"
+        assert float(response.headers["X-DB-Time-Ms"]) >= 0
@@ -0,0 +1,190 @@
+"""
+Tests for upstream retries, circuit breakers and concurrency caps.
+"""
+import asyncio
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from itertools import count
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+from sports_passport.core import resilient_http
+from sports_passport.core.resilient_http import HostUnavailable, ResilientTransport
+
+_hosts = count()
+
+
+@pytest.fixture
+def host(monkeypatch):
+    """A host name no other test has used, so breaker state starts fresh."""
+    monkeypatch.setattr(resilient_http, "BACKOFF_BASE_SECONDS", 0)
+    return f"upstream{next(_hosts)}.example.com"
+
+
+def _upstream(*answers):
+    """A transport returning (or raising) each answer in turn; records calls."""
+    calls = []
+
+    async def handler(request):
+        answer = answers[min(len(calls), len(answers) - 1)]
+        calls.append(request)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    return httpx.MockTransport(handler), calls
+
+
+async def _get(transport, host, method="GET"):
+    async with httpx.AsyncClient(transport=transport) as client:
+        return await client.request(method, f"https://{host}/v1/games")
+
+
+def _value(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestRetries:
+    @pytest.mark.asyncio
+    async def test_transient_failures_are_retried(self, host):
+        inner, calls = _upstream(
+            httpx.ConnectError("refused"), httpx.Response(503), httpx.Response(200, json=[1])
+        )
+        response = await _get(ResilientTransport(inner), host)
+        assert response.json() == [1]
+        assert len(calls) == 3
+        assert _value("sports_passport_upstream_retries_total", host=host, reason="503") == 1
+        assert _value(
+            "sports_passport_upstream_retries_total", host=host, reason="ConnectError"
+        ) == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, host):
+        inner, calls = _upstream(httpx.Response(502))
+        response = await _get(ResilientTransport(inner), host)
+        assert response.status_code == 502
+        assert len(calls) == resilient_http.MAX_ATTEMPTS
+
+    @pytest.mark.asyncio
+    async def test_client_errors_and_posts_are_not_retried(self, host):
+        inner, calls = _upstream(httpx.Response(404))
+        assert (await _get(ResilientTransport(inner), host)).status_code == 404
+        inner, posts = _upstream(httpx.Response(503))
+        assert (await _get(ResilientTransport(inner), host, "POST")).status_code == 503
+        assert (len(calls), len(posts)) == (1, 1)
+
+    def test_retry_after_is_honoured(self):
+        assert resilient_http._retry_delay(1, httpx.Response(429, headers={"Retry-After": "7"})) == 7
+        when = format_datetime(datetime.now(UTC) + timedelta(seconds=30), usegmt=True)
+        delay = resilient_http._retry_delay(1, httpx.Response(503, headers={"Retry-After": when}))
+        assert delay is not None and 25 < delay <= 30
+        # Asked to wait longer than we would: answer with the 429 instead.
+        too_long = httpx.Response(429, headers={"Retry-After": "3600"})
+        assert resilient_http._retry_delay(1, too_long) is None
+
+    def test_backoff_is_jittered_and_capped(self, monkeypatch):
+        monkeypatch.setattr(resilient_http, "BACKOFF_BASE_SECONDS", 1)
+        delays = [resilient_http._backoff(10) for _ in range(50)]
+        assert all(0 <= d <= resilient_http.BACKOFF_MAX_SECONDS for d in delays)
+        assert len(set(delays)) > 1
+
+
+class TestCircuitBreaker:
+    @pytest.mark.asyncio
+    async def test_opens_after_repeated_failures_and_fails_fast(self, host):
+        inner, calls = _upstream(httpx.ConnectError("refused"))
+        transport = ResilientTransport(inner)
+        with pytest.raises(httpx.ConnectError):
+            await _get(transport, host)       # MAX_ATTEMPTS failures
+        with pytest.raises(HostUnavailable):
+            await _get(transport, host)       # the fifth failure opened it
+        sent = len(calls)
+        with pytest.raises(HostUnavailable):
+            await _get(transport, host)
+        assert len(calls) == sent == resilient_http.BREAKER_FAILURE_THRESHOLD
+        assert _value("sports_passport_upstream_circuit_open", host=host) == 1
+        assert _value("sports_passport_upstream_short_circuits_total", host=host) == 2
+
+    @pytest.mark.asyncio
+    async def test_probe_after_cooldown_closes_it(self, host, monkeypatch):
+        monkeypatch.setattr(resilient_http, "BREAKER_FAILURE_THRESHOLD", 1)
+        inner, calls = _upstream(httpx.ConnectError("refused"), httpx.Response(200))
+        transport = ResilientTransport(inner)
+        with pytest.raises(HostUnavailable):
+            await _get(transport, host)
+
+        monkeypatch.setattr(resilient_http, "BREAKER_COOLDOWN_SECONDS", 0)
+        assert (await _get(transport, host)).status_code == 200
+        assert _value("sports_passport_upstream_circuit_open", host=host) == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_does_not_wedge_the_breaker(self, host, monkeypatch):
+        monkeypatch.setattr(resilient_http, "BREAKER_FAILURE_THRESHOLD", 1)
+        inner, _ = _upstream(httpx.ConnectError("refused"))
+        with pytest.raises(HostUnavailable):
+            await _get(ResilientTransport(inner), host)
+
+        async def hang(request):
+            await asyncio.sleep(3600)
+            return httpx.Response(200)
+
+        monkeypatch.setattr(resilient_http, "BREAKER_COOLDOWN_SECONDS", 0)
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(
+                _get(ResilientTransport(httpx.MockTransport(hang)), host), timeout=0.05
+            )
+
+        inner, calls = _upstream(httpx.Response(200))
+        assert (await _get(ResilientTransport(inner), host)).status_code == 200
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_requests_do_not_open_the_breaker(self, host):
+        async def hang(request):
+            await asyncio.sleep(3600)
+            return httpx.Response(200)
+
+        transport = ResilientTransport(
+            httpx.MockTransport(hang), max_concurrency=resilient_http.BREAKER_FAILURE_THRESHOLD
+        )
+        results = await asyncio.gather(*(
+            asyncio.wait_for(_get(transport, host), timeout=0.05)
+            for _ in range(resilient_http.BREAKER_FAILURE_THRESHOLD)
+        ), return_exceptions=True)
+        assert all(isinstance(r, TimeoutError) for r in results)
+        assert _value("sports_passport_upstream_circuit_open", host=host) == 0
+        assert resilient_http._breakers[host].failures == 0
+
+        inner, calls = _upstream(httpx.Response(200))
+        assert (await _get(ResilientTransport(inner), host)).status_code == 200
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_4xx_and_429_do_not_count_as_failures(self, host, monkeypatch):
+        monkeypatch.setattr(resilient_http, "BREAKER_FAILURE_THRESHOLD", 2)
+        inner, _ = _upstream(httpx.Response(429), httpx.Response(404))
+        transport = ResilientTransport(inner)
+        for _ in range(3):
+            await _get(transport, host)
+        assert _value("sports_passport_upstream_circuit_open", host=host) == 0
+
+
+class TestConcurrencyCap:
+    @pytest.mark.asyncio
+    async def test_in_flight_requests_are_capped_per_host(self, host):
+        in_flight = peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200)
+
+        transport = ResilientTransport(httpx.MockTransport(handler), max_concurrency=2)
+        async with httpx.AsyncClient(transport=transport) as client:
+            await asyncio.gather(*(client.get(f"https://{host}/{n}") for n in range(6)))
+        assert peak == 2
@@ -0,0 +1,83 @@
+"""
+Tests for the catalog response cache: ETag/304 revalidation and invalidation
+by data generation.
+"""
+from sqlalchemy import event
+
+from sports_passport.core import response_cache
+from sports_passport.models.attendance import UserGameAttendance
+from tests.conftest import engine
+
+
+class TestResponseCache:
+    """Catalog reads are served from cache until a catalog write commits."""
+
+    def test_etag_revalidates_to_304(self, client, sample_teams, auth_headers):
+        first = client.get("/api/teams/", headers=auth_headers)
+        assert first.status_code == 200
+        assert first.headers["Cache-Control"] == response_cache.CACHE_CONTROL
+        etag = first.headers["ETag"]
+
+        again = client.get("/api/teams/", headers={**auth_headers, "If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.content == b""
+        assert again.headers["ETag"] == etag
+
+    def test_hit_runs_no_endpoint_queries(self, client, sample_teams, auth_headers):
+        client.get("/api/teams/", headers=auth_headers)
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = client.get("/api/teams/", headers=auth_headers)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert response.status_code == 200
+        assert len(response.json()) == 3
+        assert not [s for s in statements if "FROM teams" in s]
+
+    def test_catalog_commit_invalidates(self, client, db_session, sample_teams, auth_headers):
+        first = client.get("/api/teams/", headers=auth_headers)
+
+        sample_teams[0].name = "Renamed"
+        db_session.commit()
+
+        second = client.get("/api/teams/", headers={**auth_headers,
+                                                    "If-None-Match": first.headers["ETag"]})
+        assert second.status_code == 200
+        assert "Renamed" in [t["name"] for t in second.json()]
+        assert second.headers["ETag"] != first.headers["ETag"]
+
+    def test_attendance_commit_does_not_invalidate(
+        self, client, db_session, test_user, sample_games, auth_headers
+    ):
+        client.get("/api/games/count", headers=auth_headers)
+        generation = response_cache.data_generation()
+
+        db_session.add(UserGameAttendance(user_id=test_user.id, game_id=sample_games[0].id))
+        db_session.commit()
+
+        assert response_cache.data_generation() == generation
+
+    def test_query_params_are_part_of_the_key(self, client, sample_teams, auth_headers):
+        everything = client.get("/api/teams/", headers=auth_headers).json()
+        michigan = client.get("/api/teams/?search=Michigan", headers=auth_headers).json()
+        assert len(everything) == 3
+        assert [t["name"] for t in michigan] == ["Michigan"]
+
+    def test_not_found_is_not_cached(self, client, sample_games, auth_headers):
+        missing = client.get("/api/games/999999", headers=auth_headers)
+        assert missing.status_code == 404
+        assert "ETag" not in missing.headers
+
+    def test_cached_game_keeps_utc_offset(self, client, sample_games, auth_headers):
+        """The cache serializes through the response model, field serializers included."""
+        url = f"/api/games/{sample_games[0].id}"
+        client.get(url, headers=auth_headers)
+        cached = client.get(url, headers=auth_headers).json()
+        assert cached["start_date"].endswith("+00:00")
+        assert cached["home_team"]["name"]
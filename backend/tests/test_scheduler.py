@@ -8,6 +8,7 @@ per-league state recording, enable/disable — with a mocked adapter.
 from datetime import date, datetime, timedelta
 from unittest.mock import AsyncMock, Mock, patch
 
+from sports_passport.models.sync_run import SyncRun
 from sports_passport.models.sync_state import SyncState
 from sports_passport.services import scheduler
 from sports_passport.services.adapters.base import ImportResult
@@ -123,6 +124,24 @@ class TestRunSyncForLeague:
         assert state.last_status == "error"
         assert state.last_run_at is not None
 
+    @patch('sports_passport.services.scheduler.get_adapter')
+    def test_every_run_is_kept_in_history(self, mock_get_adapter, db_session):
+        import asyncio
+        mock_get_adapter.return_value = _mock_adapter()
+        asyncio.run(run_sync_for_league(db_session, "CFB"))
+        mock_get_adapter.return_value = _mock_adapter(errors=["bad payload"])
+        asyncio.run(run_sync_for_league(db_session, "CFB"))
+
+        runs = db_session.query(SyncRun).order_by(SyncRun.id).all()
+        assert [(r.kind, r.status, r.error) for r in runs] == [
+            ("sync", "success", None), ("sync", "error", "bad payload"),
+        ]
+        assert (runs[0].games_imported, runs[0].games_updated) == (5, 2)
+        # The mocked adapter does no I/O: its time is all unaccounted "parse".
+        assert runs[0].requests == 0 and runs[0].fetch_ms == 0
+        assert runs[0].parse_ms <= runs[0].duration_ms
+        assert runs[0].peak_rss_mb > 0
+
     @patch('sports_passport.services.scheduler.get_adapter')
     def test_uses_explicit_since(self, mock_get_adapter, db_session):
         adapter = _mock_adapter()
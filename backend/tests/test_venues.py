@@ -0,0 +1,168 @@
+"""
+Tests for the venue atlas endpoints.
+"""
+import pytest
+
+from sports_passport.core import response_cache
+from sports_passport.models.venue import Venue
+from sports_passport.routers.venues import _snap_to_tiles
+
+CONUS = {"west": -125, "south": 24, "east": -66, "north": 50}
+
+
+@pytest.fixture
+def placed_venues(db_session, sample_venues):
+    """The sample venues at their real coordinates, plus a second NYC ground."""
+    coords = [(33.208, -87.550), (42.266, -83.749), (40.750, -73.993)]
+    for venue, (lat, lon) in zip(sample_venues, coords, strict=True):
+        venue.latitude, venue.longitude = lat, lon
+    citi = Venue(source="mlb", source_venue_id="3289", name="Citi Field",
+                 city="New York", state="NY", latitude=40.757, longitude=-73.846)
+    unplaced = Venue(source="mlb", source_venue_id="0", name="Nowhere Park")
+    db_session.add_all([citi, unplaced])
+    db_session.commit()
+    return [*sample_venues, citi]
+
+
+class TestVenueClusters:
+    """Tests for GET /api/venues/clusters."""
+
+    def test_low_zoom_merges_nearby_venues(self, client, placed_venues, auth_headers):
+        response = client.get("/api/venues/clusters", params={**CONUS, "zoom": 4},
+                              headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["venue_count"] == 4            # the unplaced venue is not on the map
+        nyc = data["clusters"][0]
+        assert nyc["venue_count"] == 2
+        assert nyc["venue_id"] is None and nyc["name"] is None
+        assert 40.75 < nyc["latitude"] < 40.76
+
+    def test_high_zoom_separates_them(self, client, placed_venues, auth_headers):
+        response = client.get(
+            "/api/venues/clusters",
+            params={"west": -74.1, "south": 40.7, "east": -73.8, "north": 40.8, "zoom": 14},
+            headers=auth_headers,
+        )
+        clusters = response.json()["clusters"]
+        assert sorted(c["name"] for c in clusters) == ["Citi Field", "Madison Square Garden"]
+        assert all(c["venue_count"] == 1 for c in clusters)
+
+    def test_bbox_excludes_offscreen_venues(self, client, placed_venues, auth_headers):
+        response = client.get(
+            "/api/venues/clusters",
+            params={"west": -90, "south": 30, "east": -85, "north": 35, "zoom": 8},
+            headers=auth_headers,
+        )
+        assert [c["name"] for c in response.json()["clusters"]] == ["Bryant-Denny Stadium"]
+
+    def test_league_filter_uses_venues_that_hosted_its_games(
+        self, client, placed_venues, sample_games, auth_headers
+    ):
+        response = client.get("/api/venues/clusters", params={**CONUS, "zoom": 12, "league": "cfb"},
+                              headers=auth_headers)
+        names = sorted(c["name"] for c in response.json()["clusters"])
+        assert names == ["Bryant-Denny Stadium", "Michigan Stadium"]
+
+    def test_antimeridian_box(self, client, db_session, auth_headers):
+        db_session.add_all([
+            Venue(source="x", source_venue_id="fiji", name="Suva", latitude=-18.1, longitude=178.4),
+            Venue(source="x", source_venue_id="samoa", name="Apia", latitude=-13.8, longitude=-171.8),
+        ])
+        db_session.commit()
+        response = client.get(
+            "/api/venues/clusters",
+            params={"west": 170, "south": -30, "east": -160, "north": 0, "zoom": 6},
+            headers=auth_headers,
+        )
+        assert response.json()["venue_count"] == 2
+
+    def test_pans_within_the_same_tiles_share_a_cache_entry(
+        self, client, placed_venues, auth_headers
+    ):
+        def cluster_keys():
+            return {k for k in response_cache._entries if k.startswith("/api/venues/clusters")}
+
+        before = cluster_keys()
+        first = client.get(
+            "/api/venues/clusters",
+            params={"west": -74.1, "south": 40.7, "east": -73.8, "north": 40.8, "zoom": 13},
+            headers=auth_headers,
+        )
+        panned = client.get(
+            "/api/venues/clusters",
+            params={"west": -74.11, "south": 40.71, "east": -73.81, "north": 40.79, "zoom": 13},
+            headers=auth_headers,
+        )
+        assert panned.headers["etag"] == first.headers["etag"]
+        assert len(cluster_keys() - before) == 1
+
+    def test_snapped_box_is_whole_tiles_and_stays_on_the_globe(self):
+        tile = 360.0 / 2 ** 3
+        west, south, east, north = _snap_to_tiles(-100.3, 20.1, -80.2, 44.5, 3)
+        assert (west, south, east, north) == (-135.0, 0.0, -45.0, 45.0)
+        assert all(edge % tile == 0 for edge in (west + 180, east + 180))
+        assert _snap_to_tiles(-170, -80, 170, 80, 0) == (-180.0, -90.0, 180.0, 90.0)
+
+    @pytest.mark.parametrize(("zoom", "placed"), [(1, 3), (2, 2)])
+    def test_antimeridian_box_at_low_zoom(self, client, db_session, auth_headers, zoom, placed):
+        """Zoom 1's tiles grow the box to every longitude; zoom 2's stop short of Accra."""
+        db_session.add_all([
+            Venue(source="x", source_venue_id="fiji", name="Suva", latitude=-18.1, longitude=178.4),
+            Venue(source="x", source_venue_id="samoa", name="Apia", latitude=-13.8, longitude=-171.8),
+            Venue(source="x", source_venue_id="accra", name="Accra", latitude=5.6, longitude=-0.2),
+        ])
+        db_session.commit()
+        response = client.get(
+            "/api/venues/clusters",
+            params={"west": 100, "south": -30, "east": -100, "north": 10, "zoom": zoom},
+            headers=auth_headers,
+        )
+        assert response.json()["venue_count"] == placed
+
+    def test_rejects_inverted_latitudes(self, client, auth_headers):
+        response = client.get(
+            "/api/venues/clusters",
+            params={"west": -100, "south": 40, "east": -90, "north": 30, "zoom": 5},
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+
+    def test_requires_auth(self, client):
+        response = client.get("/api/venues/clusters", params={**CONUS, "zoom": 4})
+        assert response.status_code == 401
+
+
+class TestVenuesNear:
+    """Tests for GET /api/venues/near."""
+
+    def test_nearest_first_with_distances(self, client, placed_venues, auth_headers):
+        response = client.get("/api/venues/near", params={"lat": 40.7128, "lon": -74.006},
+                              headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert [v["name"] for v in data] == ["Madison Square Garden", "Citi Field"]
+        assert data[0]["distance_km"] < data[1]["distance_km"] < 100
+
+    def test_radius_drops_the_box_corners(self, client, db_session, auth_headers):
+        """A venue inside the bounding box but outside the circle is excluded."""
+        # ~78 km east and ~78 km north: inside the 100 km box, ~110 km away.
+        db_session.add(Venue(source="x", source_venue_id="c", name="Corner",
+                             latitude=0.7, longitude=0.7))
+        db_session.commit()
+        response = client.get("/api/venues/near", params={"lat": 0, "lon": 0, "radius_km": 100},
+                              headers=auth_headers)
+        assert response.json() == []
+
+    def test_league_filter_and_limit(self, client, placed_venues, sample_games, auth_headers):
+        params = {"lat": 38.0, "lon": -85.0, "radius_km": 2000}
+        everywhere = client.get("/api/venues/near", params=params, headers=auth_headers).json()
+        assert len(everywhere) == 4
+        cfb = client.get("/api/venues/near", params={**params, "league": "cfb", "limit": 1},
+                         headers=auth_headers).json()
+        assert [v["name"] for v in cfb] == ["Michigan Stadium"]
+
+    def test_rejects_out_of_range_radius(self, client, auth_headers):
+        response = client.get("/api/venues/near", params={"lat": 0, "lon": 0, "radius_km": 0},
+                              headers=auth_headers)
+        assert response.status_code == 422
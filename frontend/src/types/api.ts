@@ -242,8 +242,10 @@ export interface AdminStatusRow {
   adapter_available: boolean;
   teams: number;
   games: number;
+  venues: number;
   first_season: number | null;
   last_season: number | null;
+  last_game_at: string | null;
   // Nightly-sync status
   sync_enabled: boolean;
   last_sync_at: string | null;